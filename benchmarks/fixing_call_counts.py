@@ -0,0 +1,76 @@
+"""
+Formula evaluations for one full fixing summary, with and without the check memo
+of calcs/package/fixing_base.py, plus the time per summary.
+
+    python benchmarks/fixing_call_counts.py
+"""
+import collections
+import functools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calcs.fixing import UClumpCalculator
+from calcs.package import fixing_base
+from calcs.package.fixing_base import AnchorCalculator, BasePlateCalculator, FinPlateCalculator
+
+CLASSES = (AnchorCalculator, BasePlateCalculator, FinPlateCalculator)
+RUNS = 2000
+
+
+def instrument(counts, memo):
+    # swap every memoized check for a counting copy of its formula, memoized or not
+    originals = {}
+    for cls in CLASSES:
+        for name, method in list(vars(cls).items()):
+            if not hasattr(method, "__wrapped__"):
+                continue
+            formula = method.__wrapped__
+
+            @functools.wraps(formula)
+            def counted(self, *args, formula=formula, key=f"{cls.__name__}.{name}"):
+                counts[key] += 1
+                return formula(self, *args)
+
+            originals[(cls, name)] = method
+            setattr(cls, name, fixing_base.memoized(counted) if memo else counted)
+    return originals
+
+
+def restore(originals):
+    for (cls, name), method in originals.items():
+        setattr(cls, name, method)
+
+
+def full_summary():
+    # the U-clump summary covers every anchor, base plate and fin plate check
+    UClumpCalculator().compute_u_clump().summary()
+
+
+def measure(memo):
+    counts = collections.Counter()
+    originals = instrument(counts, memo)
+    try:
+        full_summary()
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            full_summary()
+        elapsed = (time.perf_counter() - start) / RUNS
+    finally:
+        restore(originals)
+    return {key: count // (RUNS + 1) for key, count in counts.items()}, elapsed
+
+
+if __name__ == "__main__":
+    plain, plain_time = measure(memo=False)
+    cached, cached_time = measure(memo=True)
+
+    print(f"{'check':<52}{'no memo':>10}{'memo':>8}")
+    for key in sorted(plain):
+        print(f"{key:<52}{plain[key]:>10}{cached.get(key, 0):>8}")
+    print(f"{'total formula evaluations':<52}{sum(plain.values()):>10}{sum(cached.values()):>8}")
+    print(f"time per U-clump summary: {plain_time * 1e6:.0f} us -> {cached_time * 1e6:.0f} us")
+
+    assert all(count == 1 for count in cached.values()), "a check was evaluated more than once"
@@ -0,0 +1,71 @@
+"""
+Anchor ratios of FixingScheduleRunner.run_anchors() against the full run() for a
+random bracket schedule, plus the time of both paths.
+
+    python benchmarks/fixing_schedule_fast_path.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calcs.fixing_schedule import ANCHOR_CHECKS, FixingScheduleRunner
+
+BRACKETS = 2000
+
+
+def sample_brackets(n=BRACKETS, seed=0):
+    # loads to 0.1 kN like a real schedule; negative wind load = uplift. Dead load stays
+    # positive: below zero the base / fin plate checks fail, which run_anchors() leaves out
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "id": f"B{i}",
+            "fixing_type": str(rng.choice(["box", "u"])),
+            "wind_load": round(float(rng.uniform(-5, 40)), 1),
+            "dead_load": round(float(rng.uniform(0, 15)), 1),
+            "wind_ecc": int(rng.choice([0, 20])),
+            "dead_ecc": int(rng.choice([0, 30])),
+            "n_anchor": int(rng.choice([2, 3, 4])),
+            "anchor_dia": int(rng.choice([10, 12, 16])),
+            "embed_depth": int(rng.choice([50, 60, 70, 90])),
+            "C_a1": int(rng.choice([60, 80, 100, 150])),
+            "conc_grade": str(rng.choice(["M25", "M30"])),
+            "conc_condition": str(rng.choice(["cracked", "uncracked"])),
+            "install_type": str(rng.choice(["post-installed", "cast-in"])),
+        }
+        for i in range(n)
+    ]
+
+
+def compare(full, fast):
+    # brackets whose anchor columns or error status differ between the two paths
+    different = []
+    for a, b in zip(full, fast):
+        if (a["status"] == "ERROR") != (b["status"] == "ERROR"):
+            different.append((a["id"], "status", a["status"], b["status"]))
+        elif a["status"] != "ERROR":
+            different += [(a["id"], check, a[check], b[check]) for check in ANCHOR_CHECKS if a[check] != b[check]]
+    return different
+
+
+if __name__ == "__main__":
+    brackets = sample_brackets()
+    runner = FixingScheduleRunner(max_workers=1)
+
+    start = time.perf_counter()
+    full = runner.run(brackets)
+    full_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fast = runner.run_anchors(brackets)
+    fast_time = time.perf_counter() - start
+
+    errors = sum(r["status"] == "ERROR" for r in full)
+    print(f"{len(brackets)} brackets, {errors} ERROR (negative anchor load)")
+    print(f"run(): {full_time * 1000:.0f} ms, run_anchors(): {fast_time * 1000:.0f} ms")
+
+    different = compare(full, fast)
+    assert not different, f"run() and run_anchors() differ: {different[:5]}"
@@ -0,0 +1,221 @@
+import csv
+import functools
+import numpy as np
+from .package import material_properties as mp
+
+
+# grid inputs, in axis order, with the box clump defaults
+DEFAULTS = {
+    "anchor_dia": 12, "embed_depth": 70, "C_a1": 100, "C_a2": 200, "C_b1": 100, "C_b2": 200,
+    "conc_grade": "M25", "conc_condition": "cracked", "conc_weight_type": "normal",
+    "install_type": "post-installed", "anchor_grade": "Grade 5.8", "conc_depth": 300, "conc_Np5": 20,
+    "n_anchor": 4, "bp_length": 250, "bp_width": 120, "ed1": 50, "ed2": 50,
+    "tension_ecc": 0, "shear_ecc": 0, "N_ua": None, "N_ug": None, "V_ua": None, "V_ug": None,
+}
+TENSION_CHECKS = [("phi_N_sa", "N_ua"), ("phi_N_cbg", "N_ug"), ("phi_N_pn", "N_ua"), ("phi_N_sbg", "N_ug")]
+SHEAR_CHECKS = [("phi_V_sa", "V_ua"), ("phi_V_cbg", "V_ug"), ("phi_V_cp", "V_ug")]
+
+
+class AnchorChartCalculator:
+    """
+    AnchorCalculator checks over a full Cartesian grid of inputs, by NumPy broadcasting.
+
+    Every keyword of DEFAULTS may be a scalar or a list; each list becomes one grid axis
+    (in DEFAULTS order). A_NC / A_VC follow the box clump failure areas. Capacities are
+    always computed; ratios and the interaction check need the anchor loads N_ua, N_ug,
+    V_ua, V_ug (kN). Results are unrounded and broadcast against the grid shape.
+
+    With aligned=True the lists are instead equal-length columns, one anchor group per
+    row (a schedule rather than a grid); results then have shape (rows,).
+
+    Example:
+        chart = AnchorChartCalculator(anchor_dia=[10, 12, 16], embed_depth=range(50, 151, 5),
+                                      conc_grade=["M25", "M30"], conc_condition=["cracked", "uncracked"])
+        chart.compute()["phi_N_cbg"].shape      # (3, 21, 2, 2)
+    """
+
+    def __init__(self, aligned=False, **params):
+        unknown = set(params) - set(DEFAULTS)
+        if unknown:
+            raise ValueError(f"Unknown anchor chart input(s): {', '.join(sorted(unknown))}")
+
+        self.axes = {}
+        values = dict(DEFAULTS, **params)
+        grid = [name for name in DEFAULTS if np.ndim(values[name]) > 0 and not isinstance(values[name], str)]
+        if aligned:
+            self.inputs = {name: np.asarray(list(values[name])) if name in grid else values[name] for name in values}
+            self.shape = np.broadcast_shapes(*(np.shape(self.inputs[name]) for name in grid))
+            self._results = None
+            return
+        for name in grid:
+            self.axes[name] = np.asarray(list(values[name]))
+        self.shape = tuple(len(axis) for axis in self.axes.values())
+
+        # each input as an array that broadcasts along its own axis only
+        self.inputs = {}
+        for name, value in values.items():
+            if name in self.axes:
+                shape = [1] * len(grid)
+                shape[grid.index(name)] = -1
+                self.inputs[name] = self.axes[name].reshape(shape)
+            else:
+                self.inputs[name] = value
+
+        self._results = None
+
+    def material(self, name, func):
+        # material lookup by grade/diameter, once per distinct value rather than per grid point
+        value = self.inputs[name]
+        if np.ndim(value) == 0:
+            return np.asarray(func(value.item() if isinstance(value, np.generic) else value), dtype=float)
+        distinct, inverse = np.unique(value, return_inverse=True)
+        looked_up = np.array([func(v.item()) for v in distinct], dtype=float)
+        return looked_up[inverse.reshape(value.shape)]
+
+    def compute(self):
+        if self._results is not None:
+            return self._results
+        p = self.inputs
+        d = np.asarray(p["anchor_dia"], dtype=float)
+        h_ef = np.asarray(p["embed_depth"], dtype=float)
+        C_a1, C_a2 = np.asarray(p["C_a1"], dtype=float), np.asarray(p["C_a2"], dtype=float)
+        C_b1, C_b2 = np.asarray(p["C_b1"], dtype=float), np.asarray(p["C_b2"], dtype=float)
+        cast_in = np.asarray(p["install_type"]) == "cast-in"
+        cracked = np.asarray(p["conc_condition"]) == "cracked"
+        lamda = np.where(np.asarray(p["conc_weight_type"]) == "normal", 1.0, 0.75)
+
+        f_c = self.material("conc_grade", mp.concrete_strength)
+        A_seN = self.material("anchor_dia", mp.eff_tensile_area)
+        bolt = self.material("anchor_grade", mp.bolt_strength)
+        f_uta = np.minimum(np.minimum(860, 1.9 * bolt[..., 0]), bolt[..., 1])
+        A_brg = (np.pi / 4) * (1.7 * d)**2
+        C_amin = np.minimum(np.minimum(C_a1, C_a2), np.minimum(C_b1, C_b2))
+        s1 = np.asarray(p["bp_length"], dtype=float) - 2 * np.asarray(p["ed1"], dtype=float)
+        s2 = np.asarray(p["bp_width"], dtype=float) - 2 * np.asarray(p["ed2"], dtype=float)
+
+        # failure areas as in BoxClumpCalculator
+        hxa = np.minimum(1.5 * h_ef, C_a1)
+        hxb = np.minimum(1.5 * h_ef, C_b1)
+        A_NC = (3 * h_ef + s1) * np.where(np.asarray(p["n_anchor"]) == 2, hxa + hxb, hxa + s2 + hxb)
+        A_VC = (3 * C_a1 + s1) * np.minimum(1.5 * C_a1, np.asarray(p["conc_depth"], dtype=float))
+
+        r = {"A_NC": A_NC, "A_VC": A_VC}
+        # steel strength in tension / shear
+        r["phi_N_sa"] = 0.75 * A_seN * f_uta / 1000
+        r["phi_V_sa"] = 0.65 * 0.6 * A_seN * f_uta / 1000
+
+        # concrete breakout in tension
+        phi = np.where(cast_in, 0.7, 0.65)
+        k_c = np.where(cast_in, 10, 7)
+        psi_ecN = 1 / (1 + (2 * np.asarray(p["tension_ecc"], dtype=float)) / (3 * h_ef))
+        psi_edN = np.minimum(0.7 + (0.3 * C_amin) / (1.5 * h_ef), 1)
+        psi_cN = np.where(cracked, 1.0, np.where(cast_in, 1.25, 1.4))
+        N_b = k_c * lamda * np.sqrt(f_c) * h_ef**1.5
+        r["phi_N_cbg"] = phi * (A_NC / (9 * h_ef**2)) * psi_ecN * psi_edN * psi_cN * N_b / 1000
+
+        # pullout
+        psi_cp = np.where(cracked, 1.0, 1.4)
+        N_p = np.where(cast_in, 8 * A_brg * f_c, np.asarray(p["conc_Np5"], dtype=float) * 1000)
+        r["phi_N_pn"] = 0.7 * psi_cp * N_p / 1000
+
+        # side-face blowout
+        N_sb = 13 * C_a1 * np.sqrt(A_brg) * lamda * np.sqrt(f_c)
+        r["phi_N_sbg"] = 0.7 * (1 + s1 / (6 * C_a1)) * N_sb / 1000
+
+        # concrete breakout in shear
+        psi_ecV = 1 / (1 + (2 * np.asarray(p["shear_ecc"], dtype=float)) / (3 * C_a1))
+        psi_edV = np.minimum(0.7 + (0.3 * C_a2) / (1.5 * C_a1), 1)
+        psi_cV = np.where(cracked, 1.0, 1.4)
+        psi_hV = np.maximum(np.sqrt((1.5 * C_a1) / np.asarray(p["conc_depth"], dtype=float)), 1)
+        l_e = np.minimum(h_ef, 8 * d)
+        V_b = 0.6 * (l_e / d)**0.2 * lamda * np.sqrt(d * f_c) * C_a1**1.5
+        r["phi_V_cbg"] = 0.7 * (A_VC / (4.5 * C_a1**2)) * psi_ecV * psi_edV * psi_cV * psi_hV * V_b / 1000
+
+        # pryout
+        k_cp = np.where(h_ef < 65, 1.0, 2.0)
+        r["phi_V_cp"] = 0.7 * k_cp * r["phi_V_cbg"] / np.where(cast_in, 0.7, 0.65)
+
+        # ratios and interaction, when the loads are given
+        if all(p[load] is not None for load in ("N_ua", "N_ug", "V_ua", "V_ug")):
+            for capacity, load in TENSION_CHECKS + SHEAR_CHECKS:
+                r[capacity.replace("phi_", "ratio_")] = np.asarray(p[load], dtype=float) / r[capacity]
+            beta_N = functools.reduce(np.maximum, [r[c.replace("phi_", "ratio_")] for c, _ in TENSION_CHECKS])
+            beta_V = functools.reduce(np.maximum, [r[c.replace("phi_", "ratio_")] for c, _ in SHEAR_CHECKS])
+            r["beta_N"], r["beta_V"] = beta_N, beta_V
+            r["beta"] = beta_N**1.67 + beta_V**1.67
+            r["beta_u"] = np.where((beta_N < 0.2) | (beta_V < 0.2), 1.0, 1.2)
+            r["passed"] = (r["beta"] <= r["beta_u"]) & (beta_N <= 1) & (beta_V <= 1)
+
+        self._results = {name: np.broadcast_to(value, self.shape) for name, value in r.items()}
+        return self._results
+
+    def write_csv(self, path, columns=None, chunk_size=100000):
+        """
+        Capacity table with one row per grid point, written in chunks so memory stays flat.
+        columns defaults to every result; grid axes are always written first.
+        """
+        results = self.compute()
+        columns = columns or list(results)
+        size = int(np.prod(self.shape))
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(list(self.axes) + columns)
+            for start in range(0, size, chunk_size):
+                index = np.unravel_index(np.arange(start, min(start + chunk_size, size)), self.shape)
+                rows = [axis[i].tolist() for axis, i in zip(self.axes.values(), index)]
+                rows += [
+                    (np.round(results[name][index], 3) if results[name].dtype.kind == "f" else results[name][index]).tolist()
+                    for name in columns
+                ]
+                writer.writerows(zip(*rows))
+
+    def design_chart(self, capacity, x, series=None, fixed=None, path=None):
+        """
+        Plot capacity against grid axis x, one line per value of axis series.
+        fixed maps the remaining axes to the value to plot (defaults to their first value).
+        """
+        from matplotlib.figure import Figure     # no pyplot: leaves the GUI's backend alone
+
+        fixed = fixed or {}
+        index = []
+        for name, axis in self.axes.items():
+            if name in (x, series):
+                index.append(slice(None))
+            else:
+                value = fixed.get(name, axis[0])
+                matches = np.flatnonzero(axis == value)
+                if matches.size == 0:
+                    raise ValueError(f"{value} is not on the {name} axis")
+                index.append(matches[0])
+        values = self.compute()[capacity][tuple(index)]
+        kept = [name for name in self.axes if name in (x, series)]
+        if kept[0] != x:
+            values = values.T
+
+        fig = Figure(figsize=(7, 4.5))
+        ax = fig.subplots()
+        if series is None:
+            ax.plot(self.axes[x], values)
+        else:
+            for j, label in enumerate(self.axes[series]):
+                ax.plot(self.axes[x], values[:, j], label=f"{series} = {label}")
+            ax.legend(fontsize=8)
+        ax.set_xlabel(x)
+        ax.set_ylabel(f"{capacity} (kN)")
+        ax.grid(True, linewidth=0.3)
+        if path:
+            fig.savefig(path, dpi=150, bbox_inches="tight")
+        return fig
+
+
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    chart = AnchorChartCalculator(
+        anchor_dia=[10, 12, 16, 20, 24], embed_depth=range(50, 301, 5), C_a1=range(50, 401, 10),
+        C_a2=range(50, 401, 10), conc_grade=["M20", "M25", "M30", "M35", "M40"],
+        conc_condition=["cracked", "uncracked"], N_ua=2, N_ug=8, V_ua=7.5, V_ug=15,
+    )
+    results = chart.compute()
+    passed = int(results["passed"].sum())
+    print(f"{np.prod(chart.shape):,} combinations in {time.perf_counter() - start:.2f} s, {passed:,} pass")
@@ -14,6 +14,9 @@ class ConnCalculator():
         t2_grade : str - Material grade of the non-contact member
     """
     
+    INPUTS = ("screw_config", "t1", "t2", "t1_grade", "t2_grade",
+              "dia", "screw_length", "head_dia", "wind_load", "dead_load")
+
     def __init__(self, screw_config, t1, t2, t1_grade, t2_grade, 
                     dia, screw_length, head_dia, wind_load, dead_load):
         self.screw_config = screw_config
@@ -34,8 +37,31 @@ class ConnCalculator():
         
         self.F_y1, self.F_u1 = self.member_strength(t1_grade)
         self.F_y2, self.F_u2 = self.member_strength(t2_grade)
-    
+
+        # raw (unrounded) check results, evaluated on first use
+        self._results = {}
+        self._results_inputs = None
+
+    def evaluate(self, check):
+        """
+        Raw result of one check ("design_load", "shear_tilting", "pullout_tension",
+        "pullover_tension", "comb_shear_pullover" or "comb_shear_pullout").
+        Each check runs once per input set; its dependencies are evaluated through here too.
+        """
+        inputs = tuple(getattr(self, name) for name in self.INPUTS)
+        if inputs != self._results_inputs:
+            self._results = {}
+            self._results_inputs = inputs
+            self.factored_fy = self.wind_load * 1.6
+            self.factored_fz = self.dead_load * 1.2
+            self.F_y1, self.F_u1 = self.member_strength(self.t1_grade)
+            self.F_y2, self.F_u2 = self.member_strength(self.t2_grade)
+        if check not in self._results:
+            self._results[check] = getattr(self, "_" + check)()
+        return self._results[check]
+
     def compute_params(self):
+        loads = self.evaluate("design_load")
         return {
             "t1": self.t1,
             "t2": self.t2,
@@ -53,13 +79,13 @@ class ConnCalculator():
             "factored_fy": round(self.factored_fy, 2),
             "factored_fz": round(self.factored_fz, 2),
             
-            "n": self.design_load()["n"],
-            "R_ya": round(self.design_load()["R_ya"], 2),
-            "R_za": round(self.design_load()["R_za"], 2),
-            "R_yb": round(self.design_load()["R_yb"], 2),
-            "R_zb": round(self.design_load()["R_zb"], 2),
-            "Vu": round(self.design_load()["Vu"], 2),
-            "Tu": round(self.design_load()["Tu"], 2),
+            "n": loads["n"],
+            "R_ya": round(loads["R_ya"], 2),
+            "R_za": round(loads["R_za"], 2),
+            "R_yb": round(loads["R_yb"], 2),
+            "R_zb": round(loads["R_zb"], 2),
+            "Vu": round(loads["Vu"], 2),
+            "Tu": round(loads["Tu"], 2),
         }
     
     def member_strength(self, member_grade):
@@ -79,96 +105,100 @@ class ConnCalculator():
         return options[self.screw_config]
 
     def design_load(self):
-        n = self.no_of_screw()                      # no. of screw per side
-        self.R_ya = self.factored_fy / n            # shear     # for screw A1, A2.. in transom
-        self.R_za = self.factored_fz / n            # tension
-        self.R_yb = self.factored_fy / n            # shear     # for screw B1, B2.. in mullion
-        self.R_zb = self.factored_fz / n            # shear
-        Vu = (self.R_yb**2 + self.R_zb**2)**0.5
-        Tu = self.R_za
+        return self.evaluate("design_load")
+
+    def _design_load(self):
+        n = self.no_of_screw()                  # no. of screw per side
+        R_ya = self.factored_fy / n             # shear     # for screw A1, A2.. in transom
+        R_za = self.factored_fz / n             # tension
+        R_yb = self.factored_fy / n             # shear     # for screw B1, B2.. in mullion
+        R_zb = self.factored_fz / n             # shear
+        Vu = (R_yb**2 + R_zb**2)**0.5
+        Tu = R_za
         
         return {
             "n": n,
-            "R_ya": self.R_ya,
-            "R_za": self.R_za,
-            "R_yb": self.R_yb,
-            "R_zb": self.R_zb,
+            "R_ya": R_ya,
+            "R_za": R_za,
+            "R_yb": R_yb,
+            "R_zb": R_zb,
             "Vu": Vu,
             "Tu": Tu
         }
     
-    def compute_shear_tilting_bearing(self):
+    def _shear_tilting(self):
         phi = 0.5
-        self.Vu = self.design_load()["Vu"]
-        self.Tu = self.design_load()["Tu"]
+        Vu = self.evaluate("design_load")["Vu"]
         if self.t2 / self.t1 <= 1:
             P_nv1 = 4.2 * (self.t2**3 * self.dia)**0.5 * self.F_u2
             P_nv2 = 2.7 * self.t1 * self.dia * self.F_u1
             P_nv3 = 2.7 * self.t2 * self.dia * self.F_u2
             phi_P_nv = phi * min(P_nv1, P_nv2, P_nv3) / 1000    # 1000 to convert to kN
-            ratio = self.Vu / phi_P_nv
+            ratio = Vu / phi_P_nv
         else:
             phi_P_nv = None     # calculate later
             ratio = None
         
-        return {
-            "phi": phi,
-            "phi_P_nv": round(phi_P_nv, 2),
-            "ratio": round(ratio, 2)
-        }
+        return {"phi": phi, "phi_P_nv": phi_P_nv, "ratio": ratio}
     
-    def compute_pullout_tension(self):
+    def _pullout_tension(self):
         phi = 0.5
         d_pen = min(self.screw_length, self.t2)
         tc = min(d_pen, self.t2)
         phi_P_not = phi * 0.85 * tc * self.dia * self.F_u2 / 1000
-        ratio = self.Tu / phi_P_not
+        ratio = self.evaluate("design_load")["Tu"] / phi_P_not
 
-        return {
-            "phi": phi,
-            "tc": tc,
-            "phi_P_not": round(phi_P_not, 2),
-            "ratio": round(ratio, 2)
-        }
+        return {"phi": phi, "tc": tc, "phi_P_not": phi_P_not, "ratio": ratio}
     
-    def compute_pullover_tension(self):
+    def _pullover_tension(self):
         phi = 0.5
         d_w_prime = min(self.head_dia, 19.1)
         phi_P_nov = phi * 1.5 * self.t1 * d_w_prime * self.F_u1 / 1000
-        ratio = self.Tu / phi_P_nov
+        ratio = self.evaluate("design_load")["Tu"] / phi_P_nov
 
-        return {
-            "phi": phi,
-            "d_w_prime": d_w_prime,
-            "phi_P_nov": round(phi_P_nov, 2),
-            "ratio": round(ratio, 2)
-        }
+        return {"phi": phi, "d_w_prime": d_w_prime, "phi_P_nov": phi_P_nov, "ratio": ratio}
     
-    def compute_comb_shear_pullover(self):
+    def _comb_shear_pullover(self):
         phi = 0.65
-        P_nv = self.compute_shear_tilting_bearing()["phi_P_nv"] / phi
-        P_nov = self.compute_pullover_tension()["phi_P_nov"] / phi
-        beta = self.Vu / P_nv + 0.71 * self.Tu / P_nov
+        loads = self.evaluate("design_load")
+        phi_P_nv = self.evaluate("shear_tilting")["phi_P_nv"]
+        P_nv = phi_P_nv / phi if phi_P_nv is not None else None
+        P_nov = self.evaluate("pullover_tension")["phi_P_nov"] / phi
+        beta = loads["Vu"] / P_nv + 0.71 * loads["Tu"] / P_nov if P_nv is not None else None
         
-        return {
-            "phi": phi,
-            "P_nv": round(P_nv, 2),
-            "P_nov": round(P_nov, 2),
-            "beta": round(beta, 2)
-        }
+        return {"phi": phi, "P_nv": P_nv, "P_nov": P_nov, "beta": beta}
     
-    def compute_comb_shear_pullout(self):
+    def _comb_shear_pullout(self):
         phi = 0.6
-        P_nv = self.compute_shear_tilting_bearing()["phi_P_nv"] / phi
-        P_not = self.compute_pullout_tension()["phi_P_not"] / phi
-        beta = self.Vu / P_nv + self.Tu / P_not
+        loads = self.evaluate("design_load")
+        phi_P_nv = self.evaluate("shear_tilting")["phi_P_nv"]
+        P_nv = phi_P_nv / phi if phi_P_nv is not None else None
+        P_not = self.evaluate("pullout_tension")["phi_P_not"] / phi
+        beta = loads["Vu"] / P_nv + loads["Tu"] / P_not if P_nv is not None else None
         
+        return {"phi": phi, "P_nv": P_nv, "P_not": P_not, "beta": beta}
+
+    def presentation(self, check, digits):
+        # rounded copy of a raw result for the result page / report
         return {
-            "phi": phi,
-            "P_nv": round(P_nv, 2),
-            "P_not": round(P_not, 2),
-            "beta": round(beta, 2)
+            key: round(value, digits[key]) if key in digits and value is not None else value
+            for key, value in self.evaluate(check).items()
         }
+
+    def compute_shear_tilting_bearing(self):
+        return self.presentation("shear_tilting", {"phi_P_nv": 2, "ratio": 2})
+
+    def compute_pullout_tension(self):
+        return self.presentation("pullout_tension", {"phi_P_not": 2, "ratio": 2})
+
+    def compute_pullover_tension(self):
+        return self.presentation("pullover_tension", {"phi_P_nov": 2, "ratio": 2})
+
+    def compute_comb_shear_pullover(self):
+        return self.presentation("comb_shear_pullover", {"P_nv": 2, "P_nov": 2, "beta": 2})
+
+    def compute_comb_shear_pullout(self):
+        return self.presentation("comb_shear_pullout", {"P_nv": 2, "P_not": 2, "beta": 2})
     
     def summary(self):
         return {
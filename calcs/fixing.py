@@ -132,9 +132,6 @@ class UClumpCalculator(BoxClumpCalculator):
         self.leg_length = leg_length
         self.ed1_f = ed1_f
         self.ed2_f = ed2_f
-        
-        # Derived properties
-        self.N_ua, self.N_ug, self.V_ua, self.V_ug = self.compute_anchor_load()
 
     def compute_params(self):
         pass
@@ -0,0 +1,167 @@
+import inspect
+import math
+from .package import material_properties as mp
+from .fixing_schedule import FIXING_TYPES, bracket_ratios, fixing_calculator, read_brackets
+
+
+ANCHOR_COUNTS = (2, 4)
+ANCHOR_DIAS = (10, 12, 16, 20, 24)
+EMBED_DEPTHS = tuple(range(40, 301, 5))
+PLATE_STEP = 10         # plate length / width increment (mm)
+PLATE_RANGE = 300       # plate sizes tried above the smallest that fits (mm)
+COARSE_SAMPLES = 8      # evenly spaced checks before bisecting
+
+
+class AnchorSizeOptimizer:
+    """
+    Smallest anchor group and base plate that pass every fixing check of one bracket.
+
+    Parameters:
+        bracket : dict - Fixed BoxClumpCalculator / UClumpCalculator inputs (loads, profile,
+                         concrete, edge distances), with "fixing_type" "box" (default) or "u"
+        anchor_counts : tuple - Anchor counts to try
+        anchor_dias : tuple - Anchor diameters to try (mm)
+        embed_depths : tuple - Embedment depths to try (mm), capped at conc_depth / 1.5
+        bp_lengths, bp_widths : tuple - Plate sizes to try (mm), default: from the smallest
+                                        plate that fits the profile and edge distances
+
+    Anchor groups are tried from the least steel area up, the first that passes wins.
+    Capacities grow with plate size and embedment, so for a group the plate length, then
+    the width, then the embedment are found by a coarse sample plus bisection (the others
+    held at their current bound) instead of walking the full grid: a few dozen checks per
+    group. A passing candidate is always kept as the upper bound, so the result always
+    passes; where the checks are not monotone (beta_u, edge-capped breakout) it can sit
+    a few steps above the true minimum.
+    """
+
+    def __init__(self, bracket=None, anchor_counts=ANCHOR_COUNTS, anchor_dias=ANCHOR_DIAS,
+                embed_depths=EMBED_DEPTHS, bp_lengths=None, bp_widths=None):
+        self.bracket = dict(bracket or {})
+        fixing_type = str(self.bracket.get("fixing_type", "box")).lower()
+        if fixing_type not in FIXING_TYPES:
+            raise ValueError(f"Unknown fixing type: {fixing_type}")
+        defaults = {
+            name: p.default for name, p in inspect.signature(FIXING_TYPES[fixing_type].__init__).parameters.items()
+            if p.default is not inspect.Parameter.empty
+        }
+        self.inputs = dict(defaults, **self.bracket)
+
+        # the U clump base plate carries the fin plates in place of the profile
+        profile = ("fin_width", "fin_distance") if fixing_type == "u" else ("profile_depth", "profile_width")
+        self.profile_depth, self.profile_width = (self.inputs[name] for name in profile)
+
+        self.anchor_counts = anchor_counts
+        self.anchor_dias = anchor_dias
+        self.embed_depths = tuple(h for h in sorted(embed_depths) if h <= self.inputs["conc_depth"] / 1.5)
+        if not self.embed_depths:
+            raise ValueError("No embedment depth fits the concrete depth")
+        self.bp_lengths = tuple(sorted(bp_lengths)) if bp_lengths else None
+        self.bp_widths = tuple(sorted(bp_widths)) if bp_widths else None
+        self.evaluations = 0        # full fixing checks run
+
+    def plate_sizes(self, n_anchor):
+        # anchors sit ed1 / ed2 from the plate edge, clear of the profile
+        ed1, ed2 = self.inputs["ed1"], self.inputs["ed2"]
+        length = self.profile_depth + 2 * ed1
+        width = max(self.profile_width, 2 * ed2 + (PLATE_STEP if n_anchor == 4 else 0))
+        lengths = self.bp_lengths or plate_range(length)
+        widths = self.bp_widths or plate_range(width)
+        return (
+            tuple(L for L in lengths if L > 2 * ed1 and L >= self.profile_depth),
+            tuple(B for B in widths if B >= 2 * ed2 + (1 if n_anchor == 4 else 0) and B >= self.profile_width),
+        )
+
+    def check(self, **params):
+        self.evaluations += 1
+        return bracket_ratios(dict(self.bracket, **params))
+
+    def passes(self, **params):
+        return self.check(**params)["status"] == "OK"
+
+    def bisect(self, values, passes):
+        # smallest value that passes; the last one is known to pass. An ascending coarse
+        # sample brackets the answer first, so a pass/fail flip further up the range
+        # (beta_u dropping to 1.0, edge-capped breakout) does not push it to the top
+        step = max(1, len(values) // COARSE_SAMPLES)
+        lo, hi = -1, len(values) - 1
+        for i in range(step - 1, len(values) - 1, step):
+            if passes(values[i]):
+                hi = i
+                break
+            lo = i
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if passes(values[mid]):
+                hi = mid
+            else:
+                lo = mid
+        return values[hi]
+
+    def groups(self):
+        # anchor groups from the least total steel area up
+        return sorted(
+            ((n, d) for n in self.anchor_counts for d in self.anchor_dias),
+            key=lambda group: (group[0] * mp.eff_tensile_area(group[1]), group[0])
+        )
+
+    def size_group(self, n_anchor, anchor_dia):
+        lengths, widths = self.plate_sizes(n_anchor)
+        if not lengths or not widths:
+            return None
+        p = {"n_anchor": n_anchor, "anchor_dia": anchor_dia,
+             "bp_length": lengths[-1], "bp_width": widths[-1], "embed_depth": self.embed_depths[-1]}
+        if not self.passes(**p):
+            return None
+        p["bp_length"] = self.bisect(lengths, lambda L: self.passes(**dict(p, bp_length=L)))
+        p["bp_width"] = self.bisect(widths, lambda B: self.passes(**dict(p, bp_width=B)))
+        p["embed_depth"] = self.bisect(self.embed_depths, lambda h: self.passes(**dict(p, embed_depth=h)))
+        return p
+
+    def optimize(self):
+        for n_anchor, anchor_dia in self.groups():
+            p = self.size_group(n_anchor, anchor_dia)
+            if p is None:
+                continue
+            result = self.check(**p)
+            calculator = fixing_calculator(dict(self.bracket, **p))
+            return {
+                "id": self.bracket.get("id"),
+                **p,
+                "bp_thk": calculator.bp.bp_thk_pro()["t_pro"],
+                "beta": calculator.anchor.anchor_interaction()["beta"],
+                "beta_u": calculator.anchor.anchor_interaction()["beta_u"],
+                "governing_check": result["governing_check"],
+                "governing_ratio": result["governing_ratio"],
+                "evaluations": self.evaluations,
+            }
+        raise ValueError("No anchor group / base plate within the candidate ranges passes")
+
+
+def plate_range(smallest):
+    start = math.ceil(smallest / PLATE_STEP) * PLATE_STEP
+    return tuple(range(start, start + PLATE_RANGE + 1, PLATE_STEP))
+
+
+def size_brackets(brackets, **options):
+    """
+    AnchorSizeOptimizer over a bracket schedule (list of dicts or CSV path, as read by
+    fixing_schedule.read_brackets). Brackets with no passing size get an "error" entry.
+    """
+    brackets = read_brackets(brackets) if isinstance(brackets, str) else brackets
+    results = []
+    for bracket in brackets:
+        try:
+            results.append(AnchorSizeOptimizer(bracket, **options).optimize())
+        except ValueError as e:
+            results.append({"id": bracket.get("id"), "error": str(e)})
+    return results
+
+
+if __name__ == "__main__":
+    import time
+    brackets = [{"id": i, "wind_load": 10 + 2 * i, "dead_load": 4 + i % 5} for i in range(100)]
+    start = time.perf_counter()
+    results = size_brackets(brackets)
+    print(f"{len(results)} brackets sized in {time.perf_counter() - start:.2f} s")
+    for r in results[::20]:
+        print(r)
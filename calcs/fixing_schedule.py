@@ -0,0 +1,209 @@
+import csv
+import inspect
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .fixing import BoxClumpCalculator, UClumpCalculator
+from .anchor_chart import AnchorChartCalculator, DEFAULTS as ANCHOR_INPUTS
+
+
+FIXING_TYPES = {"box": BoxClumpCalculator, "u": UClumpCalculator}
+
+# governing-ratio table columns: check -> ratio taken from the calculator summary
+ANCHOR_CHECKS = {
+    "anchor_steel_tension": lambda s: s["steel_strength_tension"]["ratio"],
+    "anchor_breakout_tension": lambda s: s["concrete_breakout_tension"]["ratio"],
+    "anchor_pullout": lambda s: s["pullout_strength_tension"]["ratio"],
+    "anchor_sideface_blowout": lambda s: s["sideface_blowout_tension"]["ratio"],
+    "anchor_steel_shear": lambda s: s["steel_strength_shear"]["ratio"],
+    "anchor_breakout_shear": lambda s: s["concrete_breakout_shear"]["ratio"],
+    "anchor_pryout": lambda s: s["pryout_strength_shear"]["ratio"],
+    "anchor_interaction": lambda s: s["anchor_interaction"]["beta"] / s["anchor_interaction"]["beta_u"],
+}
+PLATE_CHECKS = {
+    "bp_area": lambda s: s["bp_area"]["area"] / s["bp_area"]["area_p"],
+    "conc_bearing": lambda s: s["conc_bearing_stress"]["pu_A1"] / s["conc_bearing_stress"]["f_pmax"],
+    "fin_shear_yield": lambda s: s["fin_shear_yield"]["Vu"] / s["fin_shear_yield"]["phi_R_n"],
+    # rupture capacity is reported in N, the load in kN
+    "fin_shear_rupture": lambda s: s["fin_shear_rupture"]["Vu"] * 1000 / s["fin_shear_rupture"]["phi_R_n"],
+    "fin_block_shear": lambda s: s["fin_block_shear"]["Vu"] / s["fin_block_shear"]["phi_R_n"],
+    "fin_weld": lambda s: s["fin_weld"]["f_R"] / s["fin_weld"]["phi_R_n"],
+    "bolt_shear": lambda s: s["bolt_shear"]["ratio"],
+    "bolt_bearing": lambda s: s["bolt_bearing"]["ratio"],
+}
+ALL_CHECKS = {**ANCHOR_CHECKS, **PLATE_CHECKS}
+
+
+def parse_value(value):
+    value = value.strip()
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+
+def read_brackets(path):
+    # bracket table: id, fixing_type (box/u) and any BoxClumpCalculator/UClumpCalculator argument
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return [
+            {key.strip(): parse_value(value) for key, value in row.items() if value is not None and value.strip()}
+            for row in csv.DictReader(f)
+        ]
+
+
+def fixing_calculator(row):
+    fixing_type = str(row.get("fixing_type", "box")).lower()
+    if fixing_type not in FIXING_TYPES:
+        raise ValueError(f"Unknown fixing type: {fixing_type}")
+    cls = FIXING_TYPES[fixing_type]
+    accepted = inspect.signature(cls.__init__).parameters
+    unknown = set(row) - set(accepted) - {"id", "fixing_type"}
+    if unknown:
+        raise ValueError(f"Unknown bracket input(s): {', '.join(sorted(unknown))}")
+    calculator = cls(**{key: value for key, value in row.items() if key in accepted})
+    return calculator.compute_u_clump() if fixing_type == "u" else calculator.compute_box_clump()
+
+
+def bracket_ratios(row):
+    # full check of one bracket; runs in a worker process
+    result = {"id": row.get("id"), "fixing_type": str(row.get("fixing_type", "box")).lower()}
+    try:
+        calculator = fixing_calculator(row)
+        summary = dict(calculator.summary(), sideface_blowout_tension=calculator.anchor.sideface_blowout_tension())
+        for check, ratio in ALL_CHECKS.items():
+            try:
+                result[check] = round(ratio(summary), 2)
+            except KeyError:
+                pass        # check not part of this fixing type
+    except (ValueError, ZeroDivisionError, TypeError) as e:
+        result["error"] = str(e)
+    return governing(result)
+
+
+def round2(values):
+    # Python's round() per element, so vectorized ratios round exactly as the calculators' do
+    return np.array([round(value, 2) for value in np.ravel(values).tolist()]).reshape(np.shape(values))
+
+
+def governing(result):
+    ratios = {check: result[check] for check in ALL_CHECKS if result.get(check) is not None}
+    invalid = [check for check, ratio in ratios.items() if math.isnan(ratio)]
+    if invalid:
+        # e.g. a negative load in the interaction check; the full check raises for it
+        result.setdefault("error", f"No ratio for {', '.join(invalid)}")
+        result["status"] = "ERROR"
+    elif ratios:
+        check = max(ratios, key=ratios.get)
+        result["governing_check"] = check
+        result["governing_ratio"] = ratios[check]
+        result["status"] = "OK" if ratios[check] <= 1 else "NG"
+    else:
+        result["status"] = "ERROR"
+    return result
+
+
+class FixingScheduleRunner:
+    """
+    Governing-ratio table for a schedule of box / U clump brackets.
+
+    Parameters:
+        max_workers : int - Worker processes for the full check (default: CPU count)
+        chunksize : int - Brackets sent to a worker at a time
+
+    run() evaluates every check of every bracket with the fixing calculators, spreading
+    the brackets across a ProcessPoolExecutor. run_anchors() is the vectorized fast path:
+    the closed-form anchor checks of all brackets in one NumPy pass, rounded at the same
+    steps as the full check so every anchor ratio matches run() (no fin / base plate checks).
+    """
+
+    def __init__(self, max_workers=None, chunksize=64):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+
+    def run(self, brackets):
+        brackets = read_brackets(brackets) if isinstance(brackets, str) else list(brackets)
+        if self.max_workers == 1 or len(brackets) < 2 * self.chunksize:
+            return [bracket_ratios(row) for row in brackets]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(bracket_ratios, brackets, chunksize=self.chunksize))
+
+    def run_anchors(self, brackets):
+        brackets = read_brackets(brackets) if isinstance(brackets, str) else list(brackets)
+        fixing_type = np.array([str(row.get("fixing_type", "box")).lower() for row in brackets])
+        unknown = set(fixing_type) - set(FIXING_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown fixing type: {', '.join(sorted(unknown))}")
+
+        def column(name, default):
+            return np.array([row.get(name, default) for row in brackets])
+
+        # anchor loads as in BoxClumpCalculator / UClumpCalculator.compute_anchor_load
+        R_y = column("wind_load", 30.0).astype(float)
+        R_z = column("dead_load", 8.0).astype(float)
+        n_anchor = column("n_anchor", 4).astype(float)
+        n_N = np.where(n_anchor == 4, 4, 2)
+        u = fixing_type == "u"
+        N_ua = np.where(u, R_y, np.maximum(R_z, 0)) / n_anchor
+        V_ua = np.where(u, R_z, R_y) / n_anchor
+
+        # the clump defaults that differ from the anchor chart ones
+        inputs = {name: column(name, default) for name, default in ANCHOR_INPUTS.items() if default is not None}
+        inputs.update(N_ua=round2(N_ua), N_ug=round2(N_ua * n_N), V_ua=round2(V_ua), V_ug=round2(V_ua * 2),
+                      tension_ecc=column("wind_ecc", 0), shear_ecc=column("dead_ecc", 0))
+        with np.errstate(invalid="ignore"):     # the chart's own interaction, unused here
+            results = AnchorChartCalculator(aligned=True, **inputs).compute()
+
+        # capacities as AnchorCalculator gets them: failure areas rounded by the clump calculators,
+        # pryout from the rounded breakout capacity
+        phi_N_cbg = results["phi_N_cbg"] / results["A_NC"] * round2(results["A_NC"])
+        phi_V_cbg = results["phi_V_cbg"] / results["A_VC"] * round2(results["A_VC"])
+        phi_t = np.where(inputs["install_type"] == "cast-in", 0.7, 0.65)
+        k_cp = np.where(inputs["embed_depth"] < 65, 1.0, 2.0)
+        phi_V_cp = 0.7 * k_cp * (round2(phi_V_cbg) / phi_t)
+
+        loads = {name: inputs[name] for name in ("N_ua", "N_ug", "V_ua", "V_ug")}
+        ratios = {
+            "anchor_steel_tension": loads["N_ua"] / results["phi_N_sa"],
+            "anchor_breakout_tension": loads["N_ug"] / phi_N_cbg,
+            "anchor_pullout": loads["N_ua"] / results["phi_N_pn"],
+            "anchor_sideface_blowout": loads["N_ug"] / results["phi_N_sbg"],
+            "anchor_steel_shear": loads["V_ua"] / results["phi_V_sa"],
+            "anchor_breakout_shear": loads["V_ug"] / phi_V_cbg,
+            "anchor_pryout": loads["V_ug"] / phi_V_cp,
+        }
+        ratios = {check: round2(ratio) for check, ratio in ratios.items()}
+        # AnchorCalculator.anchor_interaction: beta_N / beta_V from the rounded ratios, beta rounded
+        # before dividing by beta_u, and the table ratio rounded as in bracket_ratios
+        beta_N = np.maximum.reduce([ratios["anchor_steel_tension"], ratios["anchor_breakout_tension"],
+                                    ratios["anchor_pullout"], ratios["anchor_sideface_blowout"]])
+        beta_V = np.maximum.reduce([ratios["anchor_steel_shear"], ratios["anchor_breakout_shear"],
+                                    ratios["anchor_pryout"]])
+        beta_u = np.where((beta_N < 0.2) | (beta_V < 0.2), 1.0, 1.2)
+        with np.errstate(invalid="ignore"):     # uplift on a U clump: NaN, where the full check errors
+            ratios["anchor_interaction"] = round2(round2(beta_N**1.67 + beta_V**1.67) / beta_u)
+        return [
+            governing({"id": row.get("id"), "fixing_type": fixing_type[i],
+                       **{check: float(values[i]) for check, values in ratios.items()}})
+            for i, row in enumerate(brackets)
+        ]
+
+    def write_csv(self, results, path):
+        columns = ["id", "fixing_type", "governing_check", "governing_ratio", "status"]
+        columns += [check for check in ALL_CHECKS if any(check in r for r in results)]
+        if any("error" in r for r in results):
+            columns.append("error")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(results)
+
+
+if __name__ == "__main__":
+    import sys
+    runner = FixingScheduleRunner()
+    results = runner.run(sys.argv[1])
+    runner.write_csv(results, sys.argv[2])
+    print(f"{len(results)} brackets, {sum(r['status'] != 'OK' for r in results)} not OK")
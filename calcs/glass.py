@@ -1,5 +1,6 @@
 import numpy as np
 import math
+from .package import nfl_charts
 
 
 class GlassCalculatorBase:
@@ -41,6 +42,10 @@ class GlassCalculatorBase:
             raise ValueError(f"Unknown glass thickness: {thk}")
         return thk_min[thk]
     
+    def lookup_nfl(self, thickness, laminated=False):
+        # NFL read from the digitized charts, used when no NFL is given
+        return nfl_charts.nfl_lookup(thickness, self.glass_length, self.glass_width, self.support_type, laminated)
+
     def compute_silicone_bite(self):
         t_req = (self.wind_load * self.glass_width) / (2 * self.sigma_s)
         e_req = t_req / 3
@@ -57,13 +62,13 @@ class GlassCalculatorBase:
 
 class SGUCalculator(GlassCalculatorBase):
     def __init__(self, length, width, thickness, glass_type, support_type,
-                wind_load, nfl):
+                wind_load, nfl=None):
         super().__init__(wind_load, length, width)
         
         self.thickness = thickness
         self.glass_type = glass_type
         self.support_type = support_type
-        self.nfl = nfl
+        self.nfl = nfl if nfl is not None else self.lookup_nfl(thickness)
 
     def compute_params(self):
         return {
@@ -159,7 +164,7 @@ class SGUCalculator(GlassCalculatorBase):
 
 class DGUCalculator(GlassCalculatorBase):
     def __init__(self, length, width, thickness1, gap, thickness2, glass1_type, glass2_type,
-                support_type, wind_load, nfl1, nfl2):
+                support_type, wind_load, nfl1=None, nfl2=None):
         super().__init__(wind_load, length, width)
 
         self.thickness1 = thickness1
@@ -168,8 +173,8 @@ class DGUCalculator(GlassCalculatorBase):
         self.glass1_type = glass1_type
         self.glass2_type = glass2_type
         self.support_type = support_type
-        self.nfl1 = nfl1
-        self.nfl2 = nfl2
+        self.nfl1 = nfl1 if nfl1 is not None else self.lookup_nfl(thickness1)
+        self.nfl2 = nfl2 if nfl2 is not None else self.lookup_nfl(thickness2)
     
     def compute_params(self):
         return {
@@ -303,7 +308,7 @@ class TGUCalculator(GlassCalculatorBase):       # need checking (Out of ASTM E13
 
 class LGUCalculator(GlassCalculatorBase):
     def __init__(self, length, width, thickness1, thickness_inner, thickness2,
-                glass_type, support_type, wind_load, nfl):
+                glass_type, support_type, wind_load, nfl=None):
         super().__init__(wind_load, length, width)
         
         self.thickness1 = thickness1
@@ -311,7 +316,8 @@ class LGUCalculator(GlassCalculatorBase):
         self.thickness2 = thickness2
         self.glass_type = glass_type
         self.support_type = support_type
-        self.nfl = nfl
+        self.nfl = nfl if nfl is not None else self.lookup_nfl(
+            nfl_charts.laminated_nominal_thickness(thickness1, thickness_inner, thickness2), laminated=True)
 
         # Auto-derived
         self.thickness = self.thickness1 + self.thickness2
@@ -409,7 +415,7 @@ class LGUCalculator(GlassCalculatorBase):
 
 class LDGUCalculator(GlassCalculatorBase):
     def __init__(self, length, width, thickness1_1, thickness_inner, thickness1_2, gap,
-                thickness2, glass1_type, glass2_type, support_type, wind_load, nfl1, nfl2):
+                thickness2, glass1_type, glass2_type, support_type, wind_load, nfl1=None, nfl2=None):
         super().__init__(wind_load, length, width)
 
         self.thickness1_1 = thickness1_1
@@ -421,8 +427,9 @@ class LDGUCalculator(GlassCalculatorBase):
         self.glass1_type = glass1_type
         self.glass2_type = glass2_type
         self.support_type = support_type
-        self.nfl1 = nfl1
-        self.nfl2 = nfl2
+        self.nfl1 = nfl1 if nfl1 is not None else self.lookup_nfl(
+            nfl_charts.laminated_nominal_thickness(thickness1_1, thickness_inner, thickness1_2), laminated=True)
+        self.nfl2 = nfl2 if nfl2 is not None else self.lookup_nfl(thickness2)
     
     def compute_params(self):
         return {
@@ -0,0 +1,263 @@
+import numpy as np
+from .package import nfl_charts
+
+
+NOMINAL_THICKNESSES = np.array([2.5, 2.7, 3.0, 4.0, 5.0, 6.0, 8.0, 10.0, 12.0, 16.0, 19.0, 22.0])
+MINIMUM_THICKNESSES = np.array([2.16, 2.59, 2.92, 3.78, 4.57, 5.56, 7.42, 9.02, 11.91, 15.09, 18.26, 21.44])
+GLASS_TYPES = ("AN", "HS", "FT")
+GTF_SINGLE = np.array([1.0, 2.0, 4.0])
+GTF_DOUBLE = np.array([         # [outer type, inner type] -> (gtf1, gtf2)
+    [(0.9, 0.9), (1.0, 1.9), (1.0, 3.8)],
+    [(1.9, 1.0), (1.8, 1.8), (1.9, 3.8)],
+    [(3.8, 1.0), (3.8, 1.9), (3.6, 3.6)],
+])
+
+
+def glass_type_index(glass_type):
+    # "AN"/"HS"/"FT" (scalar or array) -> 0/1/2
+    types, inverse = np.unique(np.asarray(glass_type, dtype=str), return_inverse=True)
+    unknown = [t for t in types if t not in GLASS_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown glass type: {', '.join(unknown)}")
+    index = np.array([GLASS_TYPES.index(t) for t in types])
+    return index[inverse].reshape(np.shape(glass_type))
+
+
+class GlassBatchCalculatorBase:
+    """
+    Array counterpart of GlassCalculatorBase: every panel input is a NumPy array
+    (or a scalar shared by all panels) and every result is an array, unrounded.
+    """
+
+    def __init__(self, wind_load, length, width):
+        wind_load, length, width = np.broadcast_arrays(
+            np.asarray(wind_load, dtype=float), np.asarray(length, dtype=float), np.asarray(width, dtype=float)
+        )
+        self.wind_load = wind_load
+        self.length = length
+        self.width = width
+        self.E = 71700 * 1000
+        self.sigma_s = 140
+        self.nu_glass = 0.22
+        self.G_glass = self.E / (2 * (1 + self.nu_glass))
+        self.G_pvb = 200 * 1000
+
+        # auto-derived properties
+        self.glass_length = np.maximum(length, width)
+        self.glass_width = np.minimum(length, width)
+        self.aspect_ratio = np.maximum(self.glass_length / self.glass_width, 1)
+        self.eff_area = np.maximum(self.glass_length * self.glass_width, self.glass_length**2 / 3) / 1000**2
+
+        # coefficients for deflection calculation
+        ar = self.aspect_ratio
+        self.r_0 = 0.553 - 3.83 * ar + 1.11 * ar**2 - 0.0969 * ar**3
+        self.r_1 = -2.29 + 5.83 * ar - 2.17 * ar**2 + 0.2067 * ar**3
+        self.r_2 = 1.485 - 1.908 * ar + 0.815 * ar**2 - 0.0822 * ar**3
+
+    def minimum_thickness(self, thk):
+        thk = np.asarray(thk, dtype=float)
+        i = np.clip(np.searchsorted(NOMINAL_THICKNESSES, thk), 0, len(NOMINAL_THICKNESSES) - 1)
+        if np.any(NOMINAL_THICKNESSES[i] != thk):
+            raise ValueError(f"Unknown glass thickness: {sorted(set(thk[NOMINAL_THICKNESSES[i] != thk].tolist()))}")
+        return MINIMUM_THICKNESSES[i]
+
+    def plate_deflection(self, q, h):
+        # ASTM E1300 four edge deflection for load q (kPa) on a ply of thickness h (mm),
+        # NaN for panels too lightly loaded for the equation (as the scalar calculators)
+        with np.errstate(invalid="ignore"):
+            x = np.log(np.log(q * (self.glass_length * self.glass_width)**2 / (self.E * h**4)))
+        return x, h * np.exp(self.r_0 + self.r_1 * x + self.r_2 * x**2)
+
+    def lookup_nfl(self, thickness, laminated=False):
+        # NFL from the digitized charts, NaN for panels outside a chart
+        thickness = np.broadcast_to(np.asarray(thickness, dtype=float), self.glass_length.shape)
+        nfl = np.full(self.glass_length.shape, np.nan)
+        for thk in np.unique(thickness):
+            mask = thickness == thk
+            nfl[mask] = nfl_charts.nfl_lookup(
+                thk, self.glass_length[mask], self.glass_width[mask], self.support_type, laminated, strict=False
+            )
+        return nfl
+
+    def compute_silicone_bite(self):
+        t_req = (self.wind_load * self.glass_width) / (2 * self.sigma_s)
+        e_req = t_req / 3
+
+        return {
+            "t_req": t_req,
+            "t_pro": np.ceil(t_req),
+            "e_req": e_req,
+            "e_pro": np.maximum(np.ceil(e_req), 6)
+        }
+
+    def summary(self):
+        return {
+            "load_resistance": self.compute_load_resistance(),
+            "deflection": self.compute_glass_deflection(),
+            "silicone_bite": self.compute_silicone_bite()
+        }
+
+
+
+class SGUBatchCalculator(GlassBatchCalculatorBase):
+    def __init__(self, length, width, thickness, glass_type, support_type,
+                wind_load, nfl=None):
+        super().__init__(wind_load, length, width)
+
+        self.support_type = support_type
+
+        self.thickness = np.asarray(thickness, dtype=float)
+        self.glass_type = glass_type
+        self.nfl = np.asarray(nfl, dtype=float) if nfl is not None else self.lookup_nfl(self.thickness)
+
+    def compute_load_resistance(self):
+        gtf = GTF_SINGLE[glass_type_index(self.glass_type)]
+        lr = self.nfl * gtf
+        return {"nfl": self.nfl, "gtf": gtf, "lr": lr, "ratio": self.wind_load / lr}
+
+    def compute_glass_deflection(self):
+        q = 0.7 * self.wind_load
+        min_thk = self.minimum_thickness(self.thickness)
+        x, delta = self.plate_deflection(q, min_thk)
+        delta_a = self.glass_width / 60
+        return {"q": q, "min_thk": min_thk, "x": x, "delta": delta, "delta_a": delta_a, "ratio": delta / delta_a}
+
+
+
+class DGUBatchCalculator(GlassBatchCalculatorBase):
+    def __init__(self, length, width, thickness1, gap, thickness2, glass1_type, glass2_type,
+                support_type, wind_load, nfl1=None, nfl2=None):
+        super().__init__(wind_load, length, width)
+
+        self.gap = np.asarray(gap, dtype=float)
+        self.support_type = support_type
+
+        self.thickness1 = np.asarray(thickness1, dtype=float)
+        self.thickness2 = np.asarray(thickness2, dtype=float)
+        self.glass1_type = glass1_type
+        self.glass2_type = glass2_type
+        self.nfl1 = np.asarray(nfl1, dtype=float) if nfl1 is not None else self.lookup_nfl(self.thickness1)
+        self.nfl2 = np.asarray(nfl2, dtype=float) if nfl2 is not None else self.lookup_nfl(self.thickness2)
+
+    def load_share_factor(self):
+        total = self.thickness1**3 + self.thickness2**3
+        return total / self.thickness1**3, total / self.thickness2**3
+
+    def compute_load_resistance(self):
+        gtf = GTF_DOUBLE[glass_type_index(self.glass1_type), glass_type_index(self.glass2_type)]
+        gtf1, gtf2 = gtf[..., 0], gtf[..., 1]
+        ls1, ls2 = self.load_share_factor()
+        lr1 = self.nfl1 * gtf1 * ls1
+        lr2 = self.nfl2 * gtf2 * ls2
+        lr = np.minimum(lr1, lr2)
+        return {"gtf1": gtf1, "gtf2": gtf2, "ls1": ls1, "ls2": ls2,
+                "lr1": lr1, "lr2": lr2, "lr": lr, "ratio": self.wind_load / lr}
+
+    def compute_glass_deflection(self):
+        ls1, ls2 = self.load_share_factor()
+        x1, delta1 = self.plate_deflection(0.7 * self.wind_load / ls1, self.minimum_thickness(self.thickness1))
+        x2, delta2 = self.plate_deflection(0.7 * self.wind_load / ls2, self.minimum_thickness(self.thickness2))
+        delta = np.fmax(delta1, delta2)     # a pane outside the equation range does not govern
+        delta_a = self.glass_width / 60
+        return {"x1": x1, "x2": x2, "delta1": delta1, "delta2": delta2,
+                "delta": delta, "delta_a": delta_a, "ratio": delta / delta_a}
+
+
+
+class LGUBatchCalculator(GlassBatchCalculatorBase):
+    def __init__(self, length, width, thickness1, thickness_inner, thickness2,
+                glass_type, support_type, wind_load, nfl=None):
+        super().__init__(wind_load, length, width)
+
+        self.support_type = support_type
+
+        self.thickness1 = np.asarray(thickness1, dtype=float)
+        self.thickness_inner = np.asarray(thickness_inner, dtype=float)
+        self.thickness2 = np.asarray(thickness2, dtype=float)
+        self.glass_type = glass_type
+        if nfl is None:
+            nominal = nfl_charts.laminated_nominal_thickness_array(self.thickness1, self.thickness_inner, self.thickness2)
+            self.nfl = self.lookup_nfl(nominal, laminated=True)
+        else:
+            self.nfl = np.asarray(nfl, dtype=float)
+
+    def effective_thickness_lgu(self):
+        h1 = self.minimum_thickness(self.thickness1)
+        h2 = self.minimum_thickness(self.thickness2)
+        gamma = self.G_pvb / self.G_glass
+        return (h1**3 + h2**3 + 3 * gamma * h1 * h2 * (h1 + h2)) ** (1 / 3)
+
+    def compute_load_resistance(self):
+        gtf = GTF_SINGLE[glass_type_index(self.glass_type)]
+        lr = self.nfl * gtf
+        return {"nfl": self.nfl, "gtf": gtf, "lr": lr, "ratio": self.wind_load / lr}
+
+    def compute_glass_deflection(self):
+        q = 0.7 * self.wind_load
+        h_eff = self.effective_thickness_lgu()
+        x, delta = self.plate_deflection(q, h_eff)
+        delta_a = self.glass_width / 60
+        return {"q": q, "h_eff": h_eff, "x": x, "delta": delta, "delta_a": delta_a, "ratio": delta / delta_a}
+
+
+
+class LDGUBatchCalculator(GlassBatchCalculatorBase):
+    def __init__(self, length, width, thickness1_1, thickness_inner, thickness1_2, gap,
+                thickness2, glass1_type, glass2_type, support_type, wind_load, nfl1=None, nfl2=None):
+        super().__init__(wind_load, length, width)
+
+        self.gap = np.asarray(gap, dtype=float)
+        self.support_type = support_type
+
+        self.thickness1_1 = np.asarray(thickness1_1, dtype=float)
+        self.thickness_inner = np.asarray(thickness_inner, dtype=float)
+        self.thickness1_2 = np.asarray(thickness1_2, dtype=float)
+        self.thickness1 = self.thickness1_1 + self.thickness1_2
+        self.thickness2 = np.asarray(thickness2, dtype=float)
+        self.glass1_type = glass1_type
+        self.glass2_type = glass2_type
+        if nfl1 is None:
+            nominal = nfl_charts.laminated_nominal_thickness_array(self.thickness1_1, self.thickness_inner, self.thickness1_2)
+            self.nfl1 = self.lookup_nfl(nominal, laminated=True)
+        else:
+            self.nfl1 = np.asarray(nfl1, dtype=float)
+        self.nfl2 = np.asarray(nfl2, dtype=float) if nfl2 is not None else self.lookup_nfl(self.thickness2)
+
+    def effective_thickness_lgu(self):
+        h1 = self.minimum_thickness(self.thickness1_1)
+        h2 = self.minimum_thickness(self.thickness1_2)
+        gamma = self.G_pvb / self.G_glass
+        return (h1**3 + h2**3 + 3 * gamma * h1 * h2 * (h1 + h2)) ** (1 / 3)
+
+    def load_share_factor(self):
+        total = self.thickness1**3 + self.thickness2**3
+        return total / self.thickness1**3, total / self.thickness2**3
+
+    def compute_load_resistance(self):
+        gtf = GTF_DOUBLE[glass_type_index(self.glass1_type), glass_type_index(self.glass2_type)]
+        gtf1, gtf2 = gtf[..., 0], gtf[..., 1]
+        ls1, ls2 = self.load_share_factor()
+        lr1 = self.nfl1 * gtf1 * ls1
+        lr2 = self.nfl2 * gtf2 * ls2
+        lr = np.minimum(lr1, lr2)
+        return {"gtf1": gtf1, "gtf2": gtf2, "ls1": ls1, "ls2": ls2,
+                "lr1": lr1, "lr2": lr2, "lr": lr, "ratio": self.wind_load / lr}
+
+    def compute_glass_deflection(self):
+        ls1, ls2 = self.load_share_factor()
+        h1_eff = self.effective_thickness_lgu()
+        x1, delta1 = self.plate_deflection(0.7 * self.wind_load / ls1, h1_eff)
+        # same as LDGUCalculator: the monolithic inner pane uses its nominal thickness
+        x2, delta2 = self.plate_deflection(0.7 * self.wind_load / ls2, self.thickness2)
+        delta = np.fmax(delta1, delta2)     # a pane outside the equation range does not govern
+        delta_a = self.glass_width / 60
+        return {"h1_eff": h1_eff, "x1": x1, "x2": x2, "delta1": delta1, "delta2": delta2,
+                "delta": delta, "delta_a": delta_a, "ratio": delta / delta_a}
+
+
+if __name__ == "__main__":
+    lengths = np.array([1500, 2400, 1800])
+    widths = np.array([1200, 1200, 900])
+    dgu = DGUBatchCalculator(lengths, widths, [8, 10, 8], 12, 8, ["FT", "HS", "FT"], "FT", "Four Edges", 4.0, 2.5, 2.5)
+    summary = dgu.summary()
+    print(summary)
@@ -0,0 +1,275 @@
+import numpy as np
+from .package import nfl_charts
+from .glass_batch import (
+    SGUBatchCalculator, DGUBatchCalculator, LGUBatchCalculator, LDGUBatchCalculator, GLASS_TYPES
+)
+
+
+COMPOSITIONS = ("SGU", "LGU", "DGU", "LDGU")     # search order, earlier wins on equal weight
+THICKNESSES = (4.0, 5.0, 6.0, 8.0, 10.0, 12.0, 16.0, 19.0)
+INTERLAYERS = (0.76, 1.52, 2.28)
+GLASS_WEIGHT = 2.5          # kg/m² per mm (2500 kg/m³)
+INTERLAYER_WEIGHT = 1.07    # kg/m² per mm (PVB, 1070 kg/m³)
+
+
+def chart_nfl(thickness, length, width, support_type, laminated):
+    # NFL from the digitized charts, NaN where no chart covers the panel
+    try:
+        return nfl_charts.nfl_lookup(thickness, length, width, support_type, laminated, strict=False)
+    except ValueError:
+        return np.full(np.shape(length), np.nan)
+
+
+class GlassMakeupOptimizer:
+    """
+    Lightest passing glass make-up for every panel of a schedule.
+
+    Parameters:
+        length, width : array - Panel dimensions (mm)
+        wind_load : array - Design wind pressure (kPa)
+        support_type : str - "Four Edges", "Three Edges", "Two Edges" or "One Edge"
+        compositions : tuple - Any of "SGU", "LGU", "DGU", "LDGU"
+        thicknesses : tuple - Nominal ply thicknesses to try (mm)
+        glass_types : tuple - Any of "AN", "HS", "FT"; earlier wins on equal weight
+        interlayers : tuple - Interlayer thicknesses to try for laminated plies (mm)
+        gap : float - Air gap of insulated units (mm), it does not enter the checks
+        nfl_lookup : callable - (thickness, length, width, support_type, laminated) -> NFL array,
+                                defaults to the digitized charts (NaN = no capacity)
+
+    A make-up passes when both the load resistance and the deflection ratio are <= 1.
+    Where a chart gives an NFL, capacity never drops with a thicker ply, so the last ply
+    of every make-up is found by bisection over all panels at once, and its upper bound
+    only shrinks as the other plies get thicker. A ply with no NFL (off the chart) is
+    unknown, not failing: the panel's remaining range is then scanned from thin to thick.
+    Panels that already have a lighter solution are skipped.
+
+    The default charts are laminated only, so with the default nfl_lookup a composition
+    needing a monolithic chart (SGU, DGU and the inner pane of LDGU) raises ValueError.
+    """
+
+    def __init__(self, length, width, wind_load, support_type="Four Edges", compositions=COMPOSITIONS,
+                thicknesses=THICKNESSES, glass_types=GLASS_TYPES, interlayers=INTERLAYERS, gap=12,
+                nfl_lookup=None):
+        self.wind_load, self.length, self.width = np.broadcast_arrays(
+            np.asarray(wind_load, dtype=float), np.asarray(length, dtype=float), np.asarray(width, dtype=float)
+        )
+        self.support_type = support_type
+        self.compositions = compositions
+        self.thicknesses = np.array(sorted(thicknesses), dtype=float)
+        self.glass_types = glass_types
+        self.interlayers = interlayers
+        self.gap = gap
+        self.nfl_lookup = nfl_lookup or chart_nfl
+        self.evaluations = 0        # panel checks run, for comparing against brute force
+
+        n = self.length.size
+        self.best_weight = np.full(n, np.inf)
+        self.best_composition = np.full(n, "", dtype=object)
+        self.best_params = [None] * n
+        self.lr_ratio = np.full(n, np.nan)
+        self.deflection_ratio = np.full(n, np.nan)
+
+    def nfl(self, thickness, panels, laminated=False):
+        # NFL per panel for an array of ply thicknesses, one chart lookup per thickness
+        thickness = np.broadcast_to(thickness, panels.shape)
+        nfl = np.full(panels.shape, np.nan)
+        for thk in np.unique(thickness):
+            mask = thickness == thk
+            nfl[mask] = self.nfl_lookup(
+                thk, self.length[panels[mask]], self.width[panels[mask]], self.support_type, laminated
+            )
+        return nfl
+
+    def calculator(self, composition, panels, fixed, thk):
+        # batch calculator for `panels`, with the searched ply thickness `thk` per panel
+        L, W, q = self.length[panels], self.width[panels], self.wind_load[panels]
+        if composition == "SGU":
+            return SGUBatchCalculator(L, W, thk, fixed["glass_type"], self.support_type, q,
+                                      self.nfl(thk, panels))
+        if composition == "LGU":
+            nominal = nfl_charts.laminated_nominal_thickness_array(fixed["thickness1"], fixed["thickness_inner"], thk)
+            return LGUBatchCalculator(L, W, fixed["thickness1"], fixed["thickness_inner"], thk, fixed["glass_type"],
+                                      self.support_type, q, self.nfl(nominal, panels, laminated=True))
+        if composition == "DGU":
+            return DGUBatchCalculator(L, W, fixed["thickness1"], self.gap, thk, fixed["glass1_type"],
+                                      fixed["glass2_type"], self.support_type, q,
+                                      self.nfl(fixed["thickness1"], panels), self.nfl(thk, panels))
+        nominal = nfl_charts.laminated_nominal_thickness_array(
+            fixed["thickness1_1"], fixed["thickness_inner"], fixed["thickness1_2"])
+        return LDGUBatchCalculator(L, W, fixed["thickness1_1"], fixed["thickness_inner"], fixed["thickness1_2"],
+                                   self.gap, thk, fixed["glass1_type"], fixed["glass2_type"], self.support_type, q,
+                                   self.nfl(nominal, panels, laminated=True), self.nfl(thk, panels))
+
+    def check(self, composition, panels, fixed, thk):
+        # NaN load resistance ratio = no NFL for the make-up, so passed is False but not a fail
+        calculator = self.calculator(composition, panels, fixed, thk)
+        lr_ratio = calculator.compute_load_resistance()["ratio"]
+        deflection_ratio = calculator.compute_glass_deflection()["ratio"]
+        self.evaluations += panels.size
+        # NaN deflection = load too light for the deflection equation, so it never governs
+        passed = (lr_ratio <= 1) & ~(deflection_ratio > 1)
+        return passed, lr_ratio, deflection_ratio
+
+    def check_charts(self, composition):
+        # the default lookup only has the digitized charts; fail loudly instead of finding nothing
+        if self.nfl_lookup is not chart_nfl:
+            return
+        needed = {"SGU": (False,), "LGU": (True,), "DGU": (False,), "LDGU": (True, False)}[composition]
+        available = {(laminated, support_type) for laminated, support_type, _ in nfl_charts.available_charts()}
+        for laminated in needed:
+            if (laminated, self.support_type) not in available:
+                kind = "laminated" if laminated else "monolithic"
+                raise ValueError(
+                    f"No digitized {kind} NFL chart ({self.support_type}) for {composition}; pass nfl_lookup"
+                )
+
+    def families(self, composition):
+        # (fixed make-up, its weight, largest index of the searched ply) in search order;
+        # families sharing a key have their fixed plies in ascending thickness
+        thk = self.thicknesses
+        types = self.glass_types
+        pairs = [(t1, t2) for t1 in types for t2 in types]
+
+        if composition == "SGU":
+            for glass_type in types:
+                yield glass_type, {"glass_type": glass_type}, 0.0, len(thk) - 1
+        elif composition == "LGU":
+            # plies are interchangeable, so the searched ply is never thicker than the fixed one
+            for glass_type in types:
+                for inner in self.interlayers:
+                    for i, t1 in enumerate(thk):
+                        fixed = {"thickness1": t1, "thickness_inner": inner, "glass_type": glass_type}
+                        yield (glass_type, inner), fixed, GLASS_WEIGHT * t1 + INTERLAYER_WEIGHT * inner, i
+        elif composition == "DGU":
+            for glass1_type, glass2_type in pairs:
+                for t1 in thk:
+                    fixed = {"thickness1": t1, "glass1_type": glass1_type, "glass2_type": glass2_type}
+                    yield (glass1_type, glass2_type), fixed, GLASS_WEIGHT * t1, len(thk) - 1
+        else:
+            # laminated outer pane: thinner ply fixed per key, thicker ply ascending
+            for glass1_type, glass2_type in pairs:
+                for inner in self.interlayers:
+                    for i, t1_2 in enumerate(thk):
+                        for t1_1 in thk[i:]:
+                            fixed = {"thickness1_1": t1_1, "thickness_inner": inner, "thickness1_2": t1_2,
+                                     "glass1_type": glass1_type, "glass2_type": glass2_type}
+                            weight = GLASS_WEIGHT * (t1_1 + t1_2) + INTERLAYER_WEIGHT * inner
+                            yield (glass1_type, glass2_type, inner, t1_2), fixed, weight, len(thk) - 1
+
+    def search(self, composition):
+        thk = self.thicknesses
+        n = self.length.size
+        ply_weight = GLASS_WEIGHT * thk
+        key, known = None, None
+
+        for family_key, fixed, fixed_weight, last in self.families(composition):
+            if family_key != key:
+                key, known = family_key, np.full(n, len(thk))      # lowest index known to pass
+            # only indices lighter than the current best are worth checking (equal weight keeps the earlier)
+            limit = np.searchsorted(ply_weight[:last + 1], self.best_weight - fixed_weight - 1e-9, side="left")
+            lo = np.zeros(n, dtype=int)
+            hi = np.minimum(known, limit)
+            found = np.where(known < limit, known, len(thk))
+            lr = np.full(n, np.nan)
+            defl = np.full(n, np.nan)
+
+            scan = np.zeros(n, dtype=bool)       # hit a ply with no NFL, bisection no longer holds
+            panels = np.flatnonzero(lo < hi)
+            while panels.size:
+                mid = (lo[panels] + hi[panels]) // 2
+                passed, lr_ratio, deflection_ratio = self.check(composition, panels, fixed, thk[mid])
+                unknown = np.isnan(lr_ratio)
+                failed = ~passed & ~unknown
+                hi[panels[passed]] = mid[passed]
+                found[panels[passed]] = mid[passed]
+                lr[panels[passed]] = lr_ratio[passed]
+                defl[panels[passed]] = deflection_ratio[passed]
+                lo[panels[failed]] = mid[failed] + 1
+                scan[panels[unknown]] = True
+                panels = panels[(lo[panels] < hi[panels]) & ~scan[panels]]
+
+            # thinnest passing ply left in [lo, hi), skipping plies without an NFL
+            for index in range(len(thk)):
+                panels = np.flatnonzero(scan & (lo <= index) & (index < hi))
+                if panels.size == 0:
+                    continue
+                passed, lr_ratio, deflection_ratio = self.check(composition, panels, fixed, thk[index])
+                panels = panels[passed]
+                hi[panels] = found[panels] = index
+                lr[panels] = lr_ratio[passed]
+                defl[panels] = deflection_ratio[passed]
+                scan[panels] = False
+
+            known = np.minimum(known, found)
+            improved = np.flatnonzero(found < len(thk))
+            if improved.size == 0:
+                continue
+            # a known index carried over from a thinner family was checked with other plies,
+            # and may have no NFL with these
+            recheck = improved[np.isnan(lr[improved])]
+            if recheck.size:
+                passed, lr[recheck], defl[recheck] = self.check(composition, recheck, fixed, thk[found[recheck]])
+                improved = np.setdiff1d(improved, recheck[~passed])
+                if improved.size == 0:
+                    continue
+            self.record(composition, improved, fixed, thk[found[improved]],
+                        fixed_weight + ply_weight[found[improved]], lr[improved], defl[improved])
+
+    def record(self, composition, panels, fixed, thk, weight, lr_ratio, deflection_ratio):
+        searched = "thickness" if composition == "SGU" else "thickness2"
+        self.best_weight[panels] = weight
+        self.best_composition[panels] = composition
+        self.lr_ratio[panels] = lr_ratio
+        self.deflection_ratio[panels] = deflection_ratio
+        fixed = {k: float(v) if isinstance(v, (float, np.floating)) else v for k, v in fixed.items()}
+        for panel, t in zip(panels, thk):
+            params = dict(fixed, **{searched: float(t)})
+            if composition in ("DGU", "LDGU"):
+                params["gap"] = self.gap
+            self.best_params[panel] = params
+
+    def optimize(self):
+        for composition in self.compositions:
+            if composition not in COMPOSITIONS:
+                raise ValueError(f"Unknown glass composition: {composition}")
+            self.check_charts(composition)
+            self.search(composition)
+
+        return {
+            "composition": self.best_composition,
+            "params": self.best_params,
+            "weight": np.where(np.isfinite(self.best_weight), self.best_weight, np.nan),
+            "lr_ratio": self.lr_ratio,
+            "deflection_ratio": self.deflection_ratio
+        }
+
+
+def laminated_chart_nfl(thickness, length, width, support_type, laminated):
+    # every ply read from the laminated charts, so SGU/DGU can be searched with the default charts
+    return chart_nfl(thickness, length, width, support_type, True)
+
+
+def check_off_chart_panels():
+    """
+    Regression check for plies with no NFL in the middle of the thickness range.
+
+    At 845 x 607 mm the laminated charts stop above 8 mm, so bisection over the default
+    thicknesses starts on a ply with no NFL. Raises ValueError unless the search still
+    finds the 5 mm AN found with only the on-chart thicknesses.
+    """
+    expected = {"glass_type": "AN", "thickness": 5.0}
+    for thicknesses in (THICKNESSES, (4.0, 5.0, 6.0, 8.0)):
+        optimizer = GlassMakeupOptimizer([845], [607], [1.0], compositions=("SGU",), thicknesses=thicknesses,
+                                         nfl_lookup=laminated_chart_nfl)
+        params = optimizer.optimize()["params"][0]
+        if params != expected:
+            raise ValueError(f"845 x 607 mm panel with thicknesses {thicknesses}: got {params}, expected {expected}")
+
+
+if __name__ == "__main__":
+    optimizer = GlassMakeupOptimizer([1500, 2400, 3000], [1200, 1200, 1500], [2.0, 3.0, 4.0],
+                                     compositions=("LGU",))
+    result = optimizer.optimize()
+    print(result)
+    check_off_chart_panels()
+    print("Off-chart plies are skipped, not failed")
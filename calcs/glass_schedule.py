@@ -0,0 +1,251 @@
+import csv
+import itertools
+import numpy as np
+from .package import wind_parameters as wp
+from .package import nfl_charts
+from .glass_optimizer import chart_nfl
+from .glass_batch import SGUBatchCalculator, DGUBatchCalculator, LGUBatchCalculator, LDGUBatchCalculator
+
+
+# make-up columns each composition reads from the schedule (same names as the calculator arguments)
+MAKEUP_COLUMNS = {
+    "SGU": ["thickness", "glass_type"],
+    "DGU": ["thickness1", "gap", "thickness2", "glass1_type", "glass2_type"],
+    "LGU": ["thickness1", "thickness_inner", "thickness2", "glass_type"],
+    "LDGU": ["thickness1_1", "thickness_inner", "thickness1_2", "gap", "thickness2", "glass1_type", "glass2_type"],
+}
+TEXT_COLUMNS = ("glass_type", "glass1_type", "glass2_type")
+
+RESULT_COLUMNS = [
+    ("id", str), ("composition", str), ("support_type", str), ("length", float), ("width", float),
+    ("elevation", float), ("zone", str), ("eff_area", float), ("wind_load", float),
+    ("lr", float), ("lr_ratio", float), ("delta", float), ("delta_a", float), ("deflection_ratio", float),
+    ("t_req", float), ("t_pro", float), ("e_req", float), ("e_pro", float), ("status", str),
+]
+
+
+class GlassScheduleRunner:
+    """
+    Glass checks for a whole panel schedule, streamed chunk by chunk.
+
+    Schedule CSV columns:
+        id, length, width (mm), composition (SGU/DGU/LGU/LDGU), elevation (m), zone (1-5 or "Zone N", any case),
+        the make-up columns of MAKEUP_COLUMNS for the composition, and optionally
+        support_type, wind_load (kPa, overrides the wind calculator), nfl / nfl1 / nfl2 (kPa).
+
+    Parameters:
+        wind_calculator : WindLoadCalculator - Source of C&C pressures (optional if every row has wind_load)
+        support_type : str - Default support type for rows without one
+        chunk_size : int - Rows read, checked and written at a time
+        snap_to_levels : bool - Read pressures at the closest selected level, as the glass tab does
+
+    Only one chunk is held in memory, so any number of rows runs in constant memory.
+    Results are rounded like the glass tab report; blank NFLs are read from the charts.
+    """
+
+    def __init__(self, wind_calculator=None, support_type="Four Edges", chunk_size=5000, snap_to_levels=True):
+        self.wind_calculator = wind_calculator
+        self.support_type = support_type
+        self.chunk_size = chunk_size
+        self.snap_to_levels = snap_to_levels
+
+    def read_chunks(self, schedule_path):
+        with open(schedule_path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            reader.fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+            while True:
+                rows = list(itertools.islice(reader, self.chunk_size))
+                if not rows:
+                    return
+                yield rows
+
+    def column(self, rows, name, dtype=float, default=None):
+        values = [(row.get(name) or "").strip() for row in rows]
+        if default is not None:
+            values = [value or default for value in values]
+        try:
+            return np.array(values, dtype=object if dtype is str else float)
+        except ValueError:
+            pass
+        # report the first offending row
+        for row, value in zip(rows, values):
+            if not value:
+                raise ValueError(f"Panel {row.get('id', '?')}: missing '{name}'")
+            try:
+                float(value)
+            except ValueError:
+                raise ValueError(f"Panel {row.get('id', '?')}: invalid {name} '{value}'")
+
+    def nfl_column(self, rows, name, thickness, length, width, support_type, laminated=False):
+        # given NFLs, blanks read from the charts (NaN where no chart covers the panel)
+        nfl = self.column(rows, name, default="nan")
+        thickness = np.broadcast_to(thickness, nfl.shape)
+        missing = np.isnan(nfl)
+        for thk in np.unique(thickness[missing]):
+            mask = missing & (thickness == thk)
+            nfl[mask] = chart_nfl(thk, length[mask], width[mask], support_type, laminated)
+        return nfl
+
+    def calculator(self, composition, rows, length, width, wind_load, support_type):
+        makeup = {
+            name: self.column(rows, name, str if name in TEXT_COLUMNS else float)
+            for name in MAKEUP_COLUMNS[composition]
+        }
+        if composition == "SGU":
+            nfl = self.nfl_column(rows, "nfl", makeup["thickness"], length, width, support_type)
+            return SGUBatchCalculator(length, width, support_type=support_type, wind_load=wind_load, nfl=nfl, **makeup)
+        if composition == "LGU":
+            nominal = nfl_charts.laminated_nominal_thickness_array(
+                makeup["thickness1"], makeup["thickness_inner"], makeup["thickness2"])
+            nfl = self.nfl_column(rows, "nfl", nominal, length, width, support_type, laminated=True)
+            return LGUBatchCalculator(length, width, support_type=support_type, wind_load=wind_load, nfl=nfl, **makeup)
+        if composition == "DGU":
+            nfl1 = self.nfl_column(rows, "nfl1", makeup["thickness1"], length, width, support_type)
+            nfl2 = self.nfl_column(rows, "nfl2", makeup["thickness2"], length, width, support_type)
+            return DGUBatchCalculator(length, width, support_type=support_type, wind_load=wind_load,
+                                      nfl1=nfl1, nfl2=nfl2, **makeup)
+        nominal = nfl_charts.laminated_nominal_thickness_array(
+            makeup["thickness1_1"], makeup["thickness_inner"], makeup["thickness1_2"])
+        nfl1 = self.nfl_column(rows, "nfl1", nominal, length, width, support_type, laminated=True)
+        nfl2 = self.nfl_column(rows, "nfl2", makeup["thickness2"], length, width, support_type)
+        return LDGUBatchCalculator(length, width, support_type=support_type, wind_load=wind_load,
+                                   nfl1=nfl1, nfl2=nfl2, **makeup)
+
+    def wind_loads(self, rows, elevation, eff_area, zone):
+        wind_load = self.column(rows, "wind_load", default="nan")
+        missing = np.isnan(wind_load)
+        if np.any(missing):
+            if self.wind_calculator is None:
+                raise ValueError("Wind load calculator not given and some panels have no wind_load")
+            if np.any(np.isnan(elevation[missing])):
+                panel = np.asarray(self.column(rows, "id", str))[missing & np.isnan(elevation)][0]
+                raise ValueError(f"Panel {panel}: missing 'elevation' (needed without wind_load)")
+            # rounded like get_cladding_pressure, which fills the glass tab's wind load
+            wind_load[missing] = np.round(self.wind_calculator.compute_panel_pressures(
+                elevation[missing], eff_area[missing], zone[missing].astype(str), self.snap_to_levels
+            ), 2)
+        return wind_load
+
+    def compute_chunk(self, rows):
+        # results of one chunk as a dict of columns
+        length = self.column(rows, "length")
+        width = self.column(rows, "width")
+        elevation = self.column(rows, "elevation", default="nan")
+        zone = self.column(rows, "zone", str, default="")
+        composition = np.char.upper(self.column(rows, "composition", str).astype(str))
+        support_type = self.column(rows, "support_type", str, default=self.support_type)
+        # same effective area as the glass tab
+        eff_area = np.round(wp.eff_area_array(length / 1000, width / 1000), 1)
+        wind_load = self.wind_loads(rows, elevation, eff_area, zone)
+
+        result = {name: np.full(len(rows), np.nan) for name, dtype in RESULT_COLUMNS if dtype is float}
+        result.update(id=self.column(rows, "id", str), composition=composition, support_type=support_type,
+                      length=length, width=width, elevation=elevation, zone=zone,
+                      eff_area=eff_area, wind_load=wind_load)
+
+        for comp, support in set(zip(composition, support_type)):
+            if comp not in MAKEUP_COLUMNS:
+                raise ValueError(f"Unknown glass composition: {comp}")
+            index = np.flatnonzero((composition == comp) & (support_type == support))
+            calculator = self.calculator(comp, [rows[i] for i in index], length[index], width[index],
+                                         wind_load[index], support)
+            summary = calculator.summary()
+            lr, deflection, bite = summary["load_resistance"], summary["deflection"], summary["silicone_bite"]
+            result["lr"][index] = np.round(lr["lr"], 1)
+            result["lr_ratio"][index] = np.round(lr["ratio"], 2)
+            result["delta"][index] = np.round(deflection["delta"], 2)
+            result["delta_a"][index] = np.round(deflection["delta_a"], 2)
+            result["deflection_ratio"][index] = np.round(deflection["ratio"], 2)
+            for name in ("t_req", "t_pro", "e_req", "e_pro"):
+                result[name][index] = np.round(bite[name], 2)
+
+        # NaN deflection = load too light for the deflection equation; NaN LR = no NFL available
+        passed = (result["lr_ratio"] <= 1) & ~(result["deflection_ratio"] > 1)
+        result["status"] = np.where(np.isnan(result["lr_ratio"]), "NO NFL", np.where(passed, "OK", "NG"))
+        return result
+
+    def run(self, schedule_path, output_path, output_format=None):
+        """
+        Check every panel of schedule_path and write one result row per panel to output_path.
+        output_format is "csv" or "parquet" (needs pyarrow), by default taken from the file extension.
+        Returns the panel count, the failing panel count and the governing ratios.
+        """
+        output_format = output_format or ("parquet" if output_path.lower().endswith(".parquet") else "csv")
+        if output_format == "csv":
+            writer = CSVResultWriter(output_path)
+        elif output_format == "parquet":
+            writer = ParquetResultWriter(output_path)
+        else:
+            raise ValueError(f"Unknown output format: {output_format}")
+
+        stats = {"panels": 0, "failed": 0, "no_nfl": 0, "max_lr_ratio": 0.0, "max_deflection_ratio": 0.0}
+        with writer:
+            for rows in self.read_chunks(schedule_path):
+                result = self.compute_chunk(rows)
+                writer.write(result)
+                stats["panels"] += len(rows)
+                stats["failed"] += int(np.sum(result["status"] == "NG"))
+                stats["no_nfl"] += int(np.sum(result["status"] == "NO NFL"))
+                stats["max_lr_ratio"] = max(stats["max_lr_ratio"], float(np.nanmax(result["lr_ratio"], initial=0)))
+                stats["max_deflection_ratio"] = max(
+                    stats["max_deflection_ratio"], float(np.nanmax(result["deflection_ratio"], initial=0)))
+        return stats
+
+
+class CSVResultWriter:
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self.file = open(self.path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([name for name, _ in RESULT_COLUMNS])
+        return self
+
+    def write(self, result):
+        columns = [
+            np.where(np.isnan(result[name]), "", result[name].astype(str)).tolist() if dtype is float
+            else result[name].tolist()
+            for name, dtype in RESULT_COLUMNS
+        ]
+        self.writer.writerows(zip(*columns))
+
+    def __exit__(self, *exc):
+        self.file.close()
+
+
+class ParquetResultWriter:
+    # one row group per chunk
+    def __init__(self, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output needs pyarrow (pip install pyarrow); use a .csv output instead")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.schema = pyarrow.schema([
+            (name, pyarrow.float64() if dtype is float else pyarrow.string()) for name, dtype in RESULT_COLUMNS
+        ])
+
+    def __enter__(self):
+        self.writer = self.pq.ParquetWriter(self.path, self.schema)
+        return self
+
+    def write(self, result):
+        arrays = [
+            self.pa.array(result[name], type=field.type, from_pandas=True)
+            if dtype is float else self.pa.array([str(v) for v in result[name]], type=field.type)
+            for (name, dtype), field in zip(RESULT_COLUMNS, self.schema)
+        ]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def __exit__(self, *exc):
+        self.writer.close()
+
+
+if __name__ == "__main__":
+    import sys
+    runner = GlassScheduleRunner()
+    print(runner.run(sys.argv[1], sys.argv[2]))
@@ -0,0 +1,159 @@
+import numpy as np
+from .conn import ConnCalculator
+from .fixing_schedule import FixingScheduleRunner
+
+
+LOAD_TYPES = ("D", "L", "Lr", "S", "W")
+# load direction at the connection: wind across the facade (y), the rest gravity (z)
+LOAD_DIRECTIONS = {"D": "z", "L": "z", "Lr": "z", "S": "z", "W": "y"}
+
+# strength design combinations (BNBC 2020 / ASCE 7-05, nominal wind at 1.6)
+COMBINATIONS = (
+    ("1.4D", {"D": 1.4}),
+    ("1.2D + 1.6L + 0.5Lr", {"D": 1.2, "L": 1.6, "Lr": 0.5}),
+    ("1.2D + 1.6L + 0.5S", {"D": 1.2, "L": 1.6, "S": 0.5}),
+    ("1.2D + 1.6Lr + L", {"D": 1.2, "Lr": 1.6, "L": 1.0}),
+    ("1.2D + 1.6Lr + 0.8W", {"D": 1.2, "Lr": 1.6, "W": 0.8}),
+    ("1.2D + 1.6S + L", {"D": 1.2, "S": 1.6, "L": 1.0}),
+    ("1.2D + 1.6S + 0.8W", {"D": 1.2, "S": 1.6, "W": 0.8}),
+    ("1.2D + 1.6W + L + 0.5Lr", {"D": 1.2, "W": 1.6, "L": 1.0, "Lr": 0.5}),
+    ("1.2D + 1.6W + L + 0.5S", {"D": 1.2, "W": 1.6, "L": 1.0, "S": 0.5}),
+    ("0.9D + 1.6W", {"D": 0.9, "W": 1.6}),
+)
+
+
+def envelope(ratios, names):
+    """
+    Governing value of every check over the combinations.
+
+    Parameters:
+        ratios : dict - check -> array (combinations, ...) of ratios, NaN where not applicable
+        names : list - Combination names, in the order of the first axis
+    Returns check -> {"ratio": max ratio, "combination": controlling combination name},
+    both arrays over the remaining axes (None where a check never applies).
+    """
+    names = np.asarray(names)
+    result = {}
+    for check, values in ratios.items():
+        values = np.asarray(values, dtype=float)
+        applies = ~np.all(np.isnan(values), axis=0)
+        index = np.argmax(np.where(np.isnan(values), -np.inf, values), axis=0)
+        ratio = np.take_along_axis(values, index[np.newaxis], axis=0)[0]
+        result[check] = {
+            "ratio": np.where(applies, ratio, np.nan),
+            "combination": np.where(applies, names[index], None),
+        }
+    return result
+
+
+class LoadCombinationEngine:
+    """
+    Factored loads for every strength combination at once, and the governing check
+    envelope of the connection (ConnCalculator) and fixing (box / U clump) calculators.
+
+    Parameters:
+        dead_load : float/array - Service dead load (kN)
+        wind_load : float/array - Service wind load (kN)
+        other_loads : dict - Other service loads by type, any of "L", "Lr", "S" (kN)
+        combinations : tuple - (name, {load type: factor}) pairs
+
+    Loads may be arrays (one entry per connection / bracket); factored loads then have the
+    shape (combinations, connections). The calculators get the factored loads of every
+    combination in one stacked array instead of one run per combination.
+    """
+
+    def __init__(self, dead_load, wind_load=0.0, other_loads=None, combinations=COMBINATIONS):
+        loads = dict(other_loads or {}, D=dead_load, W=wind_load)
+        unknown = set(loads) - set(LOAD_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown load type(s): {', '.join(sorted(unknown))}")
+        self.combinations = combinations
+        self.names = [name for name, _ in combinations]
+
+        # (combinations, load types) factor matrix times (load types, connections) loads
+        self.factors = np.array([[factors.get(t, 0.0) for t in LOAD_TYPES] for _, factors in combinations])
+        loads = np.broadcast_arrays(*(np.asarray(loads.get(t, 0.0), dtype=float) for t in LOAD_TYPES))
+        self.shape = loads[0].shape
+        self.loads = np.stack([load.ravel() for load in loads])
+
+    @classmethod
+    def from_wind(cls, wind_calculator, elevation, eff_area, zone, trib_area, dead_load,
+                    other_loads=None, combinations=COMBINATIONS, snap_to_levels=True):
+        """
+        Wind load from the WindLoadCalculator C&C pressure over each connection's
+        tributary area (m²); other arguments as the constructor.
+        """
+        pressure = wind_calculator.compute_panel_pressures(elevation, eff_area, zone, snap_to_levels)
+        return cls(dead_load, pressure * np.asarray(trib_area, dtype=float), other_loads, combinations)
+
+    def factored(self, direction=None):
+        # factored load of every combination (kN), shape (combinations,) + load shape
+        mask = np.array([direction is None or LOAD_DIRECTIONS[t] == direction for t in LOAD_TYPES])
+        return ((self.factors * mask) @ self.loads).reshape((len(self.names),) + self.shape)
+
+    def conn_ratios(self, screw_config, t1, t2, t1_grade, t2_grade, dia, screw_length, head_dia):
+        """
+        ConnCalculator check ratios for every combination, shape (combinations,) + load shape.
+        Capacities do not depend on the load, so they are taken from one ConnCalculator
+        and the design loads of _design_load are applied to all combinations at once.
+        """
+        conn = ConnCalculator(screw_config, t1, t2, t1_grade, t2_grade, dia, screw_length, head_dia, 0, 0)
+        n = conn.no_of_screw()
+        R_y = self.factored("y") / n
+        R_z = self.factored("z") / n
+        Vu = np.hypot(R_y, R_z)
+        Tu = R_z
+
+        phi_P_nv = conn.evaluate("shear_tilting")["phi_P_nv"]
+        pullover = conn.evaluate("comb_shear_pullover")
+        pullout = conn.evaluate("comb_shear_pullout")
+        ratios = {
+            "shear_tilting": Vu / phi_P_nv if phi_P_nv is not None else np.full(Vu.shape, np.nan),
+            "pullout_tension": Tu / conn.evaluate("pullout_tension")["phi_P_not"],
+            "pullover_tension": Tu / conn.evaluate("pullover_tension")["phi_P_nov"],
+        }
+        if pullover["P_nv"] is not None:
+            ratios["comb_shear_pullover"] = Vu / pullover["P_nv"] + 0.71 * Tu / pullover["P_nov"]
+            ratios["comb_shear_pullout"] = Vu / pullout["P_nv"] + Tu / pullout["P_not"]
+        else:
+            ratios["comb_shear_pullover"] = ratios["comb_shear_pullout"] = np.full(Vu.shape, np.nan)
+        return ratios
+
+    def fixing_ratios(self, bracket=None, vectorized=True):
+        """
+        Fixing check ratios for every combination, shape (combinations,) + load shape.
+        The factored wind and gravity loads replace the bracket's wind_load / dead_load.
+        vectorized runs the anchor checks of all combinations in one NumPy pass
+        (FixingScheduleRunner.run_anchors); otherwise every check of the full
+        fixing calculator is run per combination.
+        """
+        bracket = dict(bracket or {})
+        R_y, R_z = self.factored("y").ravel(), self.factored("z").ravel()
+        rows = [dict(bracket, wind_load=float(y), dead_load=float(z)) for y, z in zip(R_y, R_z)]
+        runner = FixingScheduleRunner(max_workers=1)
+        results = runner.run_anchors(rows) if vectorized else runner.run(rows)
+
+        checks = {check for r in results for check in r} - {
+            "id", "fixing_type", "governing_check", "governing_ratio", "status", "error"
+        }
+        shape = (len(self.names),) + self.shape
+        return {
+            check: np.array([r.get(check, np.nan) for r in results], dtype=float).reshape(shape)
+            for check in sorted(checks)
+        }
+
+    def conn_envelope(self, *args, **kwargs):
+        return envelope(self.conn_ratios(*args, **kwargs), self.names)
+
+    def fixing_envelope(self, bracket=None, vectorized=True):
+        return envelope(self.fixing_ratios(bracket, vectorized), self.names)
+
+
+if __name__ == "__main__":
+    engine = LoadCombinationEngine(dead_load=[0.57, 0.8], wind_load=[1.0, 1.4], other_loads={"L": 0.2})
+    for check, governing in engine.conn_envelope("Option 2", 3.5, 2.5, "6063-T6", "6063-T6", 4.8, 25, 10.5).items():
+        print(check, governing["ratio"].round(2), governing["combination"])
+
+    engine = LoadCombinationEngine(dead_load=8.0, wind_load=18.75)
+    for check, governing in engine.fixing_envelope({"fixing_type": "u"}).items():
+        print(check, round(float(governing["ratio"]), 2), governing["combination"])
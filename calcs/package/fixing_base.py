@@ -1,10 +1,24 @@
 # import material_properties as mp
 from calcs.package import material_properties as mp
+import functools
 import math
 
 PI = math.pi
 inf = 1e10
 
+
+def memoized(method):
+    # Cache a check's result on the instance. Inputs are fixed once the calculator
+    # is built, so every check (and every check it calls) is evaluated once.
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        key = (method.__name__,) + args
+        cache = self.__dict__.setdefault("_memo", {})
+        if key not in cache:
+            cache[key] = method(self, *args)
+        return cache[key]
+    return wrapper
+
 class AnchorCalculator():
     def __init__(self, N_ua, N_ug, V_ua, V_ug, tension_ecc, shear_ecc,
                     A_NC, A_VC, bp_length, bp_width, profile_depth, profile_width, steel_grade,
@@ -54,7 +68,9 @@ class AnchorCalculator():
         self.f_uta = min(860, 1.9 * self.anchor_fy, self.anchor_fu)
         self.anchor_head_dia = self.anchor_dia * 1.7
         self.A_brg = (PI / 4) * self.anchor_head_dia**2
+        self.lamda = 1.0 if self.conc_weight_type == "normal" else 0.75
 
+    @memoized
     def steel_strength_tension(self):
         phi = 0.75
         phi_N_sa = phi * self.A_seN * self.f_uta / 1000
@@ -69,6 +85,7 @@ class AnchorCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def concrete_breakout_tension(self):
         phi, k_c = (0.7, 10) if self.install_type == "cast-in" else (0.65, 7)
         A_NCO = 9 * self.embed_depth**2
@@ -82,7 +99,6 @@ class AnchorCalculator():
             psi_cN = 1.0
 
         psi_cpN = 1.0  # factor for spliting
-        self.lamda = 1.0 if self.conc_weight_type == "normal" else 0.75
         N_b = k_c * self.lamda * self.f_c**0.5 * self.embed_depth**1.5
         phi_N_cbg = phi * (self.A_NC / A_NCO) * psi_ecN * psi_edN * psi_cN * psi_cpN * N_b / 1000
         ratio = self.N_ug / phi_N_cbg
@@ -104,6 +120,7 @@ class AnchorCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def pullout_strength_tension(self):
         phi = 0.7
         psi_cp = 1.0 if self.conc_condition == "cracked" else 1.4
@@ -124,6 +141,7 @@ class AnchorCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def sideface_blowout_tension(self):
         phi = 0.7
         N_sb = (13 * self.C_a1 * self.A_brg**0.5) * self.lamda * self.f_c**0.5
@@ -140,6 +158,7 @@ class AnchorCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def steel_strength_shear(self):
         phi = 0.65
         phi_V_sa = phi * 0.6 * self.A_seN * self.f_uta / 1000
@@ -154,6 +173,7 @@ class AnchorCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def concrete_breakout_shear(self):
         phi = 0.7
         A_VCO = 4.5 * self.C_a1**2
@@ -161,7 +181,7 @@ class AnchorCalculator():
         psi_edV = min(0.7 + ((0.3 * self.C_a2) / (1.5 * self.C_a1)), 1)
         psi_cV = 1.0 if self.conc_condition == "cracked" else 1.4
         psi_hV = max(((1.5 * self.C_a1) / self.conc_depth) ** 0.5, 1)
-        lamda = 1.0 if self.conc_weight_type == "normal" else 0.75
+        lamda = self.lamda
         l_e = min(self.embed_depth, 8 * self.anchor_dia)
         V_b = 0.6 * ((l_e / self.anchor_dia) ** 0.2) * lamda * (self.anchor_dia * self.f_c) ** 0.5 * (self.C_a1**1.5)
         phi_V_cbg = phi * (self.A_VC / A_VCO) * psi_ecV * psi_edV * psi_cV * psi_hV * V_b / 1000
@@ -185,6 +205,7 @@ class AnchorCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def pryout_strength_shear(self):
         phi = 0.7
         phi_t = 0.7 if self.install_type == "cast-in" else 0.65
@@ -202,6 +223,7 @@ class AnchorCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def anchor_interaction(self):
         zeta = 1.67
         tension_ratios = [
@@ -228,6 +250,7 @@ class AnchorCalculator():
             "beta_u": round(beta_u, 2)
         }
 
+    @memoized
     def anchor_torque(self):
         nut_factor = 0.2
         proof_strength = 0.9 * self.anchor_fy
@@ -263,6 +286,7 @@ class BasePlateCalculator():
         self.steel_fy, self.steel_fu = mp.steel_strength(self.steel_grade)
         self.f_c = mp.concrete_strength(self.conc_grade)
 
+    @memoized
     def bp_thk_bearing(self):
         phi = 0.9
         # m, n is different for I, HSS. consider this too
@@ -294,6 +318,7 @@ class BasePlateCalculator():
             "t": round(self.t_br, 2)
         }
     
+    @memoized
     def bp_thk_tension(self):
         phi = 0.9
         x = ((self.bp_length - self.profile_depth) / 2) - self.ed1     # anchor center to flange edge distance (mm)
@@ -314,6 +339,7 @@ class BasePlateCalculator():
             "t": round(self.t_tn, 2)
         }
     
+    @memoized
     def bp_thk_pro(self):
         t_br = self.bp_thk_bearing()["t"]
         t_tn = self.bp_thk_tension()["t"]
@@ -323,6 +349,7 @@ class BasePlateCalculator():
             "t_pro": t_pro
         }
     
+    @memoized
     def req_bp_area(self, Y):
         phi = 0.65
         area = self.compression_load / (phi * 0.85 * self.f_c)
@@ -336,6 +363,7 @@ class BasePlateCalculator():
             "area_p": round(area_p, 2)
         }
 
+    @memoized
     def conc_bearing_stress(self):  #recheck
         phi = 0.65
         A1 = A2 = self.bp_length * self.bp_width     # effective plate area (mm^2) (A1 = A2, conservative)
@@ -383,7 +411,10 @@ class FinPlateCalculator():
         self.steel_fy, self.steel_fu = mp.steel_strength(self.steel_grade)
         self.weld_fy, self.weld_fu = mp.electrode_strength(self.weld_grade)
         self.A_seN = mp.eff_tensile_area(self.bolt_dia)
+        self.d_hole = self.bolt_dia + 2      # diameter of hole
+        self.fin_thk = self.fin_plate_thk()["t_pro"]
 
+    @memoized
     def fin_plate_load(self):
         Vh = self.h_shear_load / 2
         Vv = self.v_shear_load / 2
@@ -395,6 +426,7 @@ class FinPlateCalculator():
             "Vu": round(Vu, 2)
         }
 
+    @memoized
     def fin_plate_thk(self):
         phi = 0.9
         Mu = self.fin_plate_load()["Vv"] * self.v_shear_ecc
@@ -412,9 +444,9 @@ class FinPlateCalculator():
             "t_pro": round(t_pro, 2)
         }
     
+    @memoized
     def fin_plate_shear_strength_yield(self):
         phi = 1.0
-        self.fin_thk = self.fin_plate_thk()["t_pro"]
         A_gv = self.fin_width * self.fin_thk
         phi_R_n = phi * 0.6 * self.steel_fy * A_gv / 1000
         
@@ -428,9 +460,9 @@ class FinPlateCalculator():
             "Vu": self.fin_plate_load()["Vu"]
         }
     
+    @memoized
     def fin_plate_shear_strength_rupture(self):
         phi = 0.75
-        self.d_hole = self.bolt_dia + 2      # diameter of hole
         A_nv = (self.fin_width - self.n_bolt * self.d_hole) * self.fin_thk
         phi_R_n = phi * 0.6 * self.steel_fu * A_nv
 
@@ -446,6 +478,7 @@ class FinPlateCalculator():
             "Vu": self.fin_plate_load()["Vu"]
         }
     
+    @memoized
     def fin_plate_block_shear_strength(self):
         phi = 0.75
         b_gv = self.fin_width - self.ed2_f
@@ -479,6 +512,7 @@ class FinPlateCalculator():
         }
     
     
+    @memoized
     def fin_weld_load(self):
         Pu = self.h_shear_load / 2       # 2 fin
         weld_length = 2 * self.fin_width
@@ -506,6 +540,7 @@ class FinPlateCalculator():
             "f_R": round(f_R, 2)
         }
     
+    @memoized
     def fin_weld_resistance(self):
         phi = 0.75
         phi_R_n = phi * 0.6 * self.weld_fu * 0.707 * self.leg_length
@@ -519,6 +554,7 @@ class FinPlateCalculator():
         }
     
     
+    @memoized
     def bolt_load(self):
         Vh = self.h_shear_load / (2 * self.n_bolt)
         Vv = self.v_shear_load / (2 * self.n_bolt)
@@ -530,6 +566,7 @@ class FinPlateCalculator():
             "Vu": round(Vu, 2)
         }
     
+    @memoized
     def bolt_shear_resistance(self):
         phi = 0.75
         F_nv = 0.4 * self.bolt_fu
@@ -549,6 +586,7 @@ class FinPlateCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def bolt_bearing_resistance(self):
         phi = 0.75
         l_c = min(self.ed1_f, self.ed2_f, self.ed3_f, self.s1, self.s2)
@@ -571,6 +609,7 @@ class FinPlateCalculator():
             "ratio": round(ratio, 2)
         }
     
+    @memoized
     def bolt_torque(self):
         nut_factor = 0.2
         proof_strength = 0.9 * self.bolt_fy
@@ -0,0 +1,377 @@
+import sys
+import os
+import glob
+import json
+import hashlib
+import numpy as np
+
+
+def resource_path(relative_path):
+    if hasattr(sys, "_MEIPASS"):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.join(os.path.abspath("."), relative_path)
+
+
+CHART_DIR = resource_path("ui/assets/images/glass-load-charts")
+SUPPORT_DIRS = {
+    "Four Edges": "four-edge",
+    "Three Edges": "three-edge",
+    "Two Edges": "two-edge",
+    "One Edge": "one-edge",
+}
+LAMINATED_THICKNESSES = [5, 6, 8, 10, 12, 16, 19]
+GRID_STEP = 20      # mm, spacing of the regular lookup grid
+
+# Gridded charts persisted next to the CSVs: one flat .npy (memory-mapped) + a JSON manifest
+CACHE_PATH = os.path.join(CHART_DIR, "nfl_grids.npy")
+MANIFEST_PATH = os.path.join(CHART_DIR, "nfl_grids.json")
+CACHE_VERSION = 2
+
+_charts = {}        # (laminated, support_type, thickness) -> NFLChart
+_cache_loaded = False
+
+
+class NFLChart:
+    """
+    Non-factored load chart resampled onto a regular grid, looked up by bilinear interpolation.
+
+    Four edge charts:       x = long side (mm),  y = short side (mm)
+    One/two edge charts:    x = thickness (mm),  y = span (mm)
+    Grid cells outside the digitized chart are NaN.
+    """
+
+    def __init__(self, x_axis, y_axis, grid):
+        self.x_axis = x_axis
+        self.y_axis = y_axis
+        self.grid = grid        # shape (len(x_axis), len(y_axis)), NFL in kPa
+
+    def lookup(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        nx, ny = len(self.x_axis), len(self.y_axis)
+
+        # fractional grid coordinates (axes may be irregular, e.g. thickness)
+        fx = np.interp(x, self.x_axis, np.arange(nx), left=np.nan, right=np.nan)
+        fy = np.interp(y, self.y_axis, np.arange(ny), left=np.nan, right=np.nan)
+        inside = ~(np.isnan(fx) | np.isnan(fy))
+
+        i = np.clip(np.floor(np.where(inside, fx, 0)).astype(int), 0, max(nx - 2, 0))
+        j = np.clip(np.floor(np.where(inside, fy, 0)).astype(int), 0, max(ny - 2, 0))
+        tx = np.where(inside, fx, 0) - i
+        ty = np.where(inside, fy, 0) - j
+        i1 = np.minimum(i + 1, nx - 1)
+        j1 = np.minimum(j + 1, ny - 1)
+
+        # blend only the corners that carry weight and lie on the chart: a zero-weight
+        # corner off its curve (on a grid line, at a curve end) must not turn 0 * NaN
+        # into NaN, and a cell cut by the chart edge is averaged over its finite corners
+        g = self.grid
+        corners = [
+            ((1 - tx) * (1 - ty), g[i, j]),
+            (tx * (1 - ty), g[i1, j]),
+            ((1 - tx) * ty, g[i, j1]),
+            (tx * ty, g[i1, j1]),
+        ]
+        total = np.zeros(np.shape(tx))
+        weight = np.zeros(np.shape(tx))
+        for w, value in corners:
+            use = (w > 0) & np.isfinite(value)
+            total += np.where(use, w * np.where(use, value, 0), 0)
+            weight += np.where(use, w, 0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            nfl = total / weight
+        return np.where(inside & (weight > 0), nfl, np.nan)
+
+
+def load_chart_points(path):
+    data = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+    return data[:, 0], data[:, 1], data[:, 2]
+
+
+def extend_edges(grid, axis):
+    # one more node past both ends of every grid line along axis, extrapolated in log(NFL),
+    # so a chart point between the last node on its curve and the next one has finite
+    # corners on both sides. Lookups may therefore reach up to one grid step past a curve end.
+    log_grid = np.moveaxis(np.log(grid), axis, -1)
+    for line in log_grid.reshape(-1, log_grid.shape[-1]):
+        finite = np.flatnonzero(np.isfinite(line))
+        if len(finite) == 0:
+            continue
+        lo, hi = finite[0], finite[-1]
+        if lo > 0:
+            line[lo - 1] = 2 * line[lo] - line[lo + 1] if lo < hi else line[lo]
+        if hi < len(line) - 1:
+            line[hi + 1] = 2 * line[hi] - line[hi - 1] if lo < hi else line[hi]
+    return np.exp(np.moveaxis(log_grid, -1, axis))
+
+
+def grid_iso_load_curves(x, y, z, step=GRID_STEP):
+    # Four edge charts: each z value is one iso-load curve of short side vs long side.
+    # At every long side the curves give (short side, NFL) pairs, interpolated in log(NFL).
+    x_axis = np.arange(0, np.ceil(x.max() / step) * step + step, step, dtype=float)
+    y_axis = np.arange(0, np.ceil(min(x.max(), y.max()) / step) * step + step, step, dtype=float)
+
+    # the chart is symmetric about its diagonal; mirroring each curve extends it above the diagonal
+    x, y, z = np.concatenate([x, y]), np.concatenate([y, x]), np.concatenate([z, z])
+
+    levels = np.unique(z)
+    curve_y = np.empty((len(levels), len(x_axis)))
+    for k, level in enumerate(levels):
+        mask = z == level
+        order = np.argsort(x[mask])
+        # left of the curve its short side would exceed the chart, so it bounds nothing there
+        curve_y[k] = np.interp(x_axis, x[mask][order], y[mask][order], left=np.inf, right=np.nan)
+
+    grid = np.full((len(x_axis), len(y_axis)), np.nan)
+    log_levels = np.log(levels)
+    for i in range(len(x_axis)):
+        valid = np.isfinite(curve_y[:, i])
+        if valid.sum() < 2:
+            continue
+        order = np.argsort(curve_y[valid, i])
+        grid[i] = np.exp(np.interp(
+            y_axis, curve_y[valid, i][order], log_levels[valid][order], left=np.nan, right=np.nan
+        ))
+    return x_axis, y_axis, extend_edges(extend_edges(grid, 1), 0)
+
+
+def grid_thickness_curves(x, y, z, step=GRID_STEP):
+    # One/two edge charts: one NFL vs span curve per thickness, interpolated in log(NFL)
+    x_axis = np.unique(x)
+    y_axis = np.arange(0, np.ceil(y.max() / step) * step + step, step, dtype=float)
+
+    grid = np.full((len(x_axis), len(y_axis)), np.nan)
+    for i, thk in enumerate(x_axis):
+        mask = x == thk
+        order = np.argsort(y[mask])
+        grid[i] = np.exp(np.interp(
+            y_axis, y[mask][order], np.log(z[mask][order]), left=np.nan, right=np.nan
+        ))
+    # thickness rows are exact chart curves, so only the span direction is extended
+    return x_axis, y_axis, extend_edges(grid, 1)
+
+
+def chart_csv_path(laminated, support_type, thickness):
+    if support_type not in SUPPORT_DIRS:
+        raise ValueError(f"Unknown support type: {support_type}")
+    base_path = os.path.join(CHART_DIR, "laminated" if laminated else "monolithic", SUPPORT_DIRS[support_type])
+    if support_type in ("Four Edges", "Three Edges"):
+        return os.path.join(base_path, f"{float(thickness)}mm.csv")
+    return os.path.join(base_path, "all-thk.csv")
+
+
+def build_chart(laminated, support_type, thickness):
+    path = chart_csv_path(laminated, support_type, thickness)
+    if not os.path.exists(path):
+        kind = "laminated" if laminated else "monolithic"
+        raise ValueError(f"No digitized NFL chart for {thickness} mm {kind} glass ({support_type})")
+
+    x, y, z = load_chart_points(path)
+    if support_type in ("Four Edges", "Three Edges"):
+        return NFLChart(*grid_iso_load_curves(x, y, z))
+    return NFLChart(*grid_thickness_curves(x, y, z))
+
+
+def chart_key(laminated, support_type, thickness):
+    # one chart file covers every thickness for one/two edge supports
+    return (bool(laminated), support_type, float(thickness) if support_type in ("Four Edges", "Three Edges") else None)
+
+
+def get_chart(laminated, support_type, thickness):
+    if not _cache_loaded:
+        load_cache()
+    key = chart_key(laminated, support_type, thickness)
+    if key not in _charts:
+        _charts[key] = build_chart(laminated, support_type, thickness)
+    return _charts[key]
+
+
+def _file_sha1(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _source_info(path):
+    stat = os.stat(path)
+    return {"mtime": stat.st_mtime, "size": stat.st_size, "sha1": _file_sha1(path)}
+
+
+def _manifest_is_current(manifest):
+    if manifest.get("version") != CACHE_VERSION or manifest.get("grid_step") != GRID_STEP:
+        return False
+
+    sources = {os.path.relpath(chart_csv_path(*key), CHART_DIR) for key in available_charts()}
+    if sources != {entry["source"] for entry in manifest["charts"]}:
+        return False
+
+    touched = False
+    for entry in manifest["charts"]:
+        path = os.path.join(CHART_DIR, entry["source"])
+        stat = os.stat(path)
+        if stat.st_mtime == entry["mtime"] and stat.st_size == entry["size"]:
+            continue
+        # touched but possibly unchanged: only the content hash decides
+        if _file_sha1(path) != entry["sha1"]:
+            return False
+        entry["mtime"] = stat.st_mtime
+        touched = True
+
+    if touched:
+        try:
+            with open(MANIFEST_PATH, "w") as f:
+                json.dump(manifest, f, indent=1)
+        except OSError:
+            pass
+    return True
+
+
+def build_cache():
+    # Grid every digitized chart and write them to CACHE_PATH / MANIFEST_PATH
+    blocks, entries, offset = [], [], 0
+    for key in available_charts():
+        chart = build_chart(*key)
+        path = chart_csv_path(*key)
+        entries.append({
+            "laminated": key[0],
+            "support_type": key[1],
+            "thickness": key[2],
+            "source": os.path.relpath(path, CHART_DIR),
+            **_source_info(path),
+            "offset": offset,
+            "nx": len(chart.x_axis),
+            "ny": len(chart.y_axis),
+        })
+        block = np.concatenate([chart.x_axis, chart.y_axis, chart.grid.ravel()])
+        blocks.append(block)
+        offset += block.size
+
+    data = np.concatenate(blocks) if blocks else np.empty(0)
+    manifest = {"version": CACHE_VERSION, "grid_step": GRID_STEP, "charts": entries}
+
+    # write to temporary files first so a half-written cache is never picked up
+    np.save(CACHE_PATH + ".tmp.npy", data)
+    with open(MANIFEST_PATH + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(CACHE_PATH + ".tmp.npy", CACHE_PATH)
+    os.replace(MANIFEST_PATH + ".tmp", MANIFEST_PATH)
+    return manifest
+
+
+def load_cache():
+    # Map the persisted grids into _charts, rebuilding the cache first if any CSV changed
+    global _cache_loaded
+    _cache_loaded = True
+
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+        current = os.path.exists(CACHE_PATH) and _manifest_is_current(manifest)
+    except (OSError, ValueError, KeyError):
+        current = False
+
+    try:
+        if not current:
+            manifest = build_cache()
+        data = np.load(CACHE_PATH, mmap_mode="r")
+    except OSError:
+        return      # read-only install: charts are gridded in memory on demand
+
+    for entry in manifest["charts"]:
+        start, nx, ny = entry["offset"], entry["nx"], entry["ny"]
+        x_axis = np.asarray(data[start:start + nx])
+        y_axis = np.asarray(data[start + nx:start + nx + ny])
+        grid = data[start + nx + ny:start + nx + ny + nx * ny].reshape(nx, ny)
+        key = chart_key(entry["laminated"], entry["support_type"], entry["thickness"] or 0)
+        _charts[key] = NFLChart(x_axis, y_axis, grid)
+
+
+def available_charts():
+    # (laminated, support_type, thickness or None) for every digitized chart on disk
+    charts = []
+    for laminated in (True, False):
+        for support_type in SUPPORT_DIRS:
+            pattern = os.path.dirname(chart_csv_path(laminated, support_type, 0)) + "/*.csv"
+            for path in sorted(glob.glob(pattern)):
+                name = os.path.basename(path)
+                thickness = None if name == "all-thk.csv" else float(name[:-len("mm.csv")])
+                charts.append((laminated, support_type, thickness))
+    return charts
+
+
+def laminated_nominal_thickness(thickness1, thickness_inner, thickness2):
+    # laminated charts are drawn for nominal make-ups; pick the closest one
+    total = thickness1 + thickness_inner + thickness2
+    return min(LAMINATED_THICKNESSES, key=lambda t: abs(t - total))
+
+
+def laminated_nominal_thickness_array(thickness1, thickness_inner, thickness2):
+    total = np.asarray(thickness1, dtype=float) + thickness_inner + thickness2
+    nominal = np.array(LAMINATED_THICKNESSES, dtype=float)
+    # argmin keeps the first (thinner) nominal on ties, like min() above
+    return nominal[np.argmin(np.abs(total[..., None] - nominal), axis=-1)]
+
+
+def nfl_lookup(thickness, length, width, support_type="Four Edges", laminated=False, strict=True):
+    """
+    Non-factored load (kPa) read from the digitized ASTM E1300 charts.
+
+    Parameters:
+        thickness : float - Nominal glass thickness (mm)
+        length, width : float or array - Panel dimensions (mm), in any order
+        support_type : str - "Four Edges", "Three Edges", "Two Edges" or "One Edge"
+        laminated : bool - Use laminated instead of monolithic charts
+        strict : bool - Raise ValueError for panels outside the chart (otherwise NaN)
+
+    One/two edge charts are read with the long side as span (conservative).
+    """
+    chart = get_chart(laminated, support_type, thickness)
+    long_side = np.maximum(length, width)
+    short_side = np.minimum(length, width)
+
+    if support_type in ("Four Edges", "Three Edges"):
+        nfl = chart.lookup(long_side, short_side)
+    else:
+        nfl = chart.lookup(np.full_like(np.asarray(long_side, dtype=float), float(thickness)), long_side)
+
+    if strict and np.any(np.isnan(nfl)):
+        raise ValueError(
+            f"Glass size outside the {thickness} mm NFL chart ({support_type}); read NFL manually"
+        )
+    return float(nfl) if np.ndim(nfl) == 0 else nfl
+
+
+def check_charts(tolerance=0.05):
+    """
+    Read every digitized CSV point back through its gridded chart.
+
+    Parameters:
+        tolerance : float - Largest accepted relative error of a point's NFL
+
+    Returns the worst relative error; raises ValueError for a point that reads NaN
+    (off the chart) or misses its load by more than tolerance.
+    """
+    worst = 0.0
+    for key in available_charts():
+        x, y, z = load_chart_points(chart_csv_path(*key))
+        chart = get_chart(*key)
+        if key[1] in ("Four Edges", "Three Edges"):
+            nfl = chart.lookup(np.maximum(x, y), np.minimum(x, y))
+        else:
+            nfl = chart.lookup(x, y)
+
+        error = np.abs(nfl / z - 1)
+        bad = np.isnan(error) | (error > tolerance)
+        if bad.any():
+            k = np.flatnonzero(bad)[0]
+            raise ValueError(
+                f"NFL chart {chart_csv_path(*key)}: point ({x[k]:g}, {y[k]:g}) = {z[k]:g} kPa reads {nfl[k]:.3f} kPa"
+            )
+        worst = max(worst, float(error.max()))
+    return worst
+
+
+if __name__ == "__main__":
+    manifest = build_cache()
+    print(f"Wrote {len(manifest['charts'])} NFL charts to {CACHE_PATH}")
+    print(f"All chart points read back within {check_charts():.1%}")
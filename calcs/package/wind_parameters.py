@@ -1,5 +1,4 @@
 import numpy as np
-import math
 
 
 location_wind_speeds = {
@@ -29,6 +28,54 @@ def location_wind_load_bd(location):
     return location_wind_speeds[location]
 
 
+def _read_only(values):
+    arr = np.array(values, dtype=float)
+    arr.flags.writeable = False
+    return arr
+
+
+# Coefficient tables, built once at import (read-only)
+EXPOSURE_CATS = ("A", "B", "C")
+
+# Velocity pressure exposure coefficient, K_z
+KZ_HEIGHTS = _read_only([
+    4.6, 6.1, 7.6, 9.1, 12.2, 15.2, 18.0, 21.3, 24.4, 27.41, 30.5,
+    36.6, 42.7, 48.8, 54.9, 61.0, 76.2, 91.4, 106.7, 121.9, 137.2, 152.4
+])
+KZ_VALUES = {
+    ("A", "C&C"): _read_only([0.7, 0.7, 0.7, 0.7, 0.76, 0.81, 0.85, 0.89, 0.93, 0.96, 0.99,
+                    1.04, 1.09, 1.13, 1.17, 1.2, 1.28, 1.35, 1.41, 1.47, 1.52, 1.56]),
+    ("A", "MWFRS"): _read_only([0.57, 0.62, 0.66, 0.7, 0.76, 0.81, 0.85, 0.89, 0.93, 0.96, 0.99,
+                    1.04, 1.09, 1.13, 1.17, 1.2, 1.28, 1.35, 1.41, 1.47, 1.52, 1.56]),
+    ("B", ""): _read_only([0.85, 0.9, 0.94, 0.98, 1.04, 1.09, 1.13, 1.17, 1.21, 1.24, 1.26,
+                    1.31, 1.36, 1.39, 1.43, 1.46, 1.53, 1.59, 1.64, 1.69, 1.73, 1.77]),
+    ("C", ""): _read_only([1.03, 1.08, 1.12, 1.16, 1.22, 1.27, 1.31, 1.34, 1.38, 1.4, 1.43,
+                    1.48, 1.52, 1.55, 1.58, 1.61, 1.68, 1.73, 1.78, 1.82, 1.86, 1.89]),
+}
+
+# Topographic factor: rows follow TOPOGRAPHY_TYPES
+TOPOGRAPHY_TYPES = ("2-Dimensional Ridge", "2-Dimensional Escarpment", "3-Dimensional Hill")
+CREST_SIDES = ("Upwind", "Downwind")
+TOPO_K1 = _read_only([          # columns: exposure A, B, C
+    [1.30, 1.45, 1.55],
+    [0.75, 0.85, 0.95],
+    [0.95, 1.05, 1.15],
+])
+TOPO_GAMMA = _read_only([3.0, 2.5, 4.0])
+TOPO_MU = _read_only([          # columns: Upwind, Downwind
+    [1.5, 1.5],
+    [1.5, 4.0],
+    [1.5, 1.5],
+])
+
+# Gust factor: rows follow EXPOSURE_CATS, columns: alpha, b, c
+GUST_EXPOSURE = _read_only([
+    [0.25, 0.45, 0.30],
+    [0.20, 0.35, 0.25],
+    [0.15, 0.25, 0.20],
+])
+
+
 
 def importance_factor(occupancy_cat):
     if occupancy_cat == "I":
@@ -43,61 +90,52 @@ def importance_factor(occupancy_cat):
 
 
 def topographic_factor(topography_type, Ht, Lh, x, z, exposure_cat, topo_crest_side):
+    return float(topographic_factor_array(topography_type, Ht, Lh, x, z, exposure_cat, topo_crest_side))
+
+
+def topographic_factor_array(topography_type, Ht, Lh, x, z, exposure_cat, topo_crest_side):
+    # Same as topographic_factor, but Ht, Lh, x and z may be lists/arrays (returns an array)
+    Ht, Lh, x, z = (np.asarray(v, dtype=float) for v in (Ht, Lh, x, z))
+
     # Normalize inputs
     exposure_cat = exposure_cat.upper()
-    # topo_crest_side = topo_crest_side.lower()
-    # topography_type = topography_type.lower()
-
-    # K1 Table
-    K1_table = {
-        '2-Dimensional Ridge': {'A': 1.30, 'B': 1.45, 'C': 1.55},
-        '2-Dimensional Escarpment': {'A': 0.75, 'B': 0.85, 'C': 0.95},
-        '3-Dimensional Hill': {'A': 0.95, 'B': 1.05, 'C': 1.15}
-    }
-
-    # γ and μ values
-    gamma_values = {'2-Dimensional Ridge': 3.0, '2-Dimensional Escarpment': 2.5, '3-Dimensional Hill': 4.0}
-    mu_values = {
-        '2-Dimensional Ridge': {'Upwind': 1.5, 'Downwind': 1.5},
-        '2-Dimensional Escarpment': {'Upwind': 1.5, 'Downwind': 4.0},
-        '3-Dimensional Hill': {'Upwind': 1.5, 'Downwind': 1.5}
-    }
 
     if topography_type == "Homogeneous":
-        return 1.0
+        return np.ones(np.broadcast_shapes(Ht.shape, Lh.shape, x.shape, z.shape))
     
     try:
-        K1_base = K1_table[topography_type][exposure_cat]
+        t = TOPOGRAPHY_TYPES.index(topography_type)
+        K1_base = TOPO_K1[t, EXPOSURE_CATS.index(exposure_cat)]
         K1 = K1_base * (Ht / Lh)
 
-        gamma = gamma_values[topography_type]
-        mu = mu_values[topography_type][topo_crest_side]
-
-        # Compute K2 and K3
-        K2 = max(0, 1 - abs(x) / (mu * Lh))  # Ensure K2 ≥ 0
-        K3 = math.exp(-gamma * z / Lh)
+        gamma = TOPO_GAMMA[t]
+        mu = TOPO_MU[t, CREST_SIDES.index(topo_crest_side)]
+    except ValueError as e:
+        raise ValueError(f"Invalid input: {e}")
 
-        # Final Kzt
-        Kzt = (1 + K1 * K2 * K3) ** 2
-        return round(Kzt, 3)
+    # Compute K2 and K3
+    K2 = np.maximum(0, 1 - np.abs(x) / (mu * Lh))  # Ensure K2 ≥ 0
+    K3 = np.exp(-gamma * z / Lh)
 
-    except KeyError as e:
-        raise ValueError(f"Invalid input: {e}")
+    # Final Kzt
+    Kzt = (1 + K1 * K2 * K3) ** 2
+    return np.round(Kzt, 3)
 
 
 
 def gust_factor(H, L, B, V, n1, beta, exposure_cat):
-    # Exposure-dependent values
-    exposure_data = {
-        "A": {"alpha": 0.25, "b": 0.45, "c": 0.30},
-        "B": {"alpha": 0.20, "b": 0.35, "c": 0.25},
-        "C": {"alpha": 0.15, "b": 0.25, "c": 0.20}
-    }
+    return float(gust_factor_array(H, L, B, V, n1, beta, exposure_cat))
+
 
-    # Constants
-    alpha = exposure_data[exposure_cat]["alpha"]
-    b = exposure_data[exposure_cat]["b"]
-    c = exposure_data[exposure_cat]["c"]
+def gust_factor_array(H, L, B, V, n1, beta, exposure_cat):
+    # Same as gust_factor, but H, L, B, V, n1 and beta may be lists/arrays (returns an array)
+    H, L, B, V, n1, beta = (np.asarray(v, dtype=float) for v in (H, L, B, V, n1, beta))
+
+    # Exposure-dependent values
+    try:
+        alpha, b, c = GUST_EXPOSURE[EXPOSURE_CATS.index(exposure_cat)]
+    except ValueError:
+        raise ValueError(f"Unknown exposure category: {exposure_cat}")
 
     epsilon = 0.333
     z_min = 9.14  # 30 ft
@@ -105,7 +143,7 @@ def gust_factor(H, L, B, V, n1, beta, exposure_cat):
     ll = 97.54
     g_v = 3.4
 
-    z = max(0.6 * H, z_min)
+    z = np.maximum(0.6 * H, z_min)
     I_z = c * (10 / z) ** (1 / 6)
     L_z = ll * (z / 10) ** epsilon
 
@@ -142,30 +180,18 @@ def gust_factor(H, L, B, V, n1, beta, exposure_cat):
 
 def velocity_pressure_coeff(exposure_cat, H, WFRS):
     # WFRS = Wind Force Resisting System (MWFRS or C&C)
-    heights = [
-        4.6, 6.1, 7.6, 9.1, 12.2, 15.2, 18.0, 21.3, 24.4, 27.41, 30.5,
-        36.6, 42.7, 48.8, 54.9, 61.0, 76.2, 91.4, 106.7, 121.9, 137.2, 152.4
-    ]
-
-    data = {
-        ("A", "C&C"): [0.7, 0.7, 0.7, 0.7, 0.76, 0.81, 0.85, 0.89, 0.93, 0.96, 0.99,
-                        1.04, 1.09, 1.13, 1.17, 1.2, 1.28, 1.35, 1.41, 1.47, 1.52, 1.56],
-        ("A", "MWFRS"): [0.57, 0.62, 0.66, 0.7, 0.76, 0.81, 0.85, 0.89, 0.93, 0.96, 0.99,
-                        1.04, 1.09, 1.13, 1.17, 1.2, 1.28, 1.35, 1.41, 1.47, 1.52, 1.56],
-        ("B", ""): [0.85, 0.9, 0.94, 0.98, 1.04, 1.09, 1.13, 1.17, 1.21, 1.24, 1.26,
-                        1.31, 1.36, 1.39, 1.43, 1.46, 1.53, 1.59, 1.64, 1.69, 1.73, 1.77],
-        ("C", ""): [1.03, 1.08, 1.12, 1.16, 1.22, 1.27, 1.31, 1.34, 1.38, 1.4, 1.43,
-                        1.48, 1.52, 1.55, 1.58, 1.61, 1.68, 1.73, 1.78, 1.82, 1.86, 1.89],
-    }
+    return float(velocity_pressure_coeff_array(exposure_cat, H, WFRS))
+
 
+def velocity_pressure_coeff_array(exposure_cat, H, WFRS):
+    # Same as velocity_pressure_coeff, but H may be a list/array of heights (returns an array)
     if exposure_cat == "A":
         key = (exposure_cat, WFRS)
     else:
         key = (exposure_cat, "")
 
     # Interpolate to get Kz
-    kz_values = data[key]
-    K_z = float(np.interp(H, heights, kz_values))
+    K_z = np.interp(np.asarray(H, dtype=float), KZ_HEIGHTS, KZ_VALUES[key])
     return K_z
 
 
@@ -231,6 +257,12 @@ def eff_area(h, b):
     return A_eff
 
 
+def eff_area_array(h, b):
+    # Same as eff_area, but h and b may be lists/arrays
+    h, b = np.asarray(h, dtype=float), np.asarray(b, dtype=float)
+    return np.maximum(h * b, h * (h / 3))
+
+
 def ext_pressure_coeff_wall_cladd(eff_area):
     if eff_area <= 1.9:
         GC_p__z4_pos = GC_p__z5_pos = 0.9
@@ -281,6 +313,30 @@ def ext_pressure_coeff_roof_cladd(eff_area):
     return -GC_p__z1_neg, -GC_p__z2_neg, -GC_p__z3_neg
 
 
+def _log_area_interp(eff_area, area_min, area_max, value_min, value_max):
+    # Linear interpolation on log(area) between the chart limits, constant outside them
+    eff_area = np.asarray(eff_area, dtype=float)
+    clipped = np.clip(eff_area, area_min, area_max)
+    value = value_max + (value_min - value_max) * ((np.log(area_max) - np.log(clipped)) / (np.log(area_max) - np.log(area_min)))
+    return np.where(eff_area <= area_min, value_min, np.where(eff_area >= area_max, value_max, value))
+
+
+def ext_pressure_coeff_wall_cladd_array(eff_area):
+    # Same as ext_pressure_coeff_wall_cladd, but eff_area may be a list/array of areas
+    GC_p__z4_pos = GC_p__z5_pos = _log_area_interp(eff_area, 1.9, 46.5, 0.9, 0.6)
+    GC_p__z4_neg = _log_area_interp(eff_area, 1.9, 46.5, 0.9, 0.7)
+    GC_p__z5_neg = _log_area_interp(eff_area, 1.9, 46.5, 1.8, 1.0)
+    return GC_p__z4_pos, -GC_p__z4_neg, GC_p__z5_pos, -GC_p__z5_neg
+
+
+def ext_pressure_coeff_roof_cladd_array(eff_area):
+    # Same as ext_pressure_coeff_roof_cladd, but eff_area may be a list/array of areas
+    GC_p__z1_neg = _log_area_interp(eff_area, 0.9, 46.5, 1.4, 0.9)
+    GC_p__z2_neg = _log_area_interp(eff_area, 0.9, 46.5, 2.3, 1.6)
+    GC_p__z3_neg = _log_area_interp(eff_area, 0.9, 46.5, 3.2, 2.3)
+    return -GC_p__z1_neg, -GC_p__z2_neg, -GC_p__z3_neg
+
+
 def wall_cladding_wind_pressure(q_z, GC_p__z4_pos, GC_p__z4_neg, GC_p__z5_pos, GC_p__z5_neg, GC_pi):
     P_z__z4_pos = (q_z * (GC_p__z4_pos)) + (q_z * (GC_pi))
     P_z__z4_neg = (q_z * (GC_p__z4_neg)) - (q_z * (GC_pi))
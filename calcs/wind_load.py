@@ -1,4 +1,6 @@
 # from package import wind_parameters as wp
+from bisect import bisect_left
+import numpy as np
 from .package import wind_parameters as wp
 
 
@@ -57,6 +59,10 @@ class WindLoadCalculator:
             self.b_length, self.b_width)
         self.q_zk = 0.000613 * self.K_d * self.wind_speed** 2 * self.Imp      # in terms of Kz Kzt
 
+        # C&C pressure lookup index, built lazily per effective area (see get_cladding_index)
+        self._cladding_index = {}
+        self._cladding_index_inputs = None
+
 
     def compute_params(self):
         return {
@@ -105,24 +111,48 @@ class WindLoadCalculator:
             return self.cumu_heights[level - 1]
         raise ValueError("Invalid level")
 
-    def compute_mwfrs_pressures(self):
+    def compute_mwfrs_table(self):
+        # Columnar MWFRS results: one array entry per floor, computed in one pass
+        cumu_heights = np.asarray(self.cumu_heights, dtype=float)
+
         K_h = wp.velocity_pressure_coeff(self.exposure_cat, self.b_height, WFRS="MWFRS")
         q_h = 0.000613 * K_h * self.K_ht * self.K_d * self.wind_speed** 2 * self.Imp
         P_hi = q_h * self.GC_pi
         P_hl = q_h * self.gust_factor * self.C_pl - P_hi
         P_hs = q_h * self.gust_factor * self.C_ps - P_hi
-        
+
+        K_z = wp.velocity_pressure_coeff_array(self.exposure_cat, cumu_heights, WFRS="MWFRS")
+        K_zt = wp.topographic_factor_array(
+            self.topography_type, self.topo_height, self.topo_length,
+            self.topo_distance, cumu_heights, self.exposure_cat, self.topo_crest_side
+        )
+        q_z = self.q_zk * K_z * K_zt
+        P_zw = q_z * self.gust_factor * self.C_pw + P_hi
+
+        return {
+            "K_h": K_h,
+            "K_ht": self.K_ht,
+            "q_h": q_h,
+            "P_hi": P_hi,
+            "P_hl": P_hl,
+            "P_hs": P_hs,
+            "level": np.arange(1, len(cumu_heights) + 1),
+            "height": np.asarray(self.floor_heights, dtype=float),
+            "cumu_height": cumu_heights,
+            "K_z": K_z,
+            "K_zt": K_zt,
+            "q_z": q_z,
+            "P_zw": P_zw
+        }
+
+    def compute_mwfrs_pressures(self):
+        table = self.compute_mwfrs_table()
+
         results = []
-        for level, height in enumerate(self.floor_heights, start=1):
-            cumu_height = self.cumu_heights[level - 1]
-            K_z = wp.velocity_pressure_coeff(self.exposure_cat, cumu_height, WFRS="MWFRS")
-            K_zt = wp.topographic_factor(
-                self.topography_type, self.topo_height, self.topo_length,
-                self.topo_distance, cumu_height, self.exposure_cat, self.topo_crest_side
-            )
-            q_z = self.q_zk * K_z * K_zt
-            P_zw = q_z * self.gust_factor * self.C_pw + P_hi
-            
+        for level, height, cumu_height, K_z, K_zt, q_z, P_zw in zip(
+            table["level"].tolist(), self.floor_heights, table["cumu_height"].tolist(),
+            table["K_z"].tolist(), table["K_zt"].tolist(), table["q_z"].tolist(), table["P_zw"].tolist()
+        ):
             results.append({
                 "level": level,
                 "height": height,
@@ -133,12 +163,12 @@ class WindLoadCalculator:
                 "P_zw": round(P_zw, 2)
             })
         return {
-            "K_h": round(K_h, 2),
-            "K_ht": round(self.K_ht, 2),
-            "q_h": round(q_h, 2),
-            "P_hi": round(P_hi, 2),
-            "P_hl": round(P_hl, 2),
-            "P_hs": round(P_hs, 2)
+            "K_h": round(table["K_h"], 2),
+            "K_ht": round(table["K_ht"], 2),
+            "q_h": round(table["q_h"], 2),
+            "P_hi": round(table["P_hi"], 2),
+            "P_hl": round(table["P_hl"], 2),
+            "P_hs": round(table["P_hs"], 2)
         }, results
 
     def compute_mwfrs_parapet_pressure(self):
@@ -170,57 +200,93 @@ class WindLoadCalculator:
             "P_pl": round(P_pl, 2),
         }
 
+    def compute_cladding_table(self, eff_area=None):
+        # Columnar C&C results: per-level arrays (n_level,) and zone pressures (n_level, n_area)
+        area_list = [eff_area] if eff_area is not None else self.eff_area
+        A_eff = np.asarray(area_list, dtype=float)
+
+        levels = np.array([level for level in self.selected_levels if level <= len(self.cumu_heights)], dtype=int)
+        height = np.asarray(self.cumu_heights, dtype=float)[levels - 1]
+
+        K_z = wp.velocity_pressure_coeff_array(self.exposure_cat, height, WFRS="C&C")
+        K_zt = wp.topographic_factor_array(
+            self.topography_type, self.topo_height, self.topo_length,
+            self.topo_distance, height, self.exposure_cat, self.topo_crest_side
+        )
+        q_z = self.q_zk * K_z * K_zt
+        P_zi = q_z * self.GC_pi
+
+        GC_p_z4_pos, GC_p_z4_neg, GC_p_z5_pos, GC_p_z5_neg = wp.ext_pressure_coeff_wall_cladd_array(A_eff)
+        GC_p_z1_neg, GC_p_z2_neg, GC_p_z3_neg = wp.ext_pressure_coeff_roof_cladd_array(A_eff)
+
+        # broadcast levels (rows) against areas (columns)
+        q = q_z[:, None]
+        P_i = P_zi[:, None]
+
+        return {
+            "level": levels,
+            "A_eff": A_eff,
+            "height": height,
+            "K_z": K_z,
+            "K_zt": K_zt,
+            "q_z": q_z,
+            "P_zi": P_zi,
+            "P_z4_pos": q * GC_p_z4_pos + P_i,
+            "P_z4_neg": q * GC_p_z4_neg - P_i,
+            "P_z5_pos": q * GC_p_z5_pos + P_i,
+            "P_z5_neg": q * GC_p_z5_neg - P_i,
+            "P_z1_neg": q * GC_p_z1_neg - P_i,
+            "P_z2_neg": q * GC_p_z2_neg - P_i,
+            "P_z3_neg": q * GC_p_z3_neg - P_i
+        }
+
     def compute_cladding_pressures(self, eff_area=None):
         wall_results, roof_results = {}, {}
 
         # Choose area list
         area_list = [eff_area] if eff_area is not None else self.eff_area
+        table = self.compute_cladding_table(eff_area)
 
-        for A_eff in area_list:
-            GC_p_z4_pos, GC_p_z4_neg, GC_p_z5_pos, GC_p_z5_neg = wp.ext_pressure_coeff_wall_cladd(A_eff)
-            GC_p_z1_neg, GC_p_z2_neg, GC_p_z3_neg = wp.ext_pressure_coeff_roof_cladd(A_eff)
+        levels = table["level"].tolist()
+        heights = table["height"].tolist()
+        K_z = table["K_z"].tolist()
+        K_zt = table["K_zt"].tolist()
+        q_z = table["q_z"].tolist()
+        P_zi = table["P_zi"].tolist()
+        zones = {key: table[key].T.tolist() for key in (
+            "P_z4_pos", "P_z4_neg", "P_z5_pos", "P_z5_neg", "P_z1_neg", "P_z2_neg", "P_z3_neg"
+        )}
 
+        for j, A_eff in enumerate(area_list):
             wall_rows = []
             roof_rows = []
 
-            for level in self.selected_levels:
-                if level > len(self.cumu_heights):
-                    continue
-
-                height = self.cumu_heights[level - 1]
-                K_z = wp.velocity_pressure_coeff(self.exposure_cat, height, WFRS="C&C")
-                K_zt = wp.topographic_factor(
-                    self.topography_type, self.topo_height, self.topo_length,
-                    self.topo_distance, height, self.exposure_cat, self.topo_crest_side
-                )
-                q_z = self.q_zk * K_z * K_zt
-                P_zi = q_z * self.GC_pi
-
+            for i, level in enumerate(levels):
                 wall_rows.append({
                     "level": level,
                     "A_eff": A_eff,
-                    "height": round(height, 2),
-                    "K_z": round(K_z, 2),
-                    "K_zt": round(K_zt, 2),
-                    "q_z": round(q_z, 2),
-                    "P_zi": round(P_zi, 2),
-                    "P_z4_pos": round(q_z * GC_p_z4_pos + P_zi, 2),
-                    "P_z4_neg": round(q_z * GC_p_z4_neg - P_zi, 2),
-                    "P_z5_pos": round(q_z * GC_p_z5_pos + P_zi, 2),
-                    "P_z5_neg": round(q_z * GC_p_z5_neg - P_zi, 2),
+                    "height": round(heights[i], 2),
+                    "K_z": round(K_z[i], 2),
+                    "K_zt": round(K_zt[i], 2),
+                    "q_z": round(q_z[i], 2),
+                    "P_zi": round(P_zi[i], 2),
+                    "P_z4_pos": round(zones["P_z4_pos"][j][i], 2),
+                    "P_z4_neg": round(zones["P_z4_neg"][j][i], 2),
+                    "P_z5_pos": round(zones["P_z5_pos"][j][i], 2),
+                    "P_z5_neg": round(zones["P_z5_neg"][j][i], 2),
                 })
 
                 roof_rows.append({
                     "level": level,
                     "A_eff": A_eff,
-                    "height": round(height, 2),
-                    "K_z": round(K_z, 2),
-                    "K_zt": round(K_zt, 2),
-                    "q_z": round(q_z, 2),
-                    "P_zi": round(P_zi, 2),
-                    "P_z1_neg": round(q_z * GC_p_z1_neg - P_zi, 2),
-                    "P_z2_neg": round(q_z * GC_p_z2_neg - P_zi, 2),
-                    "P_z3_neg": round(q_z * GC_p_z3_neg - P_zi, 2),
+                    "height": round(heights[i], 2),
+                    "K_z": round(K_z[i], 2),
+                    "K_zt": round(K_zt[i], 2),
+                    "q_z": round(q_z[i], 2),
+                    "P_zi": round(P_zi[i], 2),
+                    "P_z1_neg": round(zones["P_z1_neg"][j][i], 2),
+                    "P_z2_neg": round(zones["P_z2_neg"][j][i], 2),
+                    "P_z3_neg": round(zones["P_z3_neg"][j][i], 2),
                 })
 
             wall_results[A_eff] = wall_rows
@@ -245,37 +311,125 @@ class WindLoadCalculator:
         }
 
     
+    def _cladding_inputs(self):
+        # Everything the C&C table depends on apart from the effective area
+        return (
+            self.exposure_cat, self.q_zk, self.GC_pi,
+            self.topography_type, self.topo_height, self.topo_length, self.topo_distance, self.topo_crest_side,
+            tuple(self.cumu_heights), tuple(self.selected_levels)
+        )
+
+    def get_cladding_index(self, effective_area):
+        # Per-zone design pressures for one effective area, sorted by height for binary search.
+        # Built once per area and dropped when the wind inputs change.
+        inputs = self._cladding_inputs()
+        if inputs != self._cladding_index_inputs:
+            self._cladding_index = {}
+            self._cladding_index_inputs = inputs
+
+        index = self._cladding_index.get(effective_area)
+        if index is None:
+            table = self.compute_cladding_table(eff_area=effective_area)
+            order = np.argsort(table["height"], kind="stable")
+
+            def column(key):
+                return [round(v, 2) for v in table[key][order, 0].tolist()]
+
+            P_z4 = [max(abs(pos), abs(neg)) for pos, neg in zip(column("P_z4_pos"), column("P_z4_neg"))]
+            P_z5 = [max(abs(pos), abs(neg)) for pos, neg in zip(column("P_z5_pos"), column("P_z5_neg"))]
+            index = {
+                "height": [round(h, 2) for h in table["height"][order].tolist()],
+                "position": order.tolist(),     # row's place in selected_levels, for ties
+                "Zone 1": [abs(p) for p in column("P_z1_neg")],
+                "Zone 2": [abs(p) for p in column("P_z2_neg")],
+                "Zone 3": [abs(p) for p in column("P_z3_neg")],
+                "Zone 4": P_z4,
+                "Zone 5": P_z5,
+            }
+            self._cladding_index[effective_area] = index
+        return index
+
     def get_cladding_pressure(self, effective_area, elevation, zone):
         cladding_type = "wall" if zone in ["Zone 4", "Zone 5"] else "roof"
+        if zone not in ["Zone 1", "Zone 2", "Zone 3", "Zone 4", "Zone 5"]:
+            raise ValueError(f"Unsupported {cladding_type} zone: {zone}")
 
-        wall_results, roof_results = self.compute_cladding_pressures(eff_area=effective_area)
-        target_results = wall_results if cladding_type == "wall" else roof_results
-
-        area_results = target_results.get(effective_area)
+        index = self.get_cladding_index(effective_area)
+        heights = index["height"]
 
-        if not area_results:
+        if not heights:
             raise ValueError(f"No pressure data computed for area {effective_area:.2f} m²")
 
-        # Loop through all rows (1 per level), and pick one with closest height
-        closest_row = min(area_results, key=lambda row: abs(row["height"] - elevation))
-
-        # Get pressure based on zone
-        if cladding_type == "wall":
-            if zone == "Zone 4":
-                return max(abs(closest_row["P_z4_pos"]), abs(closest_row["P_z4_neg"]))
-            elif zone == "Zone 5":
-                return max(abs(closest_row["P_z5_pos"]), abs(closest_row["P_z5_neg"]))
-            else:
-                raise ValueError(f"Unsupported wall zone: {zone}")
-        elif cladding_type == "roof":
-            if zone == "Zone 1":
-                return abs(closest_row["P_z1_neg"])
-            elif zone == "Zone 2":
-                return abs(closest_row["P_z2_neg"])
-            elif zone == "Zone 3":
-                return abs(closest_row["P_z3_neg"])
-            else:
-                raise ValueError(f"Unsupported roof zone: {zone}")
-
-        raise ValueError(f"Invalid cladding type {cladding_type} or zone {zone}")
+        # Binary search for the level with the closest height. On a tie the level listed
+        # first in selected_levels wins, as the plain min() over the rows did.
+        i = bisect_left(heights, elevation)
+        candidates = []
+        if i < len(heights):
+            candidates.append(i)
+        if i > 0:
+            candidates.append(bisect_left(heights, heights[i - 1]))     # first row at that height
+        i = min(candidates, key=lambda k: (abs(heights[k] - elevation), index["position"][k]))
+
+        return index[zone][i]
 
+    def _nearest_level_heights(self, elevation):
+        # Height of the selected level closest to each elevation; on a tie the level listed
+        # first in selected_levels wins (argmin keeps the first), like get_cladding_pressure
+        levels = [level for level in self.selected_levels if level <= len(self.cumu_heights)]
+        if not levels:
+            raise ValueError("No selected levels to snap panel elevations to")
+        heights = np.asarray(self.cumu_heights, dtype=float)[np.asarray(levels) - 1]
+
+        nearest = np.argmin(np.abs(np.asarray(elevation)[..., None] - np.round(heights, 2)), axis=-1)
+        return heights[nearest]
+
+    def compute_panel_pressures(self, elevation, eff_area, zone, snap_to_levels=False):
+        """
+        Design C&C pressure (kPa, absolute) for many panels in one vectorized call.
+
+        Parameters:
+            elevation : array - Panel elevation (m)
+            eff_area : array - Panel effective area (m²)
+            zone : array - C&C zone as 1-5 or "Zone 1".."Zone 5" (any case and spacing,
+                           e.g. "zone 4", "ZONE4", " 4 ")
+            snap_to_levels : bool - Use the closest selected level's height instead of the
+                                    panel's own elevation (as get_cladding_pressure does)
+        """
+        zone = np.asarray(zone)
+        if zone.dtype.kind in "USO":
+            zone = np.char.lower(np.char.strip(zone.astype(str)))
+            zone = np.char.strip(np.char.replace(zone, "zone", ""))
+        try:
+            zone = zone.astype(int)
+        except ValueError:
+            raise ValueError("Zones must be 1-5 or 'Zone 1'..'Zone 5'")
+        if np.any((zone < 1) | (zone > 5)):
+            raise ValueError(f"Unsupported zone(s): {sorted(set(zone[(zone < 1) | (zone > 5)].tolist()))}")
+
+        elevation, eff_area, zone = np.broadcast_arrays(
+            np.asarray(elevation, dtype=float), np.asarray(eff_area, dtype=float), zone
+        )
+        if snap_to_levels:
+            elevation = self._nearest_level_heights(elevation)
+
+        K_z = wp.velocity_pressure_coeff_array(self.exposure_cat, elevation, WFRS="C&C")
+        K_zt = wp.topographic_factor_array(
+            self.topography_type, self.topo_height, self.topo_length,
+            self.topo_distance, elevation, self.exposure_cat, self.topo_crest_side
+        )
+        q_z = self.q_zk * K_z * K_zt
+        P_zi = q_z * self.GC_pi
+
+        GC_p_z4_pos, GC_p_z4_neg, GC_p_z5_pos, GC_p_z5_neg = wp.ext_pressure_coeff_wall_cladd_array(eff_area)
+        GC_p_z1_neg, GC_p_z2_neg, GC_p_z3_neg = wp.ext_pressure_coeff_roof_cladd_array(eff_area)
+
+        return np.select(
+            [zone == 1, zone == 2, zone == 3, zone == 4, zone == 5],
+            [
+                np.abs(q_z * GC_p_z1_neg - P_zi),
+                np.abs(q_z * GC_p_z2_neg - P_zi),
+                np.abs(q_z * GC_p_z3_neg - P_zi),
+                np.maximum(np.abs(q_z * GC_p_z4_pos + P_zi), np.abs(q_z * GC_p_z4_neg - P_zi)),
+                np.maximum(np.abs(q_z * GC_p_z5_pos + P_zi), np.abs(q_z * GC_p_z5_neg - P_zi)),
+            ]
+        )
@@ -1,12 +1,21 @@
+from ui.startup import startup
+
 import sys
 import os
-from PyQt5 import QtCore
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QIcon, QPixmap, QFontDatabase, QFont
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QLabel, QPushButton,
-    QHBoxLayout, QVBoxLayout, QStackedWidget, QSizePolicy, QMessageBox
-)
+import importlib
+import multiprocessing
+
+# splash milestones, in order (see StartupProfiler)
+startup.expect("import Qt", "splash", "fonts", "ribbon", "build WindLoadTab", "show")
+
+with startup.step("import Qt", kind="import"):
+    from PyQt5 import QtCore
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QIcon, QPixmap, QFontDatabase, QFont
+    from PyQt5.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QLabel, QPushButton,
+        QHBoxLayout, QVBoxLayout, QStackedWidget, QSizePolicy, QMessageBox
+    )
 
 from ui.splash import SplashScreen
 
@@ -63,13 +72,14 @@ class MainWindow(QMainWindow):
         window_icon_path = resource_path("ui/assets/icons/icon.png")
         self.setWindowIcon(QIcon(window_icon_path))
         
-        font_path = resource_path("ui/assets/fonts/custom-font.ttf")
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id == -1:
-            print("Failed to load font!")
-        else:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            self.custom_font = QFont(family, 10)
+        with startup.step("fonts"):
+            font_path = resource_path("ui/assets/fonts/custom-font.ttf")
+            font_id = QFontDatabase.addApplicationFont(font_path)
+            if font_id == -1:
+                print("Failed to load font!")
+            else:
+                family = QFontDatabase.applicationFontFamilies(font_id)[0]
+                self.custom_font = QFont(family, 10)
 
         # Center main window
         screen = QApplication.primaryScreen()
@@ -85,13 +95,15 @@ class MainWindow(QMainWindow):
         self.main_layout = QVBoxLayout(self.central_widget)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
 
-        self.ribbon = self.create_ribbon()
-        self.stack = QStackedWidget()
+        with startup.step("ribbon"):
+            self.ribbon = self.create_ribbon()
+            self.stack = QStackedWidget()
 
-        self.main_layout.addWidget(self.ribbon)
-        self.main_layout.addWidget(self.stack)
+            self.main_layout.addWidget(self.ribbon)
+            self.main_layout.addWidget(self.stack)
 
-        self.init_pages()
+        with startup.step("init_pages"):
+            self.init_pages()
         self.set_active_tab(1)
 
     def create_ribbon(self):
@@ -192,24 +204,27 @@ class MainWindow(QMainWindow):
     def set_active_tab(self, index):
         for i, tab in enumerate(self.tabs.values()):
             tab.setChecked(i == index)
+        self.page(index)
         self.stack.setCurrentIndex(index)
 
+    # ribbon index -> (attribute, module, class) of the pages built on first activation
+    LAZY_PAGES = {
+        1: ("wind_tab", "ui.wind_gui", "WindLoadTab"),
+        2: ("glass_tab", "ui.glass_gui", "GlassTab"),
+        4: ("conn_tab", "ui.conn_gui", "ConnTab"),
+        5: ("fixing_tab", "ui.fixing_gui", "FixingTab"),
+    }
+
     def init_pages(self):
-        from ui.wind_gui import WindLoadTab
-        from ui.glass_gui import GlassTab
-        from ui.conn_gui import ConnTab
-        from ui.fixing_gui import FixingTab
         # from ui.project_tab import ProjectTab
-        from PyQt5.QtWidgets import QLabel
-
         self.home_tab = QLabel("Home Page")
-        self.wind_tab = WindLoadTab()
-        self.glass_tab = GlassTab()
+        self.wind_tab = None
+        self.glass_tab = None
         self.frame_tab = QLabel("Frame Page Coming soon")
-        self.conn_tab = ConnTab()
-        self.fixing_tab = FixingTab()
+        self.conn_tab = None
+        self.fixing_tab = None
         self.project_tab = QLabel("Project Page Coming soon")
-        
+
         pages = [
             self.home_tab,
             self.wind_tab,
@@ -220,16 +235,31 @@ class MainWindow(QMainWindow):
             self.project_tab
         ]
 
+        # calculation tabs (and the QtWebEngine, calcs and dialogs they import) are
+        # only built when their ribbon tab is first opened; an empty page holds the slot
         for page in pages:
-            self.stack.addWidget(page)
-
-        for i in range(self.stack.count()):
-            self.stack.setCurrentIndex(i)
-            QApplication.processEvents()
+            self.stack.addWidget(page if page is not None else QWidget())
+
+    def page(self, index):
+        # the page at index, built on first use
+        if index in self.LAZY_PAGES:
+            attribute, module_name, class_name = self.LAZY_PAGES[index]
+            if getattr(self, attribute) is None:
+                QApplication.setOverrideCursor(Qt.WaitCursor)
+                try:
+                    with startup.step(f"build {class_name}", kind="page"):
+                        with startup.step(module_name, kind="import"):
+                            page_class = getattr(importlib.import_module(module_name), class_name)
+                        page = page_class()
+                finally:
+                    QApplication.restoreOverrideCursor()
+                placeholder = self.stack.widget(index)
+                self.stack.removeWidget(placeholder)
+                placeholder.deleteLater()
+                self.stack.insertWidget(index, page)
+                setattr(self, attribute, page)
+        return self.stack.widget(index)
 
-        self.stack.setCurrentIndex(1)
-        
-        
     def handle_calculate(self):
         current_index = self.stack.currentIndex()
         current_widget = self.stack.currentWidget()
@@ -256,17 +286,15 @@ class MainWindow(QMainWindow):
 
 # === Application Entry ===
 if __name__ == "__main__":
+    multiprocessing.freeze_support()    # frozen build: the report worker process starts here
     QtCore.QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
 
-    splash = SplashScreen()
-    splash.start_loading(duration_ms=1000)  # Start visual loading
-    app.processEvents()
-
-    # Flags to sync splash and main window readiness
-    splash_done = False
-    window_ready = False
-    window = None
+    with startup.step("splash"):
+        splash = SplashScreen()
+        splash.show()
+        startup.listeners.append(splash.set_progress)
+        splash.set_progress(startup.progress(), "import Qt")
 
     app.setStyleSheet("""
         QToolTip {
@@ -277,26 +305,12 @@ if __name__ == "__main__":
             border-radius: 4px;
         }
     """)
-    
-    def show_main_window():
-        global window_ready, window
-        window_ready = True
-        maybe_start()
-
-    def splash_minimum_shown():
-        global splash_done
-        splash_done = True
-        maybe_start()
-
-    def maybe_start():
-        if splash_done and window_ready:
-            splash.close()
-            window.show()
-            window.showMaximized()
 
     window = MainWindow()
-    show_main_window()
 
-    QTimer.singleShot(1000, splash_minimum_shown)  # At least 1s splash
+    with startup.step("show"):
+        window.showMaximized()
+        splash.finish(window)
+    startup.finish()
 
     sys.exit(app.exec_())
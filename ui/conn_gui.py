@@ -1,6 +1,5 @@
 import sys
 import os
-import tempfile
 from datetime import date
 
 from PyQt5.QtWidgets import (
@@ -9,15 +8,16 @@ from PyQt5.QtWidgets import (
     QFormLayout, QRadioButton, QMessageBox, QSizePolicy, QLabel, QDialog
 )
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtCore import QUrl, QSize, Qt
 
-from weasyprint import HTML, CSS
-from jinja2 import Environment, FileSystemLoader
-
 from calcs.conn import ConnCalculator
 from ui.dialogs.conn_dialog import ScrewConfigDialog
-from ui.dialogs.report_preview import ReportPreviewWindow
+from ui.dialogs.report_preview import show_preview
+from ui.web_host import ResultView
+from ui.jobs import JobRunner
+from ui.rendering import render_result, render_report
+from ui.pdf_worker import start_report
+from ui.debounce import RecalcScheduler, StaleResultBanner, watch_inputs
 
 
 def resource_path(relative_path):
@@ -26,13 +26,40 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+# calculation and rendering, run on a worker thread (no widget access)
+def render_results(summary, option):
+    return render_result("conn.html", summary=summary, option=option)
+
+
+def calculate_connection(params):
+    summary = ConnCalculator(**params).summary()
+    return summary, render_results(summary, params["screw_config"])
+
+
+def report_html(summary, option):
+    project_info = {
+        "rev_no": "02",
+        "date_time": date.today().strftime("%d/%m/%Y")
+    }
+
+    return render_report(
+        "conn.html",
+        project_info=project_info,
+        summary=summary,
+        option=option
+    )
+
+
 class ConnTab(QWidget):
     def __init__(self, wind_data=None):
         super().__init__()
         self.wind_data = wind_data
         self.wind_calculator = None  # Will store WindLoadCalculator instance
         self.summary = None
+        self.jobs = JobRunner(self)
+        self.recalc = RecalcScheduler(self)     # one recompute per burst of input changes
         self.initUI()
+        watch_inputs(self.findChildren(QWidget), self.on_input_changed)
 
     def initUI(self):
         # Icons
@@ -103,7 +130,8 @@ class ConnTab(QWidget):
 
 
         # === Right Panel ===
-        self.result_webview = QWebEngineView()
+        self.result_webview = ResultView()
+        self.stale_banner = StaleResultBanner()
         self.report_btn = QPushButton("View Report")
         self.report_btn.setFixedSize(110, 30)
         self.report_btn.setStyleSheet("""
@@ -133,6 +161,7 @@ class ConnTab(QWidget):
         left_scroll.setStyleSheet("QScrollArea { border: none; }")
 
         output_layout = QVBoxLayout()
+        output_layout.addWidget(self.stale_banner)
         output_layout.addWidget(self.result_webview)
         output_layout.addWidget(self.report_btn, alignment=Qt.AlignRight)
         output_group = QGroupBox("Connection Design Results")
@@ -163,31 +192,50 @@ class ConnTab(QWidget):
             "dead_load": self.dead_load_input.value(),
         }
 
+    def on_input_changed(self):
+        self.recalc.schedule(self.live_calculate)
+
+    def live_calculate(self):
+        # keep a shown result in step with the inputs; nothing to refresh before the first run
+        if self.summary is not None:
+            self.calculate(live=True)
+
     def trigger_calculate(self):
+        self.recalc.cancel()
         self.calculate()
 
-    def calculate(self):
+    def calculate(self, live=False):
+        # a live recalc flags the last result as stale instead of raising a dialog per keystroke
+        def failed(message):
+            if self.summary is not None:
+                self.stale_banner.mark_stale(message)
+            if not live:
+                QMessageBox.critical(self, "Error", f"Calculation failed: {message}")
+
         try:
             params = self.get_calculation_params()
-            calculator = ConnCalculator(**params)
-            self.summary = calculator.summary()
-            self.update_results()
-            
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Calculation failed: {str(e)}")
+            failed(str(e))
+            return
+        self.jobs.submit(
+            "calculate", calculate_connection, params,
+            on_result=self.show_results,
+            on_error=failed
+        )
+
+    def show_results(self, result):
+        self.summary, combined_html = result
+        self.stale_banner.clear()
+        self.set_result_html(combined_html)
+
+    def set_result_html(self, combined_html):
+        result_temp_path = resource_path("ui/renders")
+        base_url = QUrl.fromLocalFile(os.path.abspath(result_temp_path) + "/")
+        self.result_webview.show_html(combined_html, base_url)
 
     def update_results(self):
         try:
-            result_temp_path = resource_path("ui/renders")
-            env = Environment(loader=FileSystemLoader(result_temp_path))
-            template = env.get_template("conn.html")
-            combined_html = template.render(
-                summary=self.summary,
-                option=self.screw_config_input.currentText()
-            )
-            base_url = QUrl.fromLocalFile(os.path.abspath(result_temp_path) + "/")
-            self.result_webview.setHtml(combined_html, base_url)
-            # print("Rendering with summary:", self.summary)
+            self.set_result_html(render_results(self.summary, self.screw_config_input.currentText()))
         
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to render results: {str(e)}")
@@ -198,34 +246,12 @@ class ConnTab(QWidget):
             return
 
         try:
-            project_info = {
-                "rev_no": "02",
-                "date_time": date.today().strftime("%d/%m/%Y")
-            }
-
-            report_temp_path = resource_path("reports/templates")
-            env = Environment(loader=FileSystemLoader(report_temp_path))
-            template = env.get_template("conn.html")
-
-            html_content = template.render(
-                project_info=project_info,
-                summary=self.summary,
-                option=self.screw_config_input.currentText()
-            )
-            
-            # Generate Temporary PDF File
-            temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            pdf_path = temp_pdf.name
-            temp_pdf.close()
-            
-            HTML(string=html_content, base_url=report_temp_path).write_pdf(
-                pdf_path,
-                stylesheets=[CSS(filename=os.path.join(report_temp_path, "css/report.css"))]
-            )
-
-            self.preview_window = ReportPreviewWindow(pdf_path)
-            self.preview_window.show()
-
+            html_content = report_html(self.summary, self.screw_config_input.currentText())
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to preview report: {str(e)}")
+            return
+
+        start_report(self, html_content, self.show_report)
 
+    def show_report(self, pdf_path):
+        self.preview_window = show_preview(pdf_path)
@@ -0,0 +1,89 @@
+import logging
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWidgets import QComboBox, QSpinBox, QDoubleSpinBox, QLineEdit, QLabel
+
+logger = logging.getLogger(__name__)
+
+
+class RecalcScheduler(QObject):
+    """
+    Coalesces a burst of input changes into one run of each scheduled action.
+
+    schedule(*actions) queues the actions (each at most once, in first-scheduled order)
+    and restarts a single-shot timer; when the inputs have been quiet for delay_ms the
+    queue runs. An action scheduled while the queue is running, and still ahead in it,
+    is not queued again (e.g. update_wind_load setting the wind load spin box).
+    """
+
+    def __init__(self, parent=None, delay_ms=300):
+        super().__init__(parent)
+        self.pending = []
+        self.running = []
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def schedule(self, *actions):
+        for action in actions:
+            if action not in self.pending and action not in self.running:
+                self.pending.append(action)
+        if self.pending:
+            self.timer.start()
+
+    def flush(self):
+        self.timer.stop()
+        self.running, self.pending = self.pending, []
+        while self.running:
+            action = self.running.pop(0)
+            action()
+
+    def cancel(self):
+        self.timer.stop()
+        self.pending = []
+
+
+def watch_inputs(widgets, callback):
+    # connect each input's change signal to callback once, however often it is called
+    for widget in widgets:
+        if widget.property("watched") or isinstance(widget.parent(), (QComboBox, QSpinBox, QDoubleSpinBox)):
+            continue        # already connected, or the line edit inside a spin box / combo box
+        if isinstance(widget, QComboBox):
+            widget.currentTextChanged.connect(callback)
+        elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+            widget.valueChanged.connect(callback)
+        elif isinstance(widget, QLineEdit):
+            widget.textChanged.connect(callback)
+        else:
+            continue
+        widget.setProperty("watched", True)
+
+
+class StaleResultBanner(QLabel):
+    """
+    Warning strip over a result panel, shown while the panel no longer matches the inputs
+    (the last recalculation failed). mark_stale(message) shows it and logs the error,
+    clear() hides it again once a result for the current inputs arrives.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWordWrap(True)
+        self.setStyleSheet("""
+            QLabel {
+                background-color: #fff2c7;
+                color: #7a5a00;
+                border: 1px solid #e0c060;
+                padding: 4px;
+            }
+        """)
+        self.hide()
+
+    def mark_stale(self, message):
+        logger.warning("Recalculation failed, showing previous results: %s", message)
+        self.setText(f"Results are out of date: the inputs could not be calculated ({message}).")
+        self.show()
+
+    def clear(self):
+        self.hide()
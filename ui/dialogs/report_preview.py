@@ -1,29 +1,28 @@
 import os
 import shutil
-from PyQt5 import QtCore, QtWebEngineWidgets
+from PyQt5 import QtCore
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QFileDialog, QHBoxLayout, QMessageBox
 )
 
+from ui.temp_files import temp_files
+from ui.web_host import HostedWebView
+
 
 class ReportPreviewWindow(QWidget):
     def __init__(self, pdf_path=None):
         super().__init__()
         self.setWindowTitle("Report Preview")
         self.resize(900, 850)
-        self._temp_pdf_path = pdf_path
+        self._temp_pdf_path = None
 
         layout = QVBoxLayout(self)
 
-        # Create the QWebEngineView
-        self.viewer = QtWebEngineWidgets.QWebEngineView()
-        self.viewer.settings().setAttribute(
-            QtWebEngineWidgets.QWebEngineSettings.PluginsEnabled, True)
-        self.viewer.settings().setAttribute(
-            QtWebEngineWidgets.QWebEngineSettings.PdfViewerEnabled, True)
+        # Create the web view (shared profile has the PDF viewer enabled)
+        self.viewer = HostedWebView()
 
         if pdf_path:
-            self.viewer.load(QtCore.QUrl.fromUserInput(pdf_path))
+            self.open_pdf(pdf_path)
 
         # Save PDF button
         self.save_btn = QPushButton("Save PDF")
@@ -50,6 +49,13 @@ class ReportPreviewWindow(QWidget):
         layout.addWidget(self.viewer)
         layout.addLayout(btn_layout)
 
+    def open_pdf(self, pdf_path):
+        # show another report in this window; the previous temp PDF is released
+        if self._temp_pdf_path and self._temp_pdf_path != pdf_path:
+            temp_files.release(self._temp_pdf_path)
+        self._temp_pdf_path = pdf_path
+        self.viewer.load(QtCore.QUrl.fromUserInput(pdf_path))
+
     def save_pdf(self):
         if not self._temp_pdf_path or not os.path.exists(self._temp_pdf_path):
             QMessageBox.warning(self, "Error", "Temporary PDF file not found.")
@@ -73,9 +79,24 @@ class ReportPreviewWindow(QWidget):
                 QMessageBox.critical(self, "Error", f"Failed to save PDF:\n{e}")
 
     def closeEvent(self, event):
-        if self._temp_pdf_path and os.path.exists(self._temp_pdf_path):
-            try:
-                os.remove(self._temp_pdf_path)
-            except PermissionError:
-                pass  # File is still locked
+        # unload the viewer first so the file is not locked; one that still is gets
+        # removed by the registry at exit
+        self.viewer.setUrl(QtCore.QUrl("about:blank"))
+        temp_files.release(self._temp_pdf_path)
+        self._temp_pdf_path = None
         event.accept()
+
+
+_preview = None
+
+
+def show_preview(pdf_path):
+    # the app's one preview window, reused for every report so previews never stack up
+    global _preview
+    if _preview is None:
+        _preview = ReportPreviewWindow()
+    _preview.open_pdf(pdf_path)
+    _preview.show()
+    _preview.raise_()
+    _preview.activateWindow()
+    return _preview
@@ -1,12 +1,14 @@
 import sys
 import os
+from itertools import accumulate
 from PyQt5.QtWidgets import (
     QDialog, QFormLayout, QDoubleSpinBox, QLineEdit,
     QDialogButtonBox, QLabel, QHBoxLayout, QVBoxLayout,
-    QTextEdit, QComboBox, QGroupBox, QScrollArea, QWidget, QMessageBox
+    QTextEdit, QComboBox, QGroupBox, QMessageBox,
+    QApplication, QTableView, QHeaderView, QAbstractItemView
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QPixmap, QKeySequence
 import math
 
 
@@ -17,6 +19,178 @@ def resource_path(relative_path):
 
 
 
+def parse_height(value):
+    try:
+        height = float(str(value).strip())
+    except ValueError:
+        raise ValueError(f"'{value}' is not a valid floor height.") from None
+    if height <= 0:
+        raise ValueError(f"Floor height must be positive, got {height:g}.")
+    return height
+
+
+class FloorHeightsModel(QAbstractTableModel):
+    """
+    Floor table: storey height (editable), elevation of the floor top (cumulative
+    height) and the selected-for-C&C flag, one row per level.
+
+    Parameters:
+        heights : list - Storey height of each level (m)
+        selected_levels : iterable - 1-based levels checked for C&C pressure
+    """
+
+    HEIGHT, ELEVATION, SELECTED = range(3)
+    HEADERS = ["Height (m)", "Elevation (m)", "C&C"]
+    TRUE_TEXT = {"1", "x", "y", "yes", "true"}
+
+    selection_changed = pyqtSignal()
+
+    def __init__(self, heights, selected_levels=(), parent=None):
+        super().__init__(parent)
+        self.heights = [float(h) for h in heights]
+        self.elevations = list(accumulate(self.heights))
+        self.selected = set(selected_levels)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.heights)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # called only for the rows on screen
+        row, column = index.row(), index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if column == self.HEIGHT:
+                return str(self.heights[row])
+            if column == self.ELEVATION:
+                return f"{self.elevations[row]:.2f}"
+        elif role == Qt.CheckStateRole and column == self.SELECTED:
+            return Qt.Checked if row + 1 in self.selected else Qt.Unchecked
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return f"Level {section + 1}"
+
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == self.HEIGHT:
+            flags |= Qt.ItemIsEditable
+        elif index.column() == self.SELECTED:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if index.column() == self.HEIGHT and role == Qt.EditRole:
+            try:
+                self.set_heights(index.row(), [parse_height(value)])
+            except ValueError:
+                return False
+            return True
+        if index.column() == self.SELECTED and role == Qt.CheckStateRole:
+            self.set_flags(index.row(), [value == Qt.Checked])
+            return True
+        return False
+
+    def set_heights(self, row, heights):
+        # heights of levels row+1.. ; every elevation from row down changes with them
+        self.heights[row:row + len(heights)] = heights
+        self.elevations = list(accumulate(self.heights))
+        last = len(self.heights) - 1
+        self.dataChanged.emit(self.index(row, self.HEIGHT), self.index(row + len(heights) - 1, self.HEIGHT))
+        self.dataChanged.emit(self.index(row, self.ELEVATION), self.index(last, self.ELEVATION))
+
+    def set_flags(self, row, flags):
+        for level, flag in enumerate(flags, start=row + 1):
+            if flag:
+                self.selected.add(level)
+            else:
+                self.selected.discard(level)
+        self.dataChanged.emit(
+            self.index(row, self.SELECTED), self.index(row + len(flags) - 1, self.SELECTED), [Qt.CheckStateRole]
+        )
+        self.selection_changed.emit()
+
+    def set_selected_levels(self, levels):
+        self.selected = set(levels)
+        self.dataChanged.emit(
+            self.index(0, self.SELECTED), self.index(len(self.heights) - 1, self.SELECTED), [Qt.CheckStateRole]
+        )
+
+    def selected_levels(self):
+        return sorted(self.selected)
+
+    def paste(self, row, column, text):
+        """
+        Paste tab-separated rows (spreadsheet clipboard) starting at (row, column).
+        Cells are checked first; one bad cell rejects the whole paste. The elevation
+        column is read-only and skipped, rows past the last level are dropped.
+        """
+        lines = [line.split("\t") for line in text.splitlines() if line.strip()]
+        lines = lines[:len(self.heights) - row]
+
+        columns = set(range(column, column + max((len(cells) for cells in lines), default=0)))
+        heights, flags = [], []
+        for n, cells in enumerate(lines):
+            # a row shorter than the others keeps its current values
+            height = self.heights[row + n]
+            flag = row + n + 1 in self.selected
+            for target, cell in enumerate(cells, start=column):
+                if target == self.HEIGHT:
+                    try:
+                        height = parse_height(cell)
+                    except ValueError as e:
+                        raise ValueError(f"Pasted row {n + 1}: {e}") from None
+                elif target == self.SELECTED:
+                    flag = cell.strip().lower() in self.TRUE_TEXT
+            heights.append(height)
+            flags.append(flag)
+
+        if lines and self.HEIGHT in columns:
+            self.set_heights(row, heights)
+        if lines and self.SELECTED in columns:
+            self.set_flags(row, flags)
+        return len(lines)
+
+    def copy(self, indexes):
+        # tab-separated text of the selected cells, rows in level order
+        rows = {}
+        for index in sorted(indexes, key=lambda i: (i.row(), i.column())):
+            if index.column() == self.SELECTED:
+                value = "1" if index.row() + 1 in self.selected else "0"
+            else:
+                value = self.data(index)
+            rows.setdefault(index.row(), []).append(value)
+        return "\n".join("\t".join(cells) for cells in rows.values())
+
+
+class FloorHeightsTable(QTableView):
+    # floor table with spreadsheet copy (Ctrl+C) and bulk paste (Ctrl+V)
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Paste):
+            self.paste()
+        elif event.matches(QKeySequence.Copy):
+            QApplication.clipboard().setText(self.model().copy(self.selectedIndexes()))
+        else:
+            super().keyPressEvent(event)
+
+    def paste(self):
+        index = self.currentIndex()
+        row = max(index.row(), 0)
+        column = index.column() if index.isValid() else FloorHeightsModel.HEIGHT
+        try:
+            self.model().paste(row, column, QApplication.clipboard().text())
+        except ValueError as e:
+            QMessageBox.warning(self, "Paste Error", str(e))
+
+
 class FloorHeightsDialog(QDialog):
     def __init__(self, num_floors, initial_heights=None, initial_selected_levels=None, parent=None):
         super().__init__(parent)
@@ -25,19 +199,7 @@ class FloorHeightsDialog(QDialog):
 
         self.num_floors = num_floors
         self.initial_heights = [float(h) for h in (initial_heights or [3.2] * num_floors)]
-
-        self.floor_height_inputs = []
-
-        # Scrollable area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        # scroll.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-        container = QWidget()
-        self.floor_heights_layout = QVBoxLayout(container)
-        self.floor_heights_layout.setAlignment(Qt.AlignTop)
-        scroll.setWidget(container)
-        
-        self.update_floor_inputs()
+        heights = (self.initial_heights + [3.2] * num_floors)[:num_floors]
 
         # selected level for c&c
         if initial_selected_levels is None:
@@ -47,6 +209,23 @@ class FloorHeightsDialog(QDialog):
         
         self.selected_levels_input = QLineEdit(initial_selected_levels)
         self.selected_levels_input.setPlaceholderText("e.g., 1, 3, 5")
+
+        # Floor table (model/view: only the rows on screen are drawn)
+        try:
+            selected_levels = self.get_selected_levels()
+        except ValueError:
+            selected_levels = []
+        self.model = FloorHeightsModel(heights, selected_levels, self)
+
+        self.table = FloorHeightsTable()
+        self.table.setModel(self.model)
+        self.table.setSelectionMode(QAbstractItemView.ContiguousSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+
+        self.model.selection_changed.connect(self.on_levels_checked)
+        self.selected_levels_input.textEdited.connect(self.on_levels_edited)
         
         # Dialog buttons
         self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -55,37 +234,25 @@ class FloorHeightsDialog(QDialog):
         
         # add to layout
         layout = QVBoxLayout(self)
-        layout.addWidget(scroll)
+        layout.addWidget(self.table)
+        layout.addWidget(QLabel("Ctrl+V pastes heights copied from a spreadsheet."))
         layout.addWidget(QLabel("Levels for C&C Pressure:"))
         layout.addWidget(self.selected_levels_input)
         layout.addWidget(self.buttons)
 
-    def update_floor_inputs(self):
-        for i in reversed(range(self.floor_heights_layout.count())):
-            item = self.floor_heights_layout.itemAt(i)
-            if item.layout():
-                layout = item.layout()
-                for j in reversed(range(layout.count())):
-                    child = layout.itemAt(j).widget()
-                    if child:
-                        child.setParent(None)
-                self.floor_heights_layout.removeItem(item)
-
-        self.floor_height_inputs.clear()
-        for i in range(self.num_floors):
-            row = QHBoxLayout()
-            label = QLabel(f"Level {i + 1}:")
-            inp = QLineEdit(str(self.initial_heights[i]) if i < len(self.initial_heights) else "3.2")
-            row.addWidget(label)
-            row.addWidget(inp)
-            self.floor_heights_layout.addLayout(row)
-            self.floor_height_inputs.append(inp)
+    def on_levels_checked(self):
+        self.selected_levels_input.setText(", ".join(str(lvl) for lvl in self.model.selected_levels()))
 
-    def get_floor_heights(self):
+    def on_levels_edited(self, text):
+        # mirror the typed levels in the table once they parse
         try:
-            return [float(inp.text()) for inp in self.floor_height_inputs]
-        except ValueError as e:
-            raise ValueError("Invalid floor height input. Please ensure all values are numeric.") from e
+            self.model.set_selected_levels(self.get_selected_levels())
+        except ValueError:
+            pass
+
+    def get_floor_heights(self):
+        # heights are validated as they are typed or pasted
+        return list(self.model.heights)
 
     def get_selected_levels(self):
         raw = self.selected_levels_input.text()
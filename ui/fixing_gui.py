@@ -1,6 +1,5 @@
 import sys
 import os
-import tempfile
 from datetime import date
 
 from PyQt5.QtWidgets import (
@@ -9,16 +8,14 @@ from PyQt5.QtWidgets import (
     QFormLayout, QRadioButton, QMessageBox, QSizePolicy, QLabel
 )
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtCore import QUrl, QSize, Qt
 
-from weasyprint import HTML, CSS
-from jinja2 import Environment, FileSystemLoader
 
 # from calcs.wind_load import WindLoadCalculator
 from calcs.fixing import BoxClumpCalculator, UClumpCalculator
 # from ui.dialogs.fixing_dialog import NFLDialog
-from ui.dialogs.report_preview import ReportPreviewWindow
+from ui.dialogs.report_preview import show_preview
+from ui.web_host import ResultView
 
 
 def resource_path(relative_path):
@@ -117,7 +114,7 @@ class FixingTab(QWidget):
 
 
         # === Right Panel ===
-        self.result_webview = QWebEngineView()
+        self.result_webview = ResultView()
         self.report_btn = QPushButton("View Report")
         self.report_btn.setFixedSize(110, 30)
         self.report_btn.setStyleSheet("""
@@ -732,15 +729,15 @@ class FixingTab(QWidget):
 
     # def update_results(self):
     #     try:
+    #         from ui.rendering import render_result
     #         result_temp_path = resource_path("ui/renders")
-    #         env = Environment(loader=FileSystemLoader(result_temp_path))
-    #         template = env.get_template("glass.html")
-    #         combined_html = template.render(
+    #         combined_html = render_result(
+    #             "glass.html",
     #             summary=self.summary,
     #             composition=self.fixing_comp_type_input.currentText()
     #         )
     #         base_url = QUrl.fromLocalFile(os.path.abspath(result_temp_path) + "/")
-    #         self.result_webview.setHtml(combined_html, base_url)
+    #         self.result_webview.show_html(combined_html, base_url)
     #         # print("Rendering with summary:", self.summary)
         
     #     except Exception as e:
@@ -759,28 +756,17 @@ class FixingTab(QWidget):
     #             "date_time": date.today().strftime("%d/%m/%Y")
     #         }
 
-    #         report_temp_path = resource_path("reports/templates")
-    #         env = Environment(loader=FileSystemLoader(report_temp_path))
-    #         template = env.get_template("glass.html")
+    #         from ui.rendering import render_report
+    #         from ui.pdf_worker import start_report
 
-    #         html_content = template.render(
+    #         html_content = render_report(
+    #             "glass.html",
     #             project_info=project_info,
     #             summary=self.summary,
     #             composition=self.fixing_comp_type_input.currentText()
     #         )
-            
-    #         # Generate Temporary PDF File
-    #         temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    #         pdf_path = temp_pdf.name
-    #         temp_pdf.close()
-            
-    #         HTML(string=html_content, base_url=report_temp_path).write_pdf(
-    #             pdf_path,
-    #             stylesheets=[CSS(filename=os.path.join(report_temp_path, "css/report.css"))]
-    #         )
 
-    #         self.preview_window = ReportPreviewWindow(pdf_path)
-    #         self.preview_window.show()
+    #         start_report(self, html_content, self.show_report)
 
     #     except Exception as e:
     #         QMessageBox.critical(self, "Error", f"Failed to preview report: {str(e)}")
@@ -1,6 +1,5 @@
 import sys
 import os
-import tempfile
 from datetime import date
 
 from PyQt5.QtWidgets import (
@@ -9,16 +8,17 @@ from PyQt5.QtWidgets import (
     QFormLayout, QRadioButton, QMessageBox, QSizePolicy, QLabel
 )
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtCore import QUrl, QSize, Qt
 
-from weasyprint import HTML, CSS
-from jinja2 import Environment, FileSystemLoader
-
 # from calcs.wind_load import WindLoadCalculator
 from calcs.glass import SGUCalculator, DGUCalculator, LGUCalculator, LDGUCalculator
 from ui.dialogs.glass_dialog import NFLDialog
-from ui.dialogs.report_preview import ReportPreviewWindow
+from ui.dialogs.report_preview import show_preview
+from ui.web_host import ResultView
+from ui.jobs import JobRunner
+from ui.rendering import render_result, render_report
+from ui.pdf_worker import start_report
+from ui.debounce import RecalcScheduler, StaleResultBanner, watch_inputs
 
 
 def resource_path(relative_path):
@@ -27,12 +27,49 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+# calculation and rendering, run on a worker thread (no widget access)
+def render_results(summary, composition):
+    return render_result("glass.html", summary=summary, composition=composition)
+
+
+def calculate_glass(comp_type, params):
+    if "Single Glaze Unit (SGU)" in comp_type:
+        calculator = SGUCalculator(**params)
+    elif "Double Glaze Unit (DGU)" in comp_type:
+        calculator = DGUCalculator(**params)
+    elif "Laminated Glaze Unit (LGU)" in comp_type:
+        calculator = LGUCalculator(**params)
+    elif "Laminated Double Glaze Unit (LDGU)" in comp_type:
+        calculator = LDGUCalculator(**params)
+
+    summary = calculator.summary()
+    return summary, render_results(summary, comp_type)
+
+
+def report_html(summary, composition):
+    project_info = {
+        # "project_name": "Taj & Vivanta Hotel",
+        # "ref_no": "REF# RFA-001/REV-02/AEL/CW/2025",
+        "rev_no": "02",
+        "date_time": date.today().strftime("%d/%m/%Y")
+    }
+
+    return render_report(
+        "glass.html",
+        project_info=project_info,
+        summary=summary,
+        composition=composition
+    )
+
+
 class GlassTab(QWidget):
     def __init__(self, wind_data=None):
         super().__init__()
         self.wind_data = wind_data
         self.wind_calculator = None  # Will store WindLoadCalculator instance
         self.summary = None
+        self.jobs = JobRunner(self)
+        self.recalc = RecalcScheduler(self)     # one recompute per burst of input changes
         self.initUI()
 
     def initUI(self):
@@ -88,11 +125,11 @@ class GlassTab(QWidget):
         self.facade_elevation_input = QLineEdit()
         self.facade_elevation_input.setText("4")
         self.facade_elevation_input.setEnabled(False)
-        self.facade_elevation_input.textChanged.connect(self.update_wind_load)
+        self.facade_elevation_input.textChanged.connect(self.on_wind_input_changed)
         
         self.zone_input = QComboBox()
         self.zone_input.addItems(["Zone 1", "Zone 2", "Zone 3", "Zone 4", "Zone 5"])
-        self.zone_input.currentTextChanged.connect(self.update_wind_load)
+        self.zone_input.currentTextChanged.connect(self.on_wind_input_changed)
         
         self.wind_load_input = QDoubleSpinBox()
         self.wind_load_input.setRange(0, 100)
@@ -109,7 +146,8 @@ class GlassTab(QWidget):
         wind_group.setFixedWidth(380)
 
         # === Right Panel ===
-        self.result_webview = QWebEngineView()
+        self.result_webview = ResultView()
+        self.stale_banner = StaleResultBanner()
         self.report_btn = QPushButton("View Report")
         self.report_btn.setFixedSize(110, 30)
         self.report_btn.setStyleSheet("""
@@ -140,6 +178,7 @@ class GlassTab(QWidget):
         left_scroll.setStyleSheet("QScrollArea { border: none; }")
 
         output_layout = QVBoxLayout()
+        output_layout.addWidget(self.stale_banner)
         output_layout.addWidget(self.result_webview)
         output_layout.addWidget(self.report_btn, alignment=Qt.AlignRight)
         output_group = QGroupBox("Glass Design Results")
@@ -160,14 +199,12 @@ class GlassTab(QWidget):
         self.length_input = QSpinBox()
         self.length_input.setRange(600, 5000)
         self.length_input.setValue(1500)
-        self.length_input.valueChanged.connect(self.update_wind_load)
-        self.length_input.valueChanged.connect(self.update_effective_area)
+        self.length_input.valueChanged.connect(self.on_size_changed)
         
         self.width_input = QSpinBox()
         self.width_input.setRange(600, 5000)
         self.width_input.setValue(1200)
-        self.width_input.valueChanged.connect(self.update_wind_load)
-        self.width_input.valueChanged.connect(self.update_effective_area)
+        self.width_input.valueChanged.connect(self.on_size_changed)
         
         self.params_form.addRow("Glass Length (mm):", self.length_input)
         self.params_form.addRow("Glass Width (mm):", self.width_input)
@@ -187,6 +224,9 @@ class GlassTab(QWidget):
         elif "Laminated Double Glaze Unit (LDGU)" in composition:
             self.add_ldgu_inputs()
 
+        # every input of the tab, the new composition rows included, triggers a live recalc
+        watch_inputs(self.findChildren(QWidget), self.on_input_changed)
+
     def add_sgu_inputs(self):
         self.thickness_input = QComboBox()
         self.thickness_input.addItems(["2.5", "2.7", "3", "4", "5", "6", "8", "10", "12", "16", "19", "22"])
@@ -412,6 +452,20 @@ class GlassTab(QWidget):
         dialog.exec_()
 
 
+    def on_size_changed(self):
+        self.recalc.schedule(self.update_effective_area, self.update_wind_load, self.live_calculate)
+
+    def on_wind_input_changed(self):
+        self.recalc.schedule(self.update_wind_load, self.live_calculate)
+
+    def on_input_changed(self):
+        self.recalc.schedule(self.live_calculate)
+
+    def live_calculate(self):
+        # keep a shown result in step with the inputs; nothing to refresh before the first run
+        if self.summary is not None:
+            self.calculate(live=True)
+
     def on_wind_mode_changed(self):
         is_manual = self.manual_radio.isChecked()
         self.wind_load_input.setEnabled(is_manual)
@@ -505,40 +559,42 @@ class GlassTab(QWidget):
             }
 
     def trigger_calculate(self):
+        self.recalc.cancel()
         self.calculate()
 
-    def calculate(self):
+    def calculate(self, live=False):
+        # a live recalc flags the last result as stale instead of raising a dialog per keystroke
+        def failed(message):
+            if self.summary is not None:
+                self.stale_banner.mark_stale(message)
+            if not live:
+                QMessageBox.critical(self, "Error", f"Calculation failed: {message}")
+
         try:
             comp_type = self.glass_comp_type_input.currentText()
             params = self.get_calculation_params()
-            
-            if "Single Glaze Unit (SGU)" in comp_type:
-                calculator = SGUCalculator(**params)
-            elif "Double Glaze Unit (DGU)" in comp_type:
-                calculator = DGUCalculator(**params)
-            elif "Laminated Glaze Unit (LGU)" in comp_type:
-                calculator = LGUCalculator(**params)
-            elif "Laminated Double Glaze Unit (LDGU)" in comp_type:
-                calculator = LDGUCalculator(**params)
-
-            self.summary = calculator.summary()
-            self.update_results()
-            
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Calculation failed: {str(e)}")
+            failed(str(e))
+            return
+        self.jobs.submit(
+            "calculate", calculate_glass, comp_type, params,
+            on_result=self.show_results,
+            on_error=failed
+        )
+
+    def show_results(self, result):
+        self.summary, combined_html = result
+        self.stale_banner.clear()
+        self.set_result_html(combined_html)
+
+    def set_result_html(self, combined_html):
+        result_temp_path = resource_path("ui/renders")
+        base_url = QUrl.fromLocalFile(os.path.abspath(result_temp_path) + "/")
+        self.result_webview.show_html(combined_html, base_url)
 
     def update_results(self):
         try:
-            result_temp_path = resource_path("ui/renders")
-            env = Environment(loader=FileSystemLoader(result_temp_path))
-            template = env.get_template("glass.html")
-            combined_html = template.render(
-                summary=self.summary,
-                composition=self.glass_comp_type_input.currentText()
-            )
-            base_url = QUrl.fromLocalFile(os.path.abspath(result_temp_path) + "/")
-            self.result_webview.setHtml(combined_html, base_url)
-            # print("Rendering with summary:", self.summary)
+            self.set_result_html(render_results(self.summary, self.glass_comp_type_input.currentText()))
         
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to render results: {str(e)}")
@@ -549,36 +605,12 @@ class GlassTab(QWidget):
             return
 
         try:
-            project_info = {
-                # "project_name": "Taj & Vivanta Hotel",
-                # "ref_no": "REF# RFA-001/REV-02/AEL/CW/2025",
-                "rev_no": "02",
-                "date_time": date.today().strftime("%d/%m/%Y")
-            }
-
-            report_temp_path = resource_path("reports/templates")
-            env = Environment(loader=FileSystemLoader(report_temp_path))
-            template = env.get_template("glass.html")
-
-            html_content = template.render(
-                project_info=project_info,
-                summary=self.summary,
-                composition=self.glass_comp_type_input.currentText()
-            )
-            
-            # Generate Temporary PDF File
-            temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            pdf_path = temp_pdf.name
-            temp_pdf.close()
-            
-            HTML(string=html_content, base_url=report_temp_path).write_pdf(
-                pdf_path,
-                stylesheets=[CSS(filename=os.path.join(report_temp_path, "css/report.css"))]
-            )
-
-            self.preview_window = ReportPreviewWindow(pdf_path)
-            self.preview_window.show()
-
+            html_content = report_html(self.summary, self.glass_comp_type_input.currentText())
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to preview report: {str(e)}")
+            return
+
+        start_report(self, html_content, self.show_report)
 
+    def show_report(self, pdf_path):
+        self.preview_window = show_preview(pdf_path)
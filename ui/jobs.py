@@ -0,0 +1,117 @@
+import itertools
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+
+class JobSignals(QObject):
+    finished = pyqtSignal(int, object)      # job id, result
+    failed = pyqtSignal(int, str)           # job id, error message
+    done = pyqtSignal(int)                  # job id, always last, cancelled or not
+
+
+class Job(QRunnable):
+    """
+    One function call on a QThreadPool thread.
+
+    Cancelling is cooperative: a job that has not started yet never runs, a running
+    job finishes but its result is dropped. func must not touch any widget.
+    """
+
+    def __init__(self, job_id, func, args, kwargs):
+        super().__init__()
+        self.job_id = job_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+        self.signals = JobSignals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        try:
+            if self.cancelled:
+                return
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            if not self.cancelled:
+                self.signals.failed.emit(self.job_id, str(e))
+        else:
+            if not self.cancelled:
+                self.signals.finished.emit(self.job_id, result)
+        finally:
+            self.signals.done.emit(self.job_id)
+
+
+class JobRunner(QObject):
+    """
+    Runs a tab's calculations and renders off the GUI thread, one job per key.
+
+    submit("calculate", func, params, on_result=..., on_error=...) starts func(params) on
+    the shared QThreadPool. A new job on the same key supersedes the previous one: it is
+    cancelled (dropped from the queue if still waiting) and its result never delivered.
+    Callbacks run on the GUI thread.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self.jobs = {}          # key -> (job, on_result, on_error)
+        self.started = {}       # job id -> job, until it is done (a cancelled one may still run)
+
+    def submit(self, key, func, *args, on_result=None, on_error=None, **kwargs):
+        self.cancel(key)
+        job = Job(next(self._ids), func, args, kwargs)
+        job.setAutoDelete(False)        # kept alive by self.started instead
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        job.signals.done.connect(self._on_done)
+        self.jobs[key] = (job, on_result, on_error)
+        self.started[job.job_id] = job
+        self.pool.start(job)
+        return job
+
+    def cancel(self, key=None):
+        keys = list(self.jobs) if key is None else [key]
+        for k in keys:
+            if k in self.jobs:
+                job = self.jobs.pop(k)[0]
+                job.cancel()
+                if self.pool.tryTake(job):
+                    self.started.pop(job.job_id, None)
+
+    def is_running(self, key):
+        return key in self.jobs
+
+    def active_count(self):
+        # jobs still queued or running, superseded ones included
+        return len(self.started)
+
+    def _pop(self, job_id):
+        # the current job with this id, None if it was superseded or cancelled
+        for key, (job, on_result, on_error) in list(self.jobs.items()):
+            if job.job_id == job_id:
+                del self.jobs[key]
+                return on_result, on_error
+        return None
+
+    @pyqtSlot(int, object)
+    def _on_finished(self, job_id, result):
+        callbacks = self._pop(job_id)
+        if callbacks and callbacks[0]:
+            callbacks[0](result)
+
+    @pyqtSlot(int, str)
+    def _on_failed(self, job_id, message):
+        callbacks = self._pop(job_id)
+        if callbacks and callbacks[1]:
+            callbacks[1](message)
+
+    @pyqtSlot(int)
+    def _on_done(self, job_id):
+        self.started.pop(job_id, None)
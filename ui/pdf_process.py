@@ -0,0 +1,26 @@
+# report PDF worker process; kept free of Qt so the spawned process only imports
+# WeasyPrint and the report renderer
+
+
+def serve(requests, events):
+    # render (job_id, html_content, pdf_path) requests one at a time until None arrives
+    renderer = None
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        job_id, html_content, pdf_path = request
+
+        def progress(percent, message, job_id=job_id):
+            events.put((job_id, "progress", percent, message))
+
+        try:
+            if renderer is None:
+                progress(5, "Loading report engine...")
+                from ui.report_renderer import report_renderer
+                renderer = report_renderer()
+            renderer.write_pdf(html_content, pdf_path, progress)
+        except Exception as e:
+            events.put((job_id, "failed", str(e)))
+        else:
+            events.put((job_id, "finished", pdf_path))
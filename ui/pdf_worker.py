@@ -0,0 +1,189 @@
+import itertools
+import multiprocessing
+import queue
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer, Qt
+from PyQt5.QtWidgets import QApplication, QProgressDialog, QMessageBox
+
+from ui.pdf_process import serve
+from ui.temp_files import temp_files
+
+
+class PdfWorker(QObject):
+    """
+    Writes report PDFs in a separate process, so WeasyPrint's layout never holds the
+    GUI process's GIL.
+
+    submit(html_content, ...) gets a registered temp PDF path (temp_files) and queues the
+    job; the process renders one job at a time and keeps its ReportRenderer caches between
+    reports. Events are polled on the GUI thread, so every callback runs there:
+    on_progress(percent, message), on_finished(pdf_path), on_failed(message).
+
+    cancel(job_id) drops a queued job, or terminates the process for the running one (it
+    is restarted for the next report). A new job from the same owner cancels the owner's
+    previous one.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, parent=None, poll_ms=100):
+        super().__init__(parent)
+        self.context = multiprocessing.get_context("spawn")
+        self.process = None
+        self.requests = None
+        self.events = None
+        self.waiting = deque()      # (job_id, html_content, pdf_path) not sent yet
+        self.current = None         # job id being written by the process
+        self.jobs = {}              # job id -> (owner, pdf_path, callbacks)
+        self.timer = QTimer(self)
+        self.timer.setInterval(poll_ms)
+        self.timer.timeout.connect(self.poll)
+
+    def submit(self, html_content, owner=None, on_progress=None, on_finished=None, on_failed=None,
+               on_cancelled=None):
+        for job_id, job in list(self.jobs.items()):
+            if owner is not None and job[0] is owner:
+                self.cancel(job_id)
+
+        job_id = next(self._ids)
+        pdf_path = temp_files.new_file(".pdf")
+        self.jobs[job_id] = (owner, pdf_path, (on_progress, on_finished, on_failed, on_cancelled))
+        self.waiting.append((job_id, html_content, pdf_path))
+        self.dispatch()
+        return job_id
+
+    def cancel(self, job_id):
+        if job_id not in self.jobs:
+            return          # already finished, failed or cancelled
+        owner, pdf_path, callbacks = self.jobs.pop(job_id)
+        if job_id == self.current:
+            self.stop_process()
+        else:
+            self.waiting = deque(job for job in self.waiting if job[0] != job_id)
+        temp_files.release(pdf_path)
+        if callbacks[3]:
+            callbacks[3]()
+        self.dispatch()
+
+    def is_running(self, job_id):
+        return job_id in self.jobs
+
+    def start_process(self):
+        self.requests = self.context.Queue()
+        self.events = self.context.Queue()
+        self.process = self.context.Process(target=serve, args=(self.requests, self.events), daemon=True)
+        self.process.start()
+
+    def stop_process(self):
+        # a terminated process may leave its queues half written, so they go with it
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join(1)
+        self.process = self.requests = self.events = None
+        self.current = None
+
+    def dispatch(self):
+        if self.current is None and self.waiting:
+            if self.process is None or not self.process.is_alive():
+                self.start_process()
+            request = self.waiting.popleft()
+            self.current = request[0]
+            self.requests.put(request)
+        if self.current is None:
+            self.timer.stop()
+        elif not self.timer.isActive():
+            self.timer.start()
+
+    def poll(self):
+        while self.events is not None:
+            try:
+                job_id, kind, *data = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if job_id not in self.jobs:
+                continue
+            callbacks = self.jobs[job_id][2]
+            if kind == "progress":
+                if callbacks[0]:
+                    callbacks[0](*data)
+                continue
+
+            owner, pdf_path, callbacks = self.jobs.pop(job_id)
+            self.current = None
+            if kind == "finished":
+                if callbacks[1]:
+                    callbacks[1](pdf_path)
+            else:
+                temp_files.release(pdf_path)
+                if callbacks[2]:
+                    callbacks[2](data[0])
+
+        if self.current is not None and not self.process.is_alive():
+            owner, pdf_path, callbacks = self.jobs.pop(self.current)
+            self.stop_process()
+            temp_files.release(pdf_path)
+            if callbacks[2]:
+                callbacks[2]("Report worker stopped unexpectedly.")
+        self.dispatch()
+
+    def shutdown(self):
+        for job_id in list(self.jobs):
+            self.cancel(job_id)
+        if self.process is not None and self.process.is_alive():
+            self.requests.put(None)
+            self.process.join(2)
+        self.stop_process()
+
+
+_worker = None
+
+
+def pdf_worker():
+    # the app's PdfWorker; its process is started with the first report
+    global _worker
+    if _worker is None:
+        _worker = PdfWorker()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_worker.shutdown)
+    return _worker
+
+
+def start_report(parent, html_content, on_written):
+    """
+    Write html_content to a temp PDF in the worker process behind a cancellable progress
+    dialog, then call on_written(pdf_path). A newer report from the same parent replaces
+    one still being written.
+
+    Parameters:
+        parent : QWidget - Tab asking for the report (owner and dialog parent)
+        html_content : str - Rendered report HTML
+        on_written : callable - Called with the PDF path once the file is complete
+    """
+    dialog = QProgressDialog("Preparing report...", "Cancel", 0, 100, parent)
+    dialog.setWindowTitle("Report")
+    dialog.setWindowModality(Qt.NonModal)
+    dialog.setMinimumDuration(300)      # quick reports open without flashing a dialog
+
+    def on_progress(percent, message):
+        dialog.setLabelText(message)
+        dialog.setValue(percent)
+
+    def on_finished(pdf_path):
+        dialog.close()
+        on_written(pdf_path)
+
+    def on_failed(message):
+        dialog.close()
+        QMessageBox.critical(parent, "Error", f"Failed to preview report: {message}")
+
+    worker = pdf_worker()
+    job_id = worker.submit(
+        html_content, owner=parent,
+        on_progress=on_progress, on_finished=on_finished, on_failed=on_failed,
+        on_cancelled=dialog.close
+    )
+    dialog.canceled.connect(lambda: worker.cancel(job_id))
+    dialog.setValue(0)
+    return job_id
@@ -0,0 +1,52 @@
+import sys
+import os
+import tempfile
+
+
+def resource_path(relative_path):
+    if hasattr(sys, "_MEIPASS"):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.join(os.path.abspath("."), relative_path)
+
+
+RESULT_TEMPLATES = resource_path("ui/renders")
+REPORT_TEMPLATES = resource_path("reports/templates")
+
+
+def bytecode_cache():
+    # compiled templates kept across runs; a template whose source changed is recompiled
+    from jinja2 import FileSystemBytecodeCache
+    directory = os.path.join(tempfile.gettempdir(), "fad_jinja_cache")
+    os.makedirs(directory, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
+
+
+# one environment per template folder for the whole app: each template is lexed and
+# compiled once, then only re-checked (file mtime) on every get_template. Jinja2 is
+# imported with the first render, not at startup.
+_environments = {}
+_bytecode_cache = None
+
+
+def environment(template_dir):
+    global _bytecode_cache
+    if template_dir not in _environments:
+        from jinja2 import Environment, FileSystemLoader
+        if _bytecode_cache is None:
+            _bytecode_cache = bytecode_cache()
+        _environments[template_dir] = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=_bytecode_cache,
+            auto_reload=True
+        )
+    return _environments[template_dir]
+
+
+def render_result(template_name, **context):
+    # result page HTML for a tab's QWebEngineView
+    return environment(RESULT_TEMPLATES).get_template(template_name).render(**context)
+
+
+def render_report(template_name, **context):
+    # report HTML for WeasyPrint
+    return environment(REPORT_TEMPLATES).get_template(template_name).render(**context)
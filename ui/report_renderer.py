@@ -0,0 +1,104 @@
+import os
+import threading
+
+from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+
+from ui.rendering import REPORT_TEMPLATES
+
+try:
+    from weasyprint.urls import URLFetcher, URLFetcherResponse      # WeasyPrint >= 68
+except ImportError:
+    from weasyprint import default_url_fetcher
+    URLFetcher = None
+
+
+# local files (fonts, report figures, stylesheets) are read once per session;
+# anything else goes to the network every time as before
+if URLFetcher is not None:
+    class CachingURLFetcher(URLFetcher):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.files = {}
+
+        def fetch(self, url, headers=None):
+            if not url.startswith("file:"):
+                return super().fetch(url, headers)
+            if url not in self.files:
+                response = super().fetch(url, headers)
+                try:
+                    self.files[url] = (response.url, response.read(), response.headers, response.status)
+                finally:
+                    response.close()
+            return URLFetcherResponse(*self.files[url])
+
+else:
+    class CachingURLFetcher:
+        def __init__(self):
+            self.files = {}
+
+        def __call__(self, url):
+            if not url.startswith("file:"):
+                return default_url_fetcher(url)
+            if url not in self.files:
+                result = default_url_fetcher(url)
+                if "file_obj" in result:
+                    with result.pop("file_obj") as f:
+                        result["string"] = f.read()
+                self.files[url] = result
+            return dict(self.files[url])
+
+
+class ReportRenderer:
+    """
+    WeasyPrint state kept for the whole session and shared by every report.
+
+    Parameters:
+        template_dir : str - Base URL for the report HTML (relative images, css)
+        stylesheet : str - Report stylesheet, relative to template_dir
+
+    The stylesheet is parsed once, its @font-face fonts are registered once in a shared
+    FontConfiguration, local files are read once (CachingURLFetcher) and decoded images
+    stay in image_cache, so only the first report pays for them. Reports are written one
+    at a time; the shared caches are not meant for concurrent renders.
+    """
+
+    def __init__(self, template_dir=REPORT_TEMPLATES, stylesheet="css/report.css"):
+        self.base_url = template_dir
+        self.font_config = FontConfiguration()
+        self.url_fetcher = CachingURLFetcher()
+        self.image_cache = {}
+        self.stylesheet = CSS(
+            filename=os.path.join(template_dir, stylesheet),
+            font_config=self.font_config,
+            url_fetcher=self.url_fetcher
+        )
+        self.lock = threading.Lock()
+
+    def write_pdf(self, html_content, pdf_path, progress=None):
+        # progress(percent, message) is called before each stage, if given
+        progress = progress or (lambda percent, message: None)
+        with self.lock:
+            progress(15, "Laying out pages...")
+            document = HTML(string=html_content, base_url=self.base_url, url_fetcher=self.url_fetcher).render(
+                stylesheets=[self.stylesheet],
+                font_config=self.font_config,
+                cache=self.image_cache
+            )
+            progress(70, f"Writing {len(document.pages)} pages...")
+            document.write_pdf(pdf_path)
+            progress(100, "Done")
+        return pdf_path
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def report_renderer():
+    # the session's ReportRenderer, created with the first report
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = ReportRenderer()
+        return _renderer
@@ -2,7 +2,7 @@ import sys
 import os
 from PyQt5.QtWidgets import QSplashScreen, QProgressBar, QApplication
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
 
 
 def resource_path(relative_path):
@@ -57,22 +57,8 @@ class SplashScreen(QSplashScreen):
             (geo.height() - self.height()) // 2
         )
 
-        self._callback = None
-
-    def start_loading(self, duration_ms=1000, on_complete=None):
-        self.show()
-        self._step = 0
-        self._callback = on_complete
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self.update_progress)
-        self._timer.start(duration_ms // 100)
-
-    def update_progress(self):
-        if self._step < 100:
-            self._step += 1
-            self.progress.setValue(self._step)
-            self.progress.setFormat(f"Loading... {self._step}%")
-        else:
-            self._timer.stop()
-            if self._callback:
-                self._callback()
+    def set_progress(self, percent, milestone=None):
+        # driven by the startup profiler as each milestone completes
+        self.progress.setValue(percent)
+        self.progress.setFormat(f"Loading... {percent}%")
+        QApplication.processEvents()
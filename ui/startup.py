@@ -0,0 +1,135 @@
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+
+LOG_LIMIT = 256 * 1024      # bytes kept in the startup log
+
+
+def log_path():
+    # FAD_STARTUP_LOG overrides the default log file
+    return os.environ.get("FAD_STARTUP_LOG") or os.path.join(tempfile.gettempdir(), "fad_startup.jsonl")
+
+
+class StartupProfiler:
+    """
+    Wall-clock timeline of the application start, written as JSON lines.
+
+    step(name, kind) times a block (an import, a part of building the main window) and
+    appends one record: run, kind, name, start_ms (since this module was imported),
+    duration_ms, and the top-level packages the block imported for the first time.
+    finish() adds the total. Tabs built later on first activation are logged the same way.
+
+    expect(*names) declares the splash milestones. When a milestone's step ends, the
+    listeners get (percent, name). Each milestone is weighted by its duration in the
+    previous logged run, so the bar follows the real load and not a timer.
+
+    For the time of every single module, run with: python -X importtime main.py
+    """
+
+    def __init__(self, path=None):
+        self.t0 = time.perf_counter()
+        self.run = f"{time.strftime('%Y-%m-%dT%H:%M:%S')}-{os.getpid()}"
+        self.path = path or log_path()
+        self.milestones = []
+        self.weights = {}
+        self.done = []
+        self.listeners = []
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.t0) * 1000
+
+    def expect(self, *milestones):
+        self.milestones = list(milestones)
+        previous = self.previous_durations()
+        default = sum(previous.values()) / len(previous) if previous else 1
+        self.weights = {name: max(previous.get(name, default), 1) for name in self.milestones}
+
+    def previous_durations(self):
+        # milestone -> duration_ms in the last logged run
+        try:
+            with open(self.path) as f:
+                lines = f.readlines()
+        except OSError:
+            return {}
+
+        durations = {}
+        last_run = None
+        for line in reversed(lines):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if last_run is None:
+                last_run = record.get("run")
+            if record.get("run") != last_run:
+                break
+            if record.get("name") in self.milestones:
+                durations.setdefault(record["name"], record["duration_ms"])
+        return durations
+
+    @contextmanager
+    def step(self, name, kind="step"):
+        modules = set(sys.modules)
+        start = self.elapsed_ms()
+        try:
+            yield
+        finally:
+            new = set(sys.modules) - modules
+            self.record(
+                kind=kind,
+                name=name,
+                start_ms=round(start, 1),
+                duration_ms=round(self.elapsed_ms() - start, 1),
+                modules=len(new),
+                packages=sorted({module.split(".")[0] for module in new})
+            )
+            if name in self.weights and name not in self.done:
+                self.done.append(name)
+                self.notify(name)
+
+    def progress(self):
+        total = sum(self.weights.values())
+        if not total:
+            return 100
+        return round(100 * sum(self.weights[name] for name in self.done) / total)
+
+    def notify(self, name):
+        percent = self.progress()
+        for listener in list(self.listeners):
+            listener(percent, name)
+
+    def record(self, **fields):
+        if multiprocessing.parent_process() is not None:
+            return      # a worker process re-importing main.py is not an app start
+        line = json.dumps({"run": self.run, **fields})
+        try:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass        # profiling must never stop the app
+
+    def finish(self):
+        self.record(kind="total", name="startup", start_ms=0, duration_ms=round(self.elapsed_ms(), 1))
+        self.listeners = []
+        self.trim()
+
+    def trim(self):
+        # keep the newest half of the log once it outgrows LOG_LIMIT
+        try:
+            if os.path.getsize(self.path) <= LOG_LIMIT:
+                return
+            with open(self.path) as f:
+                lines = f.readlines()
+            with open(self.path, "w") as f:
+                f.writelines(lines[len(lines) // 2:])
+        except OSError:
+            pass
+
+
+# created with the first import in main.py, so start_ms counts from process start-up
+startup = StartupProfiler()
@@ -0,0 +1,47 @@
+import atexit
+import os
+import tempfile
+import threading
+
+
+class TempFileRegistry:
+    """
+    Temporary files created during the session (report PDFs).
+
+    new_file() hands out a path that stays registered until release() deletes it. A
+    file that cannot be deleted yet (still open in a viewer on Windows) stays registered,
+    and everything still registered is deleted at exit.
+    """
+
+    def __init__(self):
+        self.paths = set()
+        self.lock = threading.Lock()
+
+    def new_file(self, suffix=".pdf"):
+        temp = tempfile.NamedTemporaryFile(delete=False, prefix="fad_", suffix=suffix)
+        temp.close()
+        with self.lock:
+            self.paths.add(temp.name)
+        return temp.name
+
+    def release(self, path):
+        if not path:
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except PermissionError:
+            return          # file is still locked, retried at exit
+        with self.lock:
+            self.paths.discard(path)
+
+    def cleanup(self):
+        with self.lock:
+            paths = list(self.paths)
+        for path in paths:
+            self.release(path)
+
+
+temp_files = TempFileRegistry()
+atexit.register(temp_files.cleanup)
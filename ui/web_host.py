@@ -0,0 +1,184 @@
+import json
+import os
+
+# read when the web engine starts, i.e. with the first view created below: every tab
+# and preview loads file:// content, so they all share one renderer process
+_flags = os.environ.get("QTWEBENGINE_CHROMIUM_FLAGS", "").split()
+if "--process-per-site" not in _flags:
+    os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = " ".join(_flags + ["--process-per-site"])
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWebEngineWidgets import (
+    QWebEngineProfile, QWebEnginePage, QWebEngineView, QWebEngineSettings, QWebEngineScript
+)
+
+
+DISCARD_AFTER_MS = 30000        # a view hidden this long gives its page memory back
+
+# fadPatch(html): parse the new result page and walk it against the live document,
+# touching only the text and attributes that differ (a node of another kind is
+# replaced). Returns false when the <head> changed, so the caller reloads instead.
+PATCH_SCRIPT = """
+(function () {
+    function syncAttributes(node, want) {
+        Array.from(node.attributes).forEach(function (attr) {
+            if (!want.hasAttribute(attr.name)) node.removeAttribute(attr.name);
+        });
+        Array.from(want.attributes).forEach(function (attr) {
+            if (node.getAttribute(attr.name) !== attr.value) node.setAttribute(attr.name, attr.value);
+        });
+    }
+
+    function patchChildren(parent, wantParent) {
+        var nodes = parent.childNodes, wanted = wantParent.childNodes;
+        for (var i = 0; i < wanted.length; i++) {
+            var node = nodes[i], want = wanted[i];
+            if (!node) {
+                parent.appendChild(document.importNode(want, true));
+            } else if (node.nodeType !== want.nodeType || node.nodeName !== want.nodeName) {
+                parent.replaceChild(document.importNode(want, true), node);
+            } else if (node.nodeType === Node.ELEMENT_NODE) {
+                syncAttributes(node, want);
+                patchChildren(node, want);
+            } else if (node.nodeValue !== want.nodeValue) {
+                node.nodeValue = want.nodeValue;
+            }
+        }
+        while (nodes.length > wanted.length) parent.removeChild(parent.lastChild);
+    }
+
+    window.fadPatch = function (html) {
+        var next = new DOMParser().parseFromString(html, "text/html");
+        if (next.head.innerHTML !== document.head.innerHTML) return false;
+        syncAttributes(document.body, next.body);
+        patchChildren(document.body, next.body);
+        return true;
+    };
+})();
+"""
+
+_profile = None
+
+
+def shared_profile():
+    """
+    The one QWebEngineProfile behind every result view and report preview.
+
+    Off the record (nothing written to disk) with an in-memory HTTP cache, so
+    style.css and the result images are read once for all tabs.
+    """
+    global _profile
+    if _profile is None:
+        _profile = QWebEngineProfile(QApplication.instance())     # outlives every page
+        _profile.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
+        settings = _profile.settings()
+        settings.setAttribute(QWebEngineSettings.PluginsEnabled, True)
+        settings.setAttribute(QWebEngineSettings.PdfViewerEnabled, True)
+    return _profile
+
+
+class HostedWebView(QWebEngineView):
+    """
+    QWebEngineView on the shared profile that only holds renderer memory while shown.
+
+    A hidden view's page is frozen at once (no script, timers or painting) and discarded
+    after DISCARD_AFTER_MS; showing it again makes it active, and a discarded page reloads
+    its last content. With the shared profile and one renderer process, memory follows
+    the views on screen, not the number of tabs built. Needs Qt >= 5.14 for the page
+    lifecycle; older Qt only gets the shared profile.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setPage(QWebEnginePage(shared_profile(), self))
+        self.discard_timer = QTimer(self)
+        self.discard_timer.setSingleShot(True)
+        self.discard_timer.setInterval(DISCARD_AFTER_MS)
+        self.discard_timer.timeout.connect(lambda: self.set_lifecycle("Discarded"))
+
+    def set_lifecycle(self, state):
+        page = self.page()
+        if not hasattr(page, "setLifecycleState"):
+            return
+        if state != "Active" and self.isVisible():
+            return      # shown again before the discard timer fired
+        page.setLifecycleState(getattr(QWebEnginePage.LifecycleState, state))
+
+    def showEvent(self, event):
+        self.discard_timer.stop()
+        self.set_lifecycle("Active")
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.set_lifecycle("Frozen")
+        self.discard_timer.start()
+
+
+class ResultView(HostedWebView):
+    """
+    Result panel that loads a result page once and then patches it in place.
+
+    show_html(html, base_url) keeps only the latest page. The first page (or one with a
+    new base URL or <head>) is loaded with setHtml; after that the rendered HTML goes to
+    fadPatch as one JSON string and only the changed values are written into the DOM, so
+    style.css and fonts are not reloaded and the panel does not flicker. A hidden view
+    catches up when shown, and a discarded page is patched again after its reload.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        script = QWebEngineScript()
+        script.setName("fad_patch")
+        script.setSourceCode(PATCH_SCRIPT)
+        script.setInjectionPoint(QWebEngineScript.DocumentCreation)
+        script.setWorldId(QWebEngineScript.MainWorld)
+        script.setRunsOnSubFrames(False)
+        self.page().scripts().insert(script)
+
+        self.html = None            # latest page asked for
+        self.base_url = None
+        self.loaded = None          # (html, base_url) given to the last setHtml
+        self.shown_html = None      # page the DOM holds now
+        self.ready = False
+        self.loadStarted.connect(self.on_load_started)
+        self.loadFinished.connect(self.on_load_finished)
+
+    def show_html(self, html, base_url):
+        self.html = html
+        self.base_url = base_url
+        self.sync()
+
+    def sync(self):
+        if self.html is None or not self.isVisible():
+            return
+        if self.loaded is None or self.loaded[1] != self.base_url:
+            self.load_html()
+        elif self.ready and self.shown_html != self.html:
+            self.shown_html = self.html
+            self.page().runJavaScript(f"fadPatch({json.dumps(self.html)})", self.on_patched)
+        # still loading: on_load_finished syncs
+
+    def load_html(self):
+        self.ready = False
+        self.loaded = (self.html, self.base_url)
+        self.shown_html = self.html
+        self.setHtml(self.html, self.base_url)
+
+    def on_load_started(self):
+        self.ready = False
+
+    def on_load_finished(self, ok):
+        self.ready = ok
+        if ok:
+            self.shown_html = self.loaded[0] if self.loaded else None     # also after a discard reload
+            self.sync()
+
+    def on_patched(self, patched):
+        if not patched:
+            self.load_html()        # new stylesheet or title, or the script was missing
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.sync()
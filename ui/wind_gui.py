@@ -1,6 +1,5 @@
 import sys
 import os
-import tempfile
 from datetime import date
 
 from PyQt5.QtWidgets import (
@@ -9,18 +8,18 @@ from PyQt5.QtWidgets import (
     QFormLayout, QRadioButton, QMessageBox, QSizePolicy, QDialog
 )
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtCore import QUrl, QSize
 
-from weasyprint import HTML, CSS
-from jinja2 import Environment, FileSystemLoader
-
 import math
 # from config.project_info import ProjectInfo
 from calcs.wind_load import WindLoadCalculator
 from calcs.package.wind_parameters import location_wind_speeds, importance_factor, directionality_factor, gust_factor
 from ui.dialogs.wind_dialog import FloorHeightsDialog, TopographyDialog, WindMapDialog, ExposureExplainDialog, OccupancyExplainDialog, TopographyExplainDialog
-from ui.dialogs.report_preview import ReportPreviewWindow
+from ui.dialogs.report_preview import show_preview
+from ui.web_host import ResultView
+from ui.jobs import JobRunner
+from ui.rendering import render_result, render_report
+from ui.pdf_worker import start_report
 
 
 def resource_path(relative_path):
@@ -29,6 +28,32 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+# calculation and rendering, run on a worker thread (no widget access)
+def render_results(summary):
+    return render_result("wind.html", summary=summary)
+
+
+def calculate_wind(params):
+    wind_pressure = WindLoadCalculator(**params)
+    summary = wind_pressure.summary()
+    return wind_pressure, summary, render_results(summary)
+
+
+def report_html(summary):
+    project_info = {
+        # "project_name": "Taj & Vivanta Hotel",
+        # "ref_no": "REF# RFA-001/REV-02/AEL/CW/2025",
+        "rev_no": "02",
+        "date_time": date.today().strftime("%d/%m/%Y")
+    }
+
+    return render_report(
+        "wind.html",
+        project_info=project_info,
+        summary=summary
+    )
+
+
 class WindLoadTab(QWidget):
     def __init__(self):
         super().__init__()
@@ -36,6 +61,7 @@ class WindLoadTab(QWidget):
         self.wall_cladding_pressure = None
         self.roof_cladding_pressure = None
         self.summary = None
+        self.jobs = JobRunner(self)
         self.initUI()
 
     def initUI(self):
@@ -182,7 +208,7 @@ class WindLoadTab(QWidget):
         self.rigid_radio.toggled.connect(self.update_gust_mode)
 
         # === Right Panel ===
-        self.result_webview = QWebEngineView()
+        self.result_webview = ResultView()
         self.report_btn = QPushButton("View Report")
         self.report_btn.setFixedSize(110, 30)
         self.report_btn.setStyleSheet("""
@@ -467,9 +493,9 @@ class WindLoadTab(QWidget):
             "topo_distance": self.topo_distance,
             "topo_crest_side": self.topo_crest_side,
             "topography_note": self.topography_note,
-            "floor_heights": self.floor_height_inputs,
+            "floor_heights": list(self.floor_height_inputs),
             "eff_area": [5, 10, 20, 30, 40, 46.5],
-            "selected_levels": self.selected_levels_inputs,
+            "selected_levels": list(self.selected_levels_inputs),
         }
     
     def trigger_calculate(self):
@@ -478,24 +504,28 @@ class WindLoadTab(QWidget):
     def calculate(self):
         try:
             params = self.get_calculation_params()
-            wind_pressure = WindLoadCalculator(**params)
-            self.summary = wind_pressure.summary()
-            self.update_results()
-            
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Calculation failed: {str(e)}")
+            return
+        self.jobs.submit(
+            "calculate", calculate_wind, params,
+            on_result=self.show_results,
+            on_error=lambda message: QMessageBox.critical(self, "Error", f"Calculation failed: {message}")
+        )
+
+    def show_results(self, result):
+        wind_pressure, self.summary, combined_html = result
+        self.wind_pressure = wind_pressure     # keeps its C&C pressure index for glass lookups
+        self.set_result_html(combined_html)
+
+    def set_result_html(self, combined_html):
+        result_temp_path = resource_path("ui/renders")
+        base_url = QUrl.fromLocalFile(os.path.abspath(result_temp_path) + "/")
+        self.result_webview.show_html(combined_html, base_url)
 
     def update_results(self):
         try:
-            result_temp_path = resource_path("ui/renders")
-            env = Environment(loader=FileSystemLoader(result_temp_path))
-            template = env.get_template("wind.html")
-            combined_html = template.render(
-                summary=self.summary
-            )
-            base_url = QUrl.fromLocalFile(os.path.abspath(result_temp_path) + "/")
-            self.result_webview.setHtml(combined_html, base_url)
-            # print("Rendering with summary:", self.summary)
+            self.set_result_html(render_results(self.summary))
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to render results: {str(e)}")
@@ -506,34 +536,12 @@ class WindLoadTab(QWidget):
             return
 
         try:
-            project_info = {
-                # "project_name": "Taj & Vivanta Hotel",
-                # "ref_no": "REF# RFA-001/REV-02/AEL/CW/2025",
-                "rev_no": "02",
-                "date_time": date.today().strftime("%d/%m/%Y")
-            }
-
-            report_temp_path = resource_path("reports/templates")
-            env = Environment(loader=FileSystemLoader(report_temp_path))
-            template = env.get_template("wind.html")
-
-            html_content = template.render(
-                project_info=project_info,
-                summary=self.summary
-            )
-            
-            # Generate Temporary PDF File
-            temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            pdf_path = temp_pdf.name
-            temp_pdf.close()
-            
-            HTML(string=html_content, base_url=report_temp_path).write_pdf(
-                pdf_path,
-                stylesheets=[CSS(filename=os.path.join(report_temp_path, "css/report.css"))]
-            )
-
-            self.preview_window = ReportPreviewWindow(pdf_path)
-            self.preview_window.show()
-
+            html_content = report_html(self.summary)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to preview report: {str(e)}")
+            return
+
+        start_report(self, html_content, self.show_report)
+
+    def show_report(self, pdf_path):
+        self.preview_window = show_preview(pdf_path)